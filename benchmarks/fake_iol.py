@@ -0,0 +1,227 @@
+"""Stand-in local de la API de IOL como transport de httpx, para load tests offline.
+
+    fake = FakeIOL(FakeIOLConfig(latency=0.05, error_rate=0.01, max_rps=50))
+    client = httpx.AsyncClient(transport=fake.async_transport())
+
+Implementa `/token` (password y refresh_token), `/datos-perfil`,
+`/portafolio/{country}`, `.../Titulos/{symbol}/CotizacionDetalle` y
+`/Cotizaciones/.../Todos`. Los tokens vencen a los `token_ttl` segundos (401).
+"""
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import json
+import random
+import re
+import secrets
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from benchmarks import payloads
+
+
+_ROUTES = (
+    ("token", "POST", re.compile(r"^/token$")),
+    ("me", "GET", re.compile(r"^/api/v2/datos-perfil$")),
+    ("portfolio", "GET", re.compile(r"^/api/v2/portafolio/(?P<country>[^/]+)$")),
+    ("cotization", "GET", re.compile(r"^/api/v2/(?P<market>[^/]+)/Titulos/(?P<symbol>[^/]+)/CotizacionDetalle$")),
+    ("all_cotizations", "GET", re.compile(r"^/api/v2/Cotizaciones/[^/]+/(?P<country>[^/]+)/Todos$")),
+)
+
+
+@dataclass
+class FakeIOLConfig:
+    latency: float = 0.02
+    jitter: float = 0.01
+    # Fracción de requests que fallan con 500 / 429 al azar.
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    # Requests por segundo por token antes de devolver 429 con Retry-After.
+    max_rps: Optional[float] = None
+    retry_after: int = 1
+    token_ttl: float = 900.0
+    options: int = 1500
+    portfolio_assets: int = 20
+    seed: int = 0
+
+
+@dataclass
+class FakeIOLStats:
+    requests: Counter = field(default_factory=Counter)
+    statuses: Counter = field(default_factory=Counter)
+    tokens_issued: int = 0
+    refreshes: int = 0
+
+
+@dataclass
+class _Session:
+    refresh_token: str
+    expires_at: float
+    # Siguiente instante permitido (GCRA) para el límite `max_rps`.
+    tat: float = 0.0
+
+
+class FakeIOL:
+    def __init__(self, config: Optional[FakeIOLConfig] = None) -> None:
+        self.config = config or FakeIOLConfig()
+        self.stats = FakeIOLStats()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, _Session] = {}
+        self._refresh_tokens: Dict[str, str] = {}
+        # Los payloads grandes se serializan una sola vez.
+        self._all_cotizations = json.dumps(
+            {"titulos": payloads.synthetic_titulos(self.config.options, seed=self.config.seed)}
+        ).encode()
+        self._portfolio = json.dumps(
+            payloads.synthetic_portfolio(self.config.portfolio_assets, seed=self.config.seed)
+        ).encode()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Responde `request` sin simular latencia."""
+        route, params = self._route(request)
+        with self._lock:
+            self.stats.requests[route] += 1
+            response = self._dispatch(route, params, request)
+            self.stats.statuses[response.status_code] += 1
+        return response
+
+    def delay(self) -> float:
+        with self._lock:
+            return max(self.config.latency + self._rng.uniform(-1, 1) * self.config.jitter, 0.0)
+
+    def transport(self) -> httpx.MockTransport:
+        def handler(request: httpx.Request) -> httpx.Response:
+            time.sleep(self.delay())
+            return self.handle(request)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(self.delay())
+            return self.handle(request)
+
+        return httpx.MockTransport(handler)
+
+    def _route(self, request: httpx.Request) -> Tuple[str, Dict[str, str]]:
+        for name, method, pattern in _ROUTES:
+            match = pattern.match(request.url.path)
+            if match and request.method == method:
+                return name, match.groupdict()
+        return "unknown", {}
+
+    def _dispatch(self, route: str, params: Dict[str, str], request: httpx.Request) -> httpx.Response:
+        if route == "unknown":
+            return _json(404, {"message": "No encontrado"})
+        if route == "token":
+            return self._token(request)
+
+        session = self._authorize(request)
+        if session is None:
+            return _json(401, {"message": "Authorization has been denied for this request."})
+
+        throttled = self._throttle(session)
+        if throttled is not None:
+            return throttled
+        if self._rng.random() < self.config.error_rate:
+            return _json(500, {"message": "Error interno"})
+
+        handlers: Dict[str, Callable[[], httpx.Response]] = {
+            "me": lambda: _json(200, _ACCOUNT),
+            "portfolio": lambda: _raw(200, self._portfolio),
+            "cotization": lambda: _json(200, self._cotization(params["symbol"])),
+            "all_cotizations": lambda: _raw(200, self._all_cotizations),
+        }
+        return handlers[route]()
+
+    def _token(self, request: httpx.Request) -> httpx.Response:
+        try:
+            body = json.loads(request.content or b"{}")
+        except ValueError:
+            body = {}
+        grant = body.get("grant_type")
+
+        if grant == "password":
+            if not body.get("username") or not body.get("password"):
+                return _json(400, {"error": "invalid_grant"})
+        elif grant == "refresh_token":
+            previous = self._refresh_tokens.pop(body.get("refresh_token") or "", None)
+            if previous is None:
+                return _json(400, {"error": "invalid_grant"})
+            self._sessions.pop(previous, None)
+            self.stats.refreshes += 1
+        else:
+            return _json(400, {"error": "unsupported_grant_type"})
+
+        access_token = secrets.token_urlsafe(24)
+        refresh_token = secrets.token_urlsafe(24)
+        self._sessions[access_token] = _Session(
+            refresh_token=refresh_token,
+            expires_at=time.monotonic() + self.config.token_ttl,
+        )
+        self._refresh_tokens[refresh_token] = access_token
+        self.stats.tokens_issued += 1
+        return _json(
+            200,
+            {
+                "access_token": access_token,
+                "token_type": "bearer",
+                "expires_in": int(self.config.token_ttl),
+                "refresh_token": refresh_token,
+            },
+        )
+
+    def _authorize(self, request: httpx.Request) -> Optional[_Session]:
+        header = request.headers.get("Authorization", "")
+        if not header.startswith("Bearer "):
+            return None
+        session = self._sessions.get(header[len("Bearer "):])
+        if session is None or session.expires_at <= time.monotonic():
+            return None
+        return session
+
+    def _throttle(self, session: _Session) -> Optional[httpx.Response]:
+        throttled = self._rng.random() < self.config.throttle_rate
+        if not throttled and self.config.max_rps:
+            now = time.monotonic()
+            tat = max(session.tat, now)
+            if tat - now > 1.0:
+                throttled = True
+            else:
+                session.tat = tat + 1.0 / self.config.max_rps
+        if not throttled:
+            return None
+        response = _json(429, {"message": "Too Many Requests"})
+        response.headers["Retry-After"] = str(self.config.retry_after)
+        return response
+
+    def _cotization(self, symbol: str) -> Dict[str, Any]:
+        payload = payloads.cotization_payload(self._rng, zlib.crc32(symbol.encode()) % 1000)
+        payload["simbolo"] = symbol
+        return payload
+
+
+_ACCOUNT = {
+    "nombre": "Load",
+    "apellido": "Test",
+    "numeroCuenta": "000000",
+    "dni": "0",
+    "cuitCuil": "0",
+    "sexo": "X",
+    "perfilInversor": "Moderado",
+    "email": "load@test.local",
+    "cuentaAbierta": True,
+}
+
+
+def _json(status_code: int, content: Dict[str, Any]) -> httpx.Response:
+    return httpx.Response(status_code, json=content)
+
+
+def _raw(status_code: int, body: bytes) -> httpx.Response:
+    return httpx.Response(status_code, content=body, headers={"Content-Type": "application/json"})
@@ -0,0 +1,190 @@
+from dataclasses import dataclass, field
+import gc
+import json
+from pathlib import Path
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Union
+
+
+@dataclass
+class Benchmark:
+    """Un caso: `func()` procesa `items` elementos por llamada (p. ej. 1000 payloads)."""
+
+    name: str
+    func: Callable[[], Any]
+    items: int = 1
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    items: int
+    samples: List[float] = field(repr=False)
+    # Bytes por llamada: pico transitorio y lo que queda retenido al terminar.
+    peak_bytes: int = 0
+    retained_bytes: int = 0
+
+    def percentile(self, q: float) -> float:
+        ordered = sorted(self.samples)
+        index = min(int(round(q / 100 * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[index]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def ops_per_sec(self) -> float:
+        """Elementos por segundo, sobre la mediana de las muestras."""
+        return self.items / self.median if self.median > 0 else float("inf")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "items": self.items,
+            "ops_per_sec": self.ops_per_sec,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "peak_bytes": self.peak_bytes,
+            "retained_bytes": self.retained_bytes,
+        }
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+    tolerance: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    @property
+    def regressed(self) -> bool:
+        return self.change < -self.tolerance
+
+
+def _calibrate(func: Callable[[], Any], min_sample_time: float) -> int:
+    """Llamadas por muestra para que cada muestra dure al menos `min_sample_time`."""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_sample_time or loops >= 1_000_000:
+            return loops
+        loops *= 10 if elapsed < min_sample_time / 10 else 2
+
+
+def _measure_allocations(func: Callable[[], Any]) -> Dict[str, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"peak_bytes": peak - before, "retained_bytes": current - before}
+
+
+def run(benchmark: Benchmark, samples: int = 20, min_sample_time: float = 0.01) -> BenchmarkResult:
+    """Corre `benchmark`: warmup, `samples` muestras cronometradas y una pasada con tracemalloc.
+
+    Las muestras se toman sin tracemalloc (lo hace mucho más lento) y con el GC
+    desactivado para que una colección no caiga en una muestra sola.
+    """
+    func = benchmark.func
+    func()
+    loops = _calibrate(func, min_sample_time)
+
+    timings: List[float] = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            started = time.perf_counter()
+            for _ in range(loops):
+                func()
+            timings.append((time.perf_counter() - started) / loops)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return BenchmarkResult(
+        name=benchmark.name,
+        items=benchmark.items,
+        samples=timings,
+        **_measure_allocations(func),
+    )
+
+
+def load_baseline(path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("results", {})
+
+
+def save_baseline(path: Union[str, Path], results: List[BenchmarkResult], meta: Dict[str, Any]) -> None:
+    data = {"meta": meta, "results": {result.name: result.as_dict() for result in results}}
+    Path(path).write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float = 0.15,
+) -> Dict[str, Comparison]:
+    """Compara ops/sec contra el baseline; más de `tolerance` de caída es regresión."""
+    comparisons: Dict[str, Comparison] = {}
+    for result in results:
+        previous: Optional[Dict[str, Any]] = baseline.get(result.name)
+        if not previous or previous.get("items") != result.items:
+            continue
+        comparisons[result.name] = Comparison(
+            name=result.name,
+            baseline=previous["ops_per_sec"],
+            current=result.ops_per_sec,
+            tolerance=tolerance,
+        )
+    return comparisons
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def _format_bytes(size: int) -> str:
+    for unit, scale in (("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if abs(size) >= scale:
+            return f"{size / scale:.1f}{unit}"
+    return f"{size}B"
+
+
+def report(results: List[BenchmarkResult], comparisons: Dict[str, Comparison]) -> str:
+    header = f"{'benchmark':<34} {'items':>6} {'ops/s':>12} {'p50':>9} {'p95':>9} {'p99':>9} {'peak':>9} {'retained':>9}  vs baseline"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        comparison = comparisons.get(result.name)
+        delta = ""
+        if comparison is not None:
+            delta = f"{comparison.change:+.1%}" + ("  REGRESSION" if comparison.regressed else "")
+        lines.append(
+            f"{result.name:<34} {result.items:>6} {result.ops_per_sec:>12,.0f} "
+            f"{_format_time(result.percentile(50)):>9} {_format_time(result.percentile(95)):>9} "
+            f"{_format_time(result.percentile(99)):>9} {_format_bytes(result.peak_bytes):>9} "
+            f"{_format_bytes(result.retained_bytes):>9}  {delta}"
+        )
+    return "\n".join(lines)
+
@@ -0,0 +1,80 @@
+"""Costo de importar los módulos de entrada (arranque en frío de CLIs y workers).
+
+    python -m benchmarks.imports                         # mediana de 7 procesos por módulo
+    python -m benchmarks.imports --budget 150 src.iol.container
+
+Cada medición es un intérprete nuevo con `-X importtime`; se reporta el tiempo
+acumulado del módulo y los imports más caros que arrastra. Sale con código 1
+si algún módulo supera `--budget` ms.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MODULES = ("src.iol.container", "src.iol.client", "src.iol.entities")
+DEFAULT_BUDGET_MS = 150.0
+
+
+def measure(module: str) -> Tuple[float, Dict[str, float]]:
+    """(ms acumulados de `module`, {import de primer nivel: ms acumulados})."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # -X importtime lista cada módulo después de sus hijos, con dos espacios por nivel.
+    pending: Dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            micros = float(cumulative)
+        except ValueError:
+            continue  # cabecera
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        if depth == 1:
+            pending[name] = micros / 1000
+        elif depth == 0:
+            if name == module:
+                return micros / 1000, pending
+            pending = {}
+    return 0.0, {}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=5, help="imports más caros a mostrar por módulo")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS, help="ms máximos por módulo")
+    args = parser.parse_args(argv)
+
+    over = []
+    for module in args.modules:
+        samples = [measure(module) for _ in range(args.runs)]
+        total = statistics.median(sample[0] for sample in samples)
+        flag = "  OVER BUDGET" if total > args.budget else ""
+        print(f"{module:<28} {total:8.1f}ms{flag}")
+        _, children = samples[len(samples) // 2]
+        for name, cost in sorted(children.items(), key=lambda item: -item[1])[: args.top]:
+            print(f"    {name:<36} {cost:8.1f}ms")
+        if flag:
+            over.append(module)
+
+    if over:
+        print(f"\n{len(over)} module(s) over {args.budget:.0f}ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
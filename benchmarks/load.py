@@ -0,0 +1,295 @@
+"""Load test end-to-end de IOLClient contra el stand-in local (`benchmarks/fake_iol.py`).
+
+Usa el `Container` de `src/iol/container.py` (auth, retry, rate limiter,
+write-behind SQLite) sobre el transport falso y lo empuja a concurrencia
+creciente, reportando throughput, latencia de cola y crecimiento de la DB:
+
+    python -m benchmarks.load --levels 1,8,32,128 --duration 5
+    python -m benchmarks.load --no-rate-limit --latency 0.005 --max-rps 200
+    python -m benchmarks.load --token-ttl 3 --mix cotization=1   # tokens que vencen
+"""
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.seedwork.metrics import METRICS
+from src.seedwork.rate_limit import RateLimiter
+from src.seedwork.repositories import WriteBehindSQLiteExtractionRepo
+
+from src.iol.auth.accounts import ACCOUNTS, PASSWORDS
+from src.iol.client import IOLClient
+from src.iol.container import Container, ContainerSettings
+
+from benchmarks.fake_iol import FakeIOL, FakeIOLConfig
+
+
+LOAD_IDENTIFIER = "LOAD"
+DEFAULT_MIX = {"cotization": 80, "portfolio": 10, "me": 5, "options": 5}
+SYMBOLS = [f"SYM{index}" for index in range(200)]
+
+
+@dataclass
+class Stack:
+    container: Container
+    client: IOLClient
+    db_path: Path
+
+    @property
+    def extraction_repo(self) -> WriteBehindSQLiteExtractionRepo:
+        return self.container.extraction_repo  # type: ignore[return-value]
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self.container.rate_limiter
+
+    def db_size(self) -> int:
+        return sum(
+            path.stat().st_size
+            for path in (self.db_path, self.db_path.with_name(self.db_path.name + "-wal"))
+            if path.exists()
+        )
+
+    async def close(self) -> None:
+        await self.container.aclose()
+
+
+def build_stack(fake: FakeIOL, db_path: Path, kind: str = "async", rate_limits: bool = True) -> Stack:
+    """El stack del container, con `fake` como transport y una DB propia."""
+    ACCOUNTS[LOAD_IDENTIFIER] = "load"
+    PASSWORDS[LOAD_IDENTIFIER] = "load"
+    container = Container(
+        ContainerSettings(db_path=db_path, rate_limits=rate_limits, identifier=LOAD_IDENTIFIER),
+        transport=fake.transport(),
+        async_transport=fake.async_transport(),
+    )
+    client = container.async_iol_client if kind == "async" else container.iol_client
+    return Stack(container=container, client=client, db_path=db_path)
+
+
+# Cada operación devuelve True si el resultado es útil (IOLClient no propaga
+# los errores HTTP: devuelve entidades vacías).
+Operation = Callable[[IOLClient, random.Random], Awaitable[bool]]
+
+
+async def _cotization(client: IOLClient, rng: random.Random) -> bool:
+    return bool((await client.fetch_cotization(rng.choice(SYMBOLS))).symbol)
+
+
+async def _portfolio(client: IOLClient, rng: random.Random) -> bool:
+    return bool((await client.fetch_portfolio()).raw)
+
+
+async def _me(client: IOLClient, rng: random.Random) -> bool:
+    return bool((await client.fetch_me()).first_name)
+
+
+async def _options(client: IOLClient, rng: random.Random) -> bool:
+    return bool(await client.fetch_all_options())
+
+
+OPERATIONS: Dict[str, Operation] = {
+    "cotization": _cotization,
+    "portfolio": _portfolio,
+    "me": _me,
+    "options": _options,
+}
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(round(q / 100 * (len(ordered) - 1))), len(ordered) - 1)]
+
+
+@dataclass
+class LevelResult:
+    concurrency: int
+    elapsed: float
+    ok: int = 0
+    failed: int = 0
+    latencies: List[float] = field(default_factory=list, repr=False)
+    by_operation: Counter = field(default_factory=Counter)
+    statuses: Counter = field(default_factory=Counter)
+    db_growth: int = 0
+    flush_time: float = 0.0
+    rate_limit_wait: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.ok / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "elapsed": self.elapsed,
+            "ok": self.ok,
+            "failed": self.failed,
+            "throughput": self.throughput,
+            "p50": _percentile(self.latencies, 50),
+            "p95": _percentile(self.latencies, 95),
+            "p99": _percentile(self.latencies, 99),
+            "max": max(self.latencies, default=0.0),
+            "by_operation": dict(self.by_operation),
+            "statuses": dict(self.statuses),
+            "db_growth": self.db_growth,
+            "flush_time": self.flush_time,
+            "rate_limit_wait": self.rate_limit_wait,
+        }
+
+
+async def run_level(
+    stack: Stack,
+    fake: FakeIOL,
+    concurrency: int,
+    duration: float,
+    mix: Dict[str, float],
+    seed: int = 0,
+) -> LevelResult:
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    statuses_before = Counter(fake.stats.statuses)
+    wait_before = _total_wait(stack.rate_limiter)
+    size_before = stack.db_size()
+    result = LevelResult(concurrency=concurrency, elapsed=0.0)
+    deadline = time.monotonic() + duration
+
+    async def worker(number: int) -> None:
+        rng = random.Random(seed * 1000 + number)
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights)[0]
+            started = time.perf_counter()
+            try:
+                ok = await OPERATIONS[name](stack.client, rng)
+            except Exception:
+                ok = False
+            result.latencies.append(time.perf_counter() - started)
+            result.by_operation[name] += 1
+            if ok:
+                result.ok += 1
+            else:
+                result.failed += 1
+
+    started = time.monotonic()
+    await asyncio.gather(*(worker(number) for number in range(concurrency)))
+    result.elapsed = time.monotonic() - started
+
+    # El crecimiento de la DB incluye lo que el writer tenía encolado.
+    flush_started = time.monotonic()
+    await asyncio.to_thread(stack.extraction_repo.flush)
+    result.flush_time = time.monotonic() - flush_started
+    result.db_growth = stack.db_size() - size_before
+    result.statuses = Counter(fake.stats.statuses) - statuses_before
+    result.rate_limit_wait = _total_wait(stack.rate_limiter) - wait_before
+    return result
+
+
+def _total_wait(rate_limiter: Optional[RateLimiter]) -> float:
+    if rate_limiter is None:
+        return 0.0
+    return sum(stats.total_wait for stats in rate_limiter.stats().values())
+
+
+def _parse_mix(value: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}; options: {', '.join(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+_HEADER = (
+    f"{'conc':>5} {'ok':>7} {'fail':>6} {'ok/s':>9} {'p50':>8} {'p95':>8} {'p99':>8} "
+    f"{'max':>8} {'db +KiB':>9} {'flush':>7} {'rl wait':>8}  statuses"
+)
+
+
+def _row(result: LevelResult) -> str:
+    summary = result.summary()
+    statuses = " ".join(f"{code}:{count}" for code, count in sorted(result.statuses.items()))
+    return (
+        f"{result.concurrency:>5} {result.ok:>7} {result.failed:>6} {result.throughput:>9.1f} "
+        f"{summary['p50'] * 1000:>6.1f}ms {summary['p95'] * 1000:>6.1f}ms {summary['p99'] * 1000:>6.1f}ms "
+        f"{summary['max'] * 1000:>6.1f}ms {result.db_growth / 1024:>9.1f} {result.flush_time:>6.2f}s "
+        f"{result.rate_limit_wait:>7.1f}s  {statuses}"
+    )
+
+
+async def run(args: argparse.Namespace) -> List[LevelResult]:
+    fake = FakeIOL(
+        FakeIOLConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            max_rps=args.max_rps,
+            token_ttl=args.token_ttl,
+            options=args.options,
+        )
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = Path(args.db) if args.db else Path(workdir) / "load.sqlite"
+        stack = build_stack(fake, db_path, kind=args.stack, rate_limits=not args.no_rate_limit)
+        results = []
+        print(_HEADER + "\n" + "-" * len(_HEADER), flush=True)
+        try:
+            for concurrency in args.levels:
+                result = await run_level(stack, fake, concurrency, args.duration, args.mix)
+                results.append(result)
+                print(_row(result), flush=True)
+        finally:
+            await stack.close()
+    print(f"\nserver: {dict(fake.stats.requests)} tokens={fake.stats.tokens_issued} refreshes={fake.stats.refreshes}")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=lambda value: [int(level) for level in value.split(",")], default=[1, 4, 16, 64])
+    parser.add_argument("--duration", type=float, default=5.0, help="segundos por nivel de concurrencia")
+    parser.add_argument("--stack", choices=("async", "sync"), default="async")
+    parser.add_argument("--mix", type=_parse_mix, default=DEFAULT_MIX, help="p. ej. cotization=80,options=5")
+    parser.add_argument("--no-rate-limit", action="store_true", help="sin el RateLimiter del container")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=None, help="429 por token por encima de esto")
+    parser.add_argument("--token-ttl", type=float, default=900.0)
+    parser.add_argument("--options", type=int, default=1500, help="tamaño de la cadena de opciones")
+    parser.add_argument("--db", help="archivo SQLite a usar (por defecto uno temporal)")
+    parser.add_argument("--json", help="guarda los resultados por nivel en este archivo")
+    parser.add_argument("--metrics", help="activa METRICS y exporta por etapa (.json o texto de Prometheus)")
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        METRICS.enable()
+
+    results = asyncio.run(run(args))
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps({"config": vars(args), "levels": [result.summary() for result in results]}, indent=2),
+            encoding="utf-8",
+        )
+    if args.metrics:
+        path = Path(args.metrics)
+        path.write_text(
+            METRICS.to_json(indent=2) if path.suffix == ".json" else METRICS.to_prometheus(),
+            encoding="utf-8",
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
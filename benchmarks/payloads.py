@@ -0,0 +1,140 @@
+"""Payloads sintéticos (forma de la API de IOL) y carga de payloads grabados."""
+import json
+import random
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.seedwork.enums import ExtractionStatus
+from src.seedwork.repositories import SQLiteExtractionRepo
+from src.seedwork.sqlite_db import connect
+
+
+UNDERLYINGS = ("GFG", "YPF", "PAM", "ALU", "COM", "TXA")
+_BASE_DATE = datetime(2024, 1, 5, 11, 0, 0)
+
+
+def book_entry_payload(rng: random.Random, price: float) -> Dict[str, Any]:
+    return {
+        "cantidadCompra": rng.randint(1, 500),
+        "precioCompra": round(price * 0.98, 3),
+        "precioVenta": round(price * 1.02, 3),
+        "cantidadVenta": rng.randint(1, 500),
+    }
+
+
+def option_payload(rng: random.Random, index: int, depth: int = 5) -> Dict[str, Any]:
+    underlying = UNDERLYINGS[index % len(UNDERLYINGS)]
+    option_type = "Call" if index % 2 else "Put"
+    strike = 500 + 10 * (index % 200)
+    price = round(rng.uniform(0.5, 200), 3)
+    return {
+        "simbolo": f"{underlying}{option_type[0]}{strike}FE",
+        "descripcion": f"{option_type} {underlying} {strike}.00 Vencimiento: 16/02/2024",
+        "ultimoPrecio": price if index % 7 else None,
+        "variacionPorcentual": round(rng.uniform(-20, 20), 2),
+        "apertura": price,
+        "maximo": round(price * 1.05, 3),
+        "minimo": round(price * 0.95, 3),
+        "ultimoCierre": price,
+        "volumen": rng.randint(0, 10000),
+        "cantidadOperaciones": rng.randint(0, 300),
+        "fecha": (_BASE_DATE + timedelta(seconds=index)).isoformat(),
+        "tipoOpcion": option_type,
+        "precioEjercicio": strike,
+        "fechaVencimiento": "2024-02-16T00:00:00",
+        "mercado": "BCBA",
+        "moneda": "AR$",
+        "plazo": "t1",
+        "laminaMinima": 1,
+        "lote": 100,
+        "puntas": [book_entry_payload(rng, price) for _ in range(depth)],
+    }
+
+
+def cotization_payload(rng: random.Random, index: int, depth: int = 5) -> Dict[str, Any]:
+    payload = option_payload(rng, index, depth)
+    payload.update(
+        {
+            "tendencia": "sube",
+            "montoOperado": rng.uniform(1e3, 1e7),
+            "volumenNominal": rng.randint(0, 100000),
+            "precioPromedio": payload["apertura"],
+            "precioAjuste": 0,
+            "interesesAbiertos": 0,
+            "cierreAnterior": payload["ultimoCierre"],
+            "fechaHora": payload["fecha"],
+        }
+    )
+    return payload
+
+
+def asset_payload(rng: random.Random, index: int) -> Dict[str, Any]:
+    price = round(rng.uniform(1, 5000), 2)
+    quantity = rng.randint(1, 1000)
+    return {
+        "cantidad": quantity,
+        "comprometido": 0,
+        "puntosVariacion": round(rng.uniform(-50, 50), 2),
+        "variacionDiaria": round(rng.uniform(-5, 5), 2),
+        "ultimoPrecio": price,
+        "ppc": round(price * 0.9, 2),
+        "gananciaPorcentaje": 11.1,
+        "gananciaDinero": round(price * quantity * 0.1, 2),
+        "valorizado": round(price * quantity, 2),
+        "titulo": {
+            "simbolo": f"TICK{index}",
+            "descripcion": f"Ticker {index}",
+            "pais": "argentina",
+            "mercado": "bcba",
+            "tipo": "ACCIONES",
+            "plazo": "t1",
+            "moneda": "peso_Argentino",
+        },
+        "parking": None,
+    }
+
+
+def synthetic_titulos(size: int, seed: int = 0, depth: int = 5) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [option_payload(rng, index, depth) for index in range(size)]
+
+
+def synthetic_cotizations(size: int, seed: int = 0, depth: int = 5) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [cotization_payload(rng, index, depth) for index in range(size)]
+
+
+def synthetic_portfolio(size: int, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    return {"pais": "argentina", "activos": [asset_payload(rng, index) for index in range(size)]}
+
+
+def synthetic_book_entries(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [book_entry_payload(rng, rng.uniform(0.5, 200)) for _ in range(size)]
+
+
+def load_recorded_titulos(path: Union[str, Path]) -> Optional[List[Dict[str, Any]]]:
+    """`titulos` grabados: un JSON (lista o `{"titulos": [...]}`) o una DB de extractions.
+
+    Con una DB se toma la última extraction exitosa que tenga `titulos`.
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return data if isinstance(data, list) else data.get("titulos")
+
+    connection = connect(path)
+    try:
+        repo = SQLiteExtractionRepo(connection=connection)
+        for record in repo.query(status=ExtractionStatus.SUCCESS, order_by="id", descending=True):
+            content = record.content()
+            if isinstance(content, dict) and content.get("titulos"):
+                return content["titulos"]
+    except sqlite3.Error:
+        return None
+    finally:
+        connection.close()
+    return None
@@ -0,0 +1,117 @@
+"""Graba un día sintético de polls y lo reproduce con `IOLClient` sobre `Replay`.
+
+    python -m benchmarks.replay                          # 6 h de polls cada 30 s
+    python -m benchmarks.replay --db day.sqlite --polls 2880 --interval 10
+    python -m benchmarks.replay --db day.sqlite --speed 600   # 10 min simulados por segundo real
+
+Con `--db` existente no se regraba: se reproduce lo que haya.
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from src.seedwork.entities import Attempt, Extraction, Request
+from src.seedwork.enums import ExtractionStatus
+from src.seedwork.replay import Replay
+from src.seedwork.repositories import SQLiteExtractionRepo, WriteBehindSQLiteExtractionRepo
+from src.seedwork.sqlite_db import connect
+from src.seedwork.value_objects import APIResponse
+
+from src.iol.client import IOLClient
+from src.iol.resources import GetAllCotizationsRequest, TickerCotizationRequest
+
+from benchmarks import payloads
+
+
+START = datetime(2024, 1, 5, 11, 0, 0)
+SYMBOLS = ("GGAL", "YPFD", "PAMP", "ALUA")
+
+
+def _extraction(request: Request, fetched_at: datetime, content: Dict[str, Any]) -> Extraction:
+    return Extraction(
+        request=request.with_identifier("TEST"),
+        status=ExtractionStatus.SUCCESS,
+        attempts=[Attempt(fetched_at=fetched_at, response=APIResponse(status_code=200, content=content))],
+    )
+
+
+def record_day(db_path: Path, polls: int, interval: float, options: int) -> None:
+    """Un poll = la cadena de opciones + una cotización por símbolo, con precios que se mueven."""
+    repo = WriteBehindSQLiteExtractionRepo(connection=connect(db_path))
+    rng = random.Random(0)
+    chain = payloads.synthetic_titulos(options)
+    for poll in range(polls):
+        at = START + timedelta(seconds=poll * interval)
+        for option in rng.sample(chain, max(len(chain) // 10, 1)):
+            if option.get("ultimoPrecio"):
+                option["ultimoPrecio"] = round(option["ultimoPrecio"] * rng.uniform(0.98, 1.02), 2)
+        # Copia: el repo serializa en otro thread, más tarde.
+        repo.save(_extraction(GetAllCotizationsRequest.new(), at, {"titulos": [dict(option) for option in chain]}))
+        for index, symbol in enumerate(SYMBOLS):
+            quote = payloads.cotization_payload(rng, index)
+            quote["simbolo"] = symbol
+            repo.save(_extraction(TickerCotizationRequest.new(symbol), at + timedelta(seconds=1), quote))
+    repo.close()
+
+
+async def replay_day(db_path: Path, speed: Optional[float], read_ahead: int, chain: str = "lazy") -> List[float]:
+    """Segundos por tick: la cadena (toda parseada, o lazy tomando un subyacente) + cotizaciones."""
+    replay = Replay(SQLiteExtractionRepo(connection=connect(db_path)), speed=speed, read_ahead=read_ahead)
+    client = IOLClient(service=replay.service(), identifier="TEST")
+    chain_url = GetAllCotizationsRequest.new().url
+    latencies = []
+    try:
+        async for _ in replay.ticks(url=chain_url):
+            started = time.perf_counter()
+            if chain == "full":
+                await client.fetch_all_options()
+            else:
+                (await client.fetch_all_options_lazy()).underlying(payloads.UNDERLYINGS[0]).to_list()
+            await client.fetch_cotizations(SYMBOLS)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        replay.close()
+    return latencies
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", help="DB a grabar/reproducir (por defecto una temporal)")
+    parser.add_argument("--polls", type=int, default=720)
+    parser.add_argument("--interval", type=float, default=30.0, help="segundos entre polls grabados")
+    parser.add_argument("--options", type=int, default=500, help="opciones por cadena")
+    parser.add_argument("--speed", type=float, default=None, help="escala de tiempo (sin esto, lo más rápido posible)")
+    parser.add_argument("--read-ahead", type=int, default=16)
+    parser.add_argument("--chain", choices=("lazy", "full"), default="lazy", help="full parsea todas las Options por tick")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = Path(args.db) if args.db else Path(workdir) / "replay.sqlite"
+        if not db_path.exists():
+            started = time.perf_counter()
+            record_day(db_path, args.polls, args.interval, args.options)
+            print(f"recorded {args.polls} polls in {time.perf_counter() - started:.1f}s -> {db_path.stat().st_size / 2**20:.1f} MiB")
+
+        started = time.perf_counter()
+        latencies = asyncio.run(replay_day(db_path, args.speed, args.read_ahead, args.chain))
+        elapsed = time.perf_counter() - started
+
+    if not latencies:
+        print("nothing to replay", file=sys.stderr)
+        return 1
+    latencies.sort()
+    print(
+        f"replayed {len(latencies)} ticks in {elapsed:.2f}s ({len(latencies) / elapsed:.0f} ticks/s); "
+        f"tick p50 {latencies[len(latencies) // 2] * 1e3:.1f}ms p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.1f}ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""Micro-benchmarks de los hot paths (parseo, serialización, persistencia, auth).
+
+Uso, desde la raíz del repo:
+
+    python -m benchmarks.run                       # corre y compara contra el baseline
+    python -m benchmarks.run --save-baseline       # guarda el resultado como nuevo baseline
+    python -m benchmarks.run --size 5000 --recorded db.sqlite -k options
+
+Sale con código 1 si algún caso cae más de `--tolerance` respecto del baseline.
+"""
+import argparse
+from dataclasses import asdict
+from datetime import datetime
+import itertools
+from pathlib import Path
+import platform
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from src.seedwork.access_token_repo import SQLiteAccessTokenRepo
+from src.seedwork.auth_service import StandardAuthService
+from src.seedwork.entities import Attempt, Extraction, Request
+from src.seedwork.enums import ExtractionStatus
+from src.seedwork.repositories import SQLiteExtractionRepo
+from src.seedwork.sqlite_db import connect
+from src.seedwork.value_objects import AccessToken, APIResponse
+
+from src.iol.entities import Option, Portfolio, TickerCotization
+from src.iol.lazy_options import LazyOptionList
+from src.iol.serializers import to_json_safe
+from src.iol.value_objects import BookEntry
+
+from benchmarks import harness, payloads
+
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+TOKEN_LOOKUPS = 1000
+
+
+class _StaticTokenProvider:
+    def auth(self, identifier: str) -> AccessToken:
+        return _token()
+
+    def refresh(self, identifier: str, refresh_token: str) -> AccessToken:
+        return _token()
+
+
+def _token() -> AccessToken:
+    return AccessToken(life_time=900, value="x" * 600, refresh_token="y" * 600, obtained_at=datetime.now())
+
+
+def _extraction(titulos: List[Dict[str, Any]], sequence: int) -> Extraction:
+    request = Request.create("https://api.invertironline.com/api/v2/cotizaciones/opciones/argentina/Todos")
+    request = request.with_identifier("BENCH").with_authorization(_token())
+    # `seq` hace único cada payload: si no, el store deduplica y medimos solo el hash.
+    response = APIResponse(status_code=200, content={"titulos": titulos, "seq": sequence})
+    return Extraction(
+        request=request,
+        status=ExtractionStatus.SUCCESS,
+        attempts=[Attempt(fetched_at=datetime.now(), response=response)],
+    )
+
+
+def build_benchmarks(size: int, workdir: Path, titulos: Optional[List[Dict[str, Any]]] = None) -> List[harness.Benchmark]:
+    titulos = titulos or payloads.synthetic_titulos(size)
+    cotizations = payloads.synthetic_cotizations(len(titulos))
+    portfolio = payloads.synthetic_portfolio(len(titulos))
+    book_entries = payloads.synthetic_book_entries(len(titulos))
+    parsed = [asdict(Option.from_payload(payload)) for payload in titulos]
+    count = len(titulos)
+
+    extraction_repo = SQLiteExtractionRepo(connection=connect(workdir / "extractions.sqlite"))
+    sequence = itertools.count()
+
+    token_repo = SQLiteAccessTokenRepo(connection=connect(workdir / "tokens.sqlite"))
+    token_repo.save("BENCH", _token())
+    auth_service = StandardAuthService(token_provider=_StaticTokenProvider(), token_repo=token_repo)
+
+    def auth_service_get_repo() -> None:
+        # Sin cache en memoria: cada get va al repo (arranque en frío del proceso).
+        for _ in range(TOKEN_LOOKUPS):
+            auth_service._tokens.clear()
+            auth_service.get("BENCH")
+
+    return [
+        harness.Benchmark("Option.from_payload", lambda: [Option.from_payload(p) for p in titulos], count),
+        harness.Benchmark(
+            "TickerCotization.from_payload",
+            lambda: [TickerCotization.from_payload(p) for p in cotizations],
+            count,
+        ),
+        harness.Benchmark(
+            "LazyOptionList.underlying",
+            lambda: LazyOptionList(titulos).underlying(payloads.UNDERLYINGS[0]).to_list(),
+            count,
+        ),
+        harness.Benchmark("Portfolio.from_payload", lambda: Portfolio.from_payload(portfolio), count),
+        harness.Benchmark("BookEntry.from_payload", lambda: [BookEntry.from_payload(p) for p in book_entries], count),
+        harness.Benchmark("to_json_safe", lambda: to_json_safe(parsed), count),
+        harness.Benchmark(
+            "SQLiteExtractionRepo.save",
+            lambda: extraction_repo.save(_extraction(titulos, next(sequence))),
+            1,
+        ),
+        harness.Benchmark(
+            "SQLiteAccessTokenRepo.get",
+            lambda: [token_repo.get("BENCH") for _ in range(TOKEN_LOOKUPS)],
+            TOKEN_LOOKUPS,
+        ),
+        harness.Benchmark(
+            "StandardAuthService.get[memory]",
+            lambda: [auth_service.get("BENCH") for _ in range(TOKEN_LOOKUPS)],
+            TOKEN_LOOKUPS,
+        ),
+        harness.Benchmark("StandardAuthService.get[repo]", auth_service_get_repo, TOKEN_LOOKUPS),
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1000, help="payloads sintéticos por caso")
+    parser.add_argument("--recorded", help="JSON con titulos o DB de extractions para usar payloads grabados")
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("-k", "--filter", default="", help="corre solo los casos cuyo nombre contenga esto")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="caída de ops/s tolerada (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    titulos = None
+    if args.recorded:
+        titulos = payloads.load_recorded_titulos(args.recorded)
+        if not titulos:
+            parser.error(f"no recorded titulos found in {args.recorded}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = []
+        for benchmark in build_benchmarks(args.size, Path(workdir), titulos):
+            if args.filter.lower() not in benchmark.name.lower():
+                continue
+            results.append(harness.run(benchmark, samples=args.samples))
+
+    baseline = harness.load_baseline(args.baseline)
+    comparisons = harness.compare(results, baseline, args.tolerance)
+    print(harness.report(results, comparisons))
+
+    if args.save_baseline:
+        meta = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "size": args.size,
+            "recorded": args.recorded,
+            "saved_at": datetime.now().isoformat(),
+        }
+        harness.save_baseline(args.baseline, results, meta)
+        print(f"\nbaseline saved to {args.baseline}")
+        return 0
+
+    regressions = [comparison for comparison in comparisons.values() if comparison.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.tolerance:.0%} vs baseline", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
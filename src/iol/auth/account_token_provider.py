@@ -2,7 +2,13 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Tuple
 
-from src.seedwork.interfaces import AccessTokenProvider, AccessToken, HttpClient
+from src.seedwork.interfaces import (
+    AccessTokenProvider,
+    AccessToken,
+    AsyncAccessTokenProvider,
+    AsyncHttpClient,
+    HttpClient,
+)
 from src.seedwork.value_objects import APIResponse
 
 from src.iol.constants import ACCESS_TOKEN_DEFAULT_LIFETIME
@@ -10,10 +16,7 @@ from src.iol.auth.accounts import ACCOUNTS, PASSWORDS
 from src.iol.resources import AuthenticateRequest, RefreshTokenRequest
 
 
-@dataclass
-class IOLTokenProvider(AccessTokenProvider[str]):
-    _client: HttpClient
-
+class _IOLTokenProviderBase:
     def _get_credentials(self, identifier: str) -> Tuple[str, str]:
         username = ACCOUNTS.get(identifier, None)
         password = PASSWORDS.get(identifier, None)
@@ -40,13 +43,34 @@ class IOLTokenProvider(AccessTokenProvider[str]):
             obtained_at=datetime.now()
         )
 
+
+@dataclass
+class IOLTokenProvider(_IOLTokenProviderBase, AccessTokenProvider[str]):
+    _client: HttpClient
+
     def auth(self, identifier: str) -> AccessToken:
         username, password = self._get_credentials(identifier)
-        auth_request = AuthenticateRequest.new(username=username, password=password)
+        auth_request = AuthenticateRequest.new(username=username, password=password).with_identifier(identifier)
         response = self._client._request(auth_request)
         return self._build_token_from_response(response)
 
     def refresh(self, identifier: str, refresh_token: str) -> AccessToken:
-        refresh_request = RefreshTokenRequest.new(refresh_token=refresh_token)
+        refresh_request = RefreshTokenRequest.new(refresh_token=refresh_token).with_identifier(identifier)
         response = self._client._request(refresh_request)
-        return self._build_token_from_response(response)
\ No newline at end of file
+        return self._build_token_from_response(response)
+
+
+@dataclass
+class AsyncIOLTokenProvider(_IOLTokenProviderBase, AsyncAccessTokenProvider[str]):
+    _client: AsyncHttpClient
+
+    async def auth(self, identifier: str) -> AccessToken:
+        username, password = self._get_credentials(identifier)
+        auth_request = AuthenticateRequest.new(username=username, password=password).with_identifier(identifier)
+        response = await self._client._request(auth_request)
+        return self._build_token_from_response(response)
+
+    async def refresh(self, identifier: str, refresh_token: str) -> AccessToken:
+        refresh_request = RefreshTokenRequest.new(refresh_token=refresh_token).with_identifier(identifier)
+        response = await self._client._request(refresh_request)
+        return self._build_token_from_response(response)
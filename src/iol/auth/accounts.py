@@ -7,4 +7,18 @@ ACCOUNTS = {
 
 PASSWORDS = {
     "TEST": os.getenv("IOL_PASSWORD")
-}
\ No newline at end of file
+}
+
+# Cuentas extra para el pool: IOL_ACCOUNTS=A,B y IOL_USERNAME_A / IOL_PASSWORD_A, ...
+POOL_IDENTIFIERS = [
+    name.strip()
+    for name in os.getenv("IOL_ACCOUNTS", "").split(",")
+    if name.strip()
+]
+
+for _name in POOL_IDENTIFIERS:
+    ACCOUNTS[_name] = os.getenv(f"IOL_USERNAME_{_name}")
+    PASSWORDS[_name] = os.getenv(f"IOL_PASSWORD_{_name}")
+
+if not POOL_IDENTIFIERS:
+    POOL_IDENTIFIERS = ["TEST"]
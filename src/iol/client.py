@@ -1,40 +1,184 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import List
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List
 
 from src.seedwork.interfaces import ExtractionService
+from src.seedwork.metrics import METRICS, timed
 
-from src.iol.enums import Country, InstrumentType
-from src.iol.entities import Account, Option, Portfolio
+from src.iol.enums import Country, InstrumentType, Market
+from src.iol.entities import RAW_KEEP, Account, CotizationBatch, Option, Portfolio, TickerCotization
 from src.iol.resources import (
     MeRequest,
     PortfolioRequest,
     GetAllCotizationsRequest,
+    TickerCotizationRequest,
 )
 
+from src.iol.lazy_options import LazyOptionList
+
+if TYPE_CHECKING:
+    from src.iol.frames import OptionChainFrame
+
+
+DEFAULT_COTIZATIONS_CONCURRENCY = 16
+DEFAULT_STREAM_BATCH_SIZE = 500
+
 
 @dataclass
 class IOLClient:
     service: ExtractionService
     identifier: str
 
+    @asynccontextmanager
+    async def _lease(self) -> AsyncIterator[str]:
+        """Identifier para requests de solo lectura (cotizaciones); un pool lo reparte."""
+        yield self.identifier
+
+    @timed("client_fetch")
     async def fetch_me(self) -> Account:
         extraction = await self.service.extract(
             identifier=self.identifier,
             request=MeRequest.new(),
         )
-        return Account.from_payload(extraction.data)
+        with METRICS.timer("parse", endpoint="Account"):
+            return Account.from_payload(extraction.data)
 
-    async def fetch_portfolio(self, country: Country = Country.ARG) -> ...:
+    @timed("client_fetch")
+    async def fetch_portfolio(self, country: Country = Country.ARG, raw_mode: str = RAW_KEEP) -> Portfolio:
         extraction = await self.service.extract(
             identifier=self.identifier,
             request=PortfolioRequest.new(country=country),
         )
-        return Portfolio.from_payload(extraction.data)
+        with METRICS.timer("parse", endpoint="Portfolio"):
+            return Portfolio.from_payload(extraction.data, raw_mode=raw_mode)
 
-    async def fetch_all_options(self, country: Country = Country.ARG) -> List[Option]:
-        extraction = await self.service.extract(
-            identifier=self.identifier,
-            request=GetAllCotizationsRequest.new(country=country, instrument_type=InstrumentType.OPTIONS),
-        )
+    @timed("client_fetch")
+    async def fetch_all_options(self, country: Country = Country.ARG, raw_mode: str = RAW_KEEP) -> List[Option]:
+        """`raw_mode` (RAW_KEEP / RAW_LAZY / RAW_DROP) controla cuánto del payload retiene cada Option."""
+        async with self._lease() as identifier:
+            extraction = await self.service.extract(
+                identifier=identifier,
+                request=GetAllCotizationsRequest.new(country=country, instrument_type=InstrumentType.OPTIONS),
+            )
         cotizations = extraction.data.get("titulos") or []
-        return [Option.from_payload(option) for option in cotizations]
\ No newline at end of file
+        with METRICS.timer("parse", endpoint="Option"):
+            return [Option.from_payload(option, raw_mode=raw_mode) for option in cotizations]
+
+    @timed("client_fetch")
+    async def fetch_all_options_lazy(self, country: Country = Country.ARG, raw_mode: str = RAW_KEEP) -> LazyOptionList:
+        """Como fetch_all_options, pero cada Option se parsea recién al accederla (ver LazyOptionList)."""
+        async with self._lease() as identifier:
+            extraction = await self.service.extract(
+                identifier=identifier,
+                request=GetAllCotizationsRequest.new(country=country, instrument_type=InstrumentType.OPTIONS),
+            )
+        return LazyOptionList(extraction.data.get("titulos") or [], raw_mode=raw_mode)
+
+    @timed("client_fetch")
+    async def fetch_all_options_columnar(self, country: Country = Country.ARG) -> "OptionChainFrame":
+        # numpy se importa acá para no volverlo dependencia del resto del cliente.
+        from src.iol.frames import OptionChainFrame
+
+        async with self._lease() as identifier:
+            extraction = await self.service.extract(
+                identifier=identifier,
+                request=GetAllCotizationsRequest.new(country=country, instrument_type=InstrumentType.OPTIONS),
+            )
+        with METRICS.timer("parse", endpoint="OptionChainFrame"):
+            return OptionChainFrame.from_titulos(extraction.data.get("titulos") or [])
+
+    async def stream_all_options(
+        self,
+        country: Country = Country.ARG,
+        raw_mode: str = RAW_KEEP,
+    ) -> AsyncIterator[Option]:
+        """Como fetch_all_options, pero entrega cada Option a medida que se decodifica."""
+        async with self._lease() as identifier:
+            async for payload in self.service.stream(
+                identifier=identifier,
+                request=GetAllCotizationsRequest.new(country=country, instrument_type=InstrumentType.OPTIONS),
+                key="titulos",
+            ):
+                yield Option.from_payload(payload, raw_mode=raw_mode)
+
+    async def stream_all_options_columnar(
+        self,
+        country: Country = Country.ARG,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> AsyncIterator["OptionChainFrame"]:
+        from src.iol.frames import OptionChainFrame
+
+        batch: List[Dict[str, Any]] = []
+        async with self._lease() as identifier:
+            async for payload in self.service.stream(
+                identifier=identifier,
+                request=GetAllCotizationsRequest.new(country=country, instrument_type=InstrumentType.OPTIONS),
+                key="titulos",
+            ):
+                batch.append(payload)
+                if len(batch) >= batch_size:
+                    yield OptionChainFrame.from_titulos(batch)
+                    batch = []
+        if batch:
+            yield OptionChainFrame.from_titulos(batch)
+
+    @timed("client_fetch")
+    async def fetch_cotization(
+        self,
+        symbol: str,
+        market: Market = Market.BCBA,
+        raw_mode: str = RAW_KEEP,
+    ) -> TickerCotization:
+        async with self._lease() as identifier:
+            extraction = await self.service.extract(
+                identifier=identifier,
+                request=TickerCotizationRequest.new(symbol=symbol, market=market),
+            )
+        if not extraction.success:
+            status = extraction.attempts[-1].response.status_code
+            raise RuntimeError(f"Cotization request for {symbol} failed with status {status}")
+        with METRICS.timer("parse", endpoint="TickerCotization"):
+            return TickerCotization.from_payload(extraction.data, raw_mode=raw_mode)
+
+    @timed("client_fetch")
+    async def fetch_cotizations(
+        self,
+        symbols: Iterable[str],
+        market: Market = Market.BCBA,
+        concurrency: int = DEFAULT_COTIZATIONS_CONCURRENCY,
+        raw_mode: str = RAW_KEEP,
+    ) -> CotizationBatch:
+        """Trae cotizaciones en paralelo con concurrencia acotada; los errores quedan por símbolo."""
+        ordered = list(dict.fromkeys(symbols))
+        pending = deque(ordered)
+        cotizations: Dict[str, TickerCotization] = {}
+        errors: Dict[str, Exception] = {}
+        latencies: Dict[str, float] = {}
+
+        async def fetch(symbol: str) -> None:
+            started = time.perf_counter()
+            try:
+                cotizations[symbol] = await self.fetch_cotization(symbol, market=market, raw_mode=raw_mode)
+            except Exception as exc:
+                errors[symbol] = exc
+            finally:
+                latencies[symbol] = time.perf_counter() - started
+
+        async def worker() -> None:
+            while pending:
+                # En el orden que pasó el caller.
+                await fetch(pending.popleft())
+
+        started = time.perf_counter()
+        workers = min(max(concurrency, 1), len(pending))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        return CotizationBatch(
+            cotizations={symbol: cotizations[symbol] for symbol in ordered if symbol in cotizations},
+            errors={symbol: errors[symbol] for symbol in ordered if symbol in errors},
+            latencies={symbol: latencies[symbol] for symbol in ordered if symbol in latencies},
+            elapsed=time.perf_counter() - started,
+        )
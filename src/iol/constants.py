@@ -1,4 +1,10 @@
+import re
+
 ACCESS_TOKEN_DEFAULT_LIFETIME = 300
 HOST = "https://api.invertironline.com"
 API_ROOT_V2 = HOST + "/api/v2"
-IDENTIFIER = "TEST"
\ No newline at end of file
+IDENTIFIER = "TEST"
+
+# Símbolo de opción: subyacente, C (call) / V (put) y strike (p.ej. GFGC1000FE).
+OPTION_SYMBOL_PATTERN = re.compile(r"(?P<underlying>[A-Z]+)(?P<cp>[CV])(?P<strike>\d+)")
+OPTION_TYPES = {"C": "CALL", "V": "PUT"}
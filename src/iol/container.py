@@ -1,26 +1,326 @@
-import httpx
+"""Wiring del cliente de IOL. Cada componente se arma recién al usarlo por primera vez.
 
-from src.seedwork.access_token_repo import SQLiteAccessTokenRepo
-from src.seedwork.auth_service import StandardAuthService
-from src.seedwork.client import HttpxClientAdapter
-from src.seedwork.extractor import StandardExtractor
-from src.seedwork.service import StandardExtractionService
-from src.seedwork.repositories import SQLiteExtractionRepo
+    from src.iol.container import iol_client            # container por defecto (settings del entorno)
+
+    container = Container(ContainerSettings(db_path="jobs.sqlite", timeout=5, extraction_repo="memory"))
+    await container.async_iol_client.fetch_all_options()
+
+Importar este módulo no abre la DB, no crea clientes de httpx y no importa
+httpx ni el stack: eso pasa al acceder al atributo correspondiente.
+"""
+import atexit
+from dataclasses import dataclass, field
+from functools import cached_property
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
 
-from src.iol.auth.account_token_provider import IOLTokenProvider
-from src.iol.client import IOLClient
 from src.iol.constants import IDENTIFIER
 
+if TYPE_CHECKING:
+    import sqlite3
+
+    import httpx
+
+    from src.seedwork.auth_service import AsyncStandardAuthService, StandardAuthService
+    from src.seedwork.cache import CachedExtractionService
+    from src.seedwork.client import AsyncHttpxClientAdapter, HttpxClientAdapter
+    from src.seedwork.extractor import AsyncStandardExtractor, StandardExtractor
+    from src.seedwork.interfaces import AccessTokenRepo, ExtractionRepo
+    from src.seedwork.rate_limit import RateLimiter
+    from src.seedwork.service import AsyncStandardExtractionService, StandardExtractionService
+
+    from src.iol.auth.account_token_provider import AsyncIOLTokenProvider, IOLTokenProvider
+    from src.iol.client import IOLClient
+    from src.iol.pool import IOLClientPool
+
+
+EXTRACTION_REPOS = ("write_behind", "sqlite", "memory")
+TOKEN_REPOS = ("sqlite", "memory")
+
+
+@dataclass(frozen=True)
+class ContainerSettings:
+    # None usa la conexión compartida de `sqlite_db` (db.sqlite en src/).
+    db_path: Optional[Union[str, Path]] = None
+    timeout: float = 10.0
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    rate_limits: bool = True
+    # Envuelve `async_service` en un CachedExtractionService con DEFAULT_CACHE_TTLS.
+    cache: bool = False
+    extraction_repo: str = "write_behind"
+    token_repo: str = "sqlite"
+    identifier: str = IDENTIFIER
+    # None = las cuentas de IOL_ACCOUNTS (ver src/iol/auth/accounts.py).
+    pool_identifiers: Optional[Sequence[str]] = field(default=None)
+
+    def __post_init__(self) -> None:
+        if self.extraction_repo not in EXTRACTION_REPOS:
+            raise ValueError(f"Unknown extraction repo {self.extraction_repo}")
+        if self.token_repo not in TOKEN_REPOS:
+            raise ValueError(f"Unknown token repo {self.token_repo}")
+
+    @classmethod
+    def from_env(cls) -> "ContainerSettings":
+        """IOL_DB_PATH, IOL_HTTP_TIMEOUT, IOL_MAX_CONNECTIONS, IOL_MAX_KEEPALIVE,
+        IOL_RATE_LIMITS (0 para desactivar), IOL_CACHE (1 para activar),
+        IOL_EXTRACTION_REPO, IOL_TOKEN_REPO."""
+        defaults = cls()
+        return cls(
+            db_path=os.getenv("IOL_DB_PATH") or defaults.db_path,
+            timeout=float(os.getenv("IOL_HTTP_TIMEOUT") or defaults.timeout),
+            max_connections=int(os.getenv("IOL_MAX_CONNECTIONS") or defaults.max_connections),
+            max_keepalive_connections=int(os.getenv("IOL_MAX_KEEPALIVE") or defaults.max_keepalive_connections),
+            rate_limits=os.getenv("IOL_RATE_LIMITS", "1") not in ("0", "false", "no"),
+            cache=os.getenv("IOL_CACHE", "0") not in ("0", "false", "no"),
+            extraction_repo=os.getenv("IOL_EXTRACTION_REPO") or defaults.extraction_repo,
+            token_repo=os.getenv("IOL_TOKEN_REPO") or defaults.token_repo,
+        )
+
+
+class Container:
+    """Stack sync y async del cliente; ambos comparten repos y rate limiter.
+
+    `transport` / `async_transport` reemplazan la red de httpx (tests, FakeIOL).
+    """
+
+    def __init__(
+        self,
+        settings: Optional[ContainerSettings] = None,
+        transport: Any = None,
+        async_transport: Any = None,
+    ) -> None:
+        self.settings = settings or ContainerSettings()
+        self._transport = transport
+        self._async_transport = async_transport
+
+    def _built(self, name: str) -> bool:
+        return name in self.__dict__
+
+    # Compartido entre stacks
+
+    @cached_property
+    def connection(self) -> "sqlite3.Connection":
+        from src.seedwork.sqlite_db import connect, get_shared_connection
+
+        if self.settings.db_path is None:
+            return get_shared_connection()
+        return connect(self.settings.db_path)
+
+    @cached_property
+    def rate_limiter(self) -> Optional["RateLimiter"]:
+        # Un solo limiter para ambos stacks: el presupuesto por cuenta es compartido.
+        if not self.settings.rate_limits:
+            return None
+        from src.seedwork.rate_limit import RateLimiter
+        from src.iol.resources import DEFAULT_RATE_LIMITS
+
+        return RateLimiter(limits=DEFAULT_RATE_LIMITS)
+
+    @cached_property
+    def token_repo(self) -> "AccessTokenRepo[str]":
+        from src.seedwork.access_token_repo import InMemoryAccessTokenRepo, SQLiteAccessTokenRepo
+
+        if self.settings.token_repo == "memory":
+            return InMemoryAccessTokenRepo()
+        return SQLiteAccessTokenRepo(connection=self.connection)
+
+    @cached_property
+    def extraction_repo(self) -> "ExtractionRepo":
+        from src.seedwork.repositories import (
+            InMemoryExtractionRepo,
+            SQLiteExtractionRepo,
+            WriteBehindSQLiteExtractionRepo,
+        )
+
+        if self.settings.extraction_repo == "memory":
+            return InMemoryExtractionRepo()
+        if self.settings.extraction_repo == "sqlite":
+            return SQLiteExtractionRepo(connection=self.connection)
+        repo = WriteBehindSQLiteExtractionRepo(connection=self.connection)
+        atexit.register(repo.close)
+        return repo
+
+    def _httpx_options(self) -> dict:
+        import httpx
+
+        return {
+            "timeout": self.settings.timeout,
+            "limits": httpx.Limits(
+                max_connections=self.settings.max_connections,
+                max_keepalive_connections=self.settings.max_keepalive_connections,
+            ),
+        }
+
+    # Stack sync
+
+    @cached_property
+    def httpx_client(self) -> "httpx.Client":
+        import httpx
+
+        return httpx.Client(transport=self._transport, **self._httpx_options())
+
+    @cached_property
+    def client(self) -> "HttpxClientAdapter":
+        from src.seedwork.client import HttpxClientAdapter
+
+        return HttpxClientAdapter(client=self.httpx_client, rate_limiter=self.rate_limiter)
+
+    @cached_property
+    def token_provider(self) -> "IOLTokenProvider":
+        from src.iol.auth.account_token_provider import IOLTokenProvider
+
+        return IOLTokenProvider(self.client)
+
+    @cached_property
+    def auth_service(self) -> "StandardAuthService":
+        from src.seedwork.auth_service import StandardAuthService
+
+        return StandardAuthService(token_provider=self.token_provider, token_repo=self.token_repo)
+
+    @cached_property
+    def extractor(self) -> "StandardExtractor":
+        from src.seedwork.extractor import StandardExtractor
+
+        return StandardExtractor(client=self.client, auth_service=self.auth_service)
+
+    @cached_property
+    def service(self) -> "StandardExtractionService":
+        from src.seedwork.service import StandardExtractionService
+
+        return StandardExtractionService(extractor=self.extractor, extraction_repo=self.extraction_repo)
+
+    @cached_property
+    def iol_client(self) -> "IOLClient":
+        from src.iol.client import IOLClient
+
+        return IOLClient(service=self.service, identifier=self.settings.identifier)
+
+    # Stack async: mismos repos, transport no bloqueante para fetches concurrentes en un loop.
+
+    @cached_property
+    def async_httpx_client(self) -> "httpx.AsyncClient":
+        import httpx
+
+        return httpx.AsyncClient(transport=self._async_transport, **self._httpx_options())
+
+    @cached_property
+    def async_client(self) -> "AsyncHttpxClientAdapter":
+        from src.seedwork.client import AsyncHttpxClientAdapter
+
+        return AsyncHttpxClientAdapter(client=self.async_httpx_client, rate_limiter=self.rate_limiter)
+
+    @cached_property
+    def async_token_provider(self) -> "AsyncIOLTokenProvider":
+        from src.iol.auth.account_token_provider import AsyncIOLTokenProvider
+
+        return AsyncIOLTokenProvider(self.async_client)
+
+    @cached_property
+    def async_auth_service(self) -> "AsyncStandardAuthService":
+        from src.seedwork.auth_service import AsyncStandardAuthService
+
+        return AsyncStandardAuthService(token_provider=self.async_token_provider, token_repo=self.token_repo)
+
+    @cached_property
+    def async_extractor(self) -> "AsyncStandardExtractor":
+        from src.seedwork.extractor import AsyncStandardExtractor
+
+        return AsyncStandardExtractor(client=self.async_client, auth_service=self.async_auth_service)
+
+    @cached_property
+    def async_service(self) -> "Union[AsyncStandardExtractionService, CachedExtractionService]":
+        from src.seedwork.service import AsyncStandardExtractionService
+
+        service = AsyncStandardExtractionService(extractor=self.async_extractor, extraction_repo=self.extraction_repo)
+        if not self.settings.cache:
+            return service
+        from src.seedwork.cache import CachedExtractionService
+        from src.iol.resources import DEFAULT_CACHE_TTLS
+
+        return CachedExtractionService(service=service, ttls=DEFAULT_CACHE_TTLS)
+
+    @cached_property
+    def async_iol_client(self) -> "IOLClient":
+        from src.iol.client import IOLClient
+
+        return IOLClient(service=self.async_service, identifier=self.settings.identifier)
+
+    @cached_property
+    def async_iol_pool(self) -> "IOLClientPool":
+        """Reparte cotizaciones entre las cuentas del pool; llamar `await pool.start()`."""
+        from src.iol.pool import IOLClientPool
+
+        identifiers = self.settings.pool_identifiers
+        if identifiers is None:
+            from src.iol.auth.accounts import POOL_IDENTIFIERS as identifiers
+        return IOLClientPool(
+            service=self.async_service,
+            identifier=self.settings.identifier,
+            auth_service=self.async_auth_service,
+            identifiers=list(identifiers),
+        )
+
+    # Cierre: solo lo que llegó a construirse.
+
+    def close(self) -> None:
+        if self._built("extraction_repo") and hasattr(self.extraction_repo, "close"):
+            atexit.unregister(self.extraction_repo.close)
+            self.extraction_repo.close()
+        if self._built("httpx_client"):
+            self.httpx_client.close()
+        # La conexión compartida de `sqlite_db` no es nuestra: solo se cierra la propia.
+        if self._built("connection") and self.settings.db_path is not None:
+            self.connection.close()
+
+    async def aclose(self) -> None:
+        import asyncio
+
+        await asyncio.to_thread(self.close)
+        if self._built("async_httpx_client"):
+            await self.async_httpx_client.aclose()
+
+
+_COMPONENTS = frozenset(
+    name for name, value in vars(Container).items() if isinstance(value, cached_property)
+)
+_default: Optional[Container] = None
+
+
+def get_container() -> Container:
+    global _default
+    if _default is None:
+        _default = Container(ContainerSettings.from_env())
+    return _default
+
+
+def configure(settings: ContainerSettings, **kwargs: Any) -> Container:
+    """Reemplaza el container por defecto; usar antes de tocar `iol_client` y compañía.
+
+    Si el container anterior ya abrió el stack async, usar `aconfigure`: su
+    `httpx.AsyncClient` solo se puede cerrar desde el event loop.
+    """
+    global _default
+    if _default is not None:
+        if _default._built("async_httpx_client") and not _default.async_httpx_client.is_closed:
+            raise RuntimeError("Default container has an open async client, use `await aconfigure(...)`")
+        _default.close()
+    _default = Container(settings, **kwargs)
+    return _default
 
-httpx_client = httpx.Client(timeout=10)
-client = HttpxClientAdapter(client=httpx_client)
 
-token_provider = IOLTokenProvider(client)
-token_repo = SQLiteAccessTokenRepo()
-auth_service = StandardAuthService(token_provider=token_provider, token_repo=token_repo)
+async def aconfigure(settings: ContainerSettings, **kwargs: Any) -> Container:
+    """Como `configure`, pero cierra también el stack async del container anterior."""
+    global _default
+    if _default is not None:
+        await _default.aclose()
+    _default = Container(settings, **kwargs)
+    return _default
 
-extractor = StandardExtractor(client=client, auth_service=auth_service)
-extraction_repo = SQLiteExtractionRepo()
 
-service = StandardExtractionService(extractor=extractor, extraction_repo=extraction_repo)
-iol_client=IOLClient(service=service, identifier=IDENTIFIER)
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # `from src.iol.container import iol_client` sigue funcionando, pero arma solo lo necesario.
+    if name in _COMPONENTS:
+        return getattr(get_container(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
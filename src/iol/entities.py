@@ -1,45 +1,212 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache, partial
+from itertools import accumulate
+import json
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
-from src.iol.value_objects import BookEntry
+from src.seedwork.parsing import RAW, FieldSpec, compile_parser, optional_datetime, optional_float
 
+from src.iol.value_objects import BookEntry, parse_book_entries, top_of_book
 
-def _parse_optional_float(value: Any) -> Optional[float]:
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
 
+# Qué hacer con el payload original al parsear (`raw`): guardarlo tal cual,
+# descartarlo, o guardarlo como JSON compacto que se decodifica al accederlo.
+RAW_KEEP = "keep"
+RAW_DROP = "drop"
+RAW_LAZY = "lazy"
 
-def _parse_optional_datetime(value: Any) -> Optional[datetime]:
-    if not value:
-        return None
-    if isinstance(value, datetime):
-        return value
-    try:
-        return datetime.fromisoformat(str(value))
-    except (ValueError, TypeError):
+_NO_RAW: Mapping[str, Any] = MappingProxyType({})
+
+
+class LazyPayload(Mapping[str, Any]):
+    """Payload guardado como bytes JSON; se decodifica (y cachea) en el primer acceso."""
+
+    __slots__ = ("_encoded", "_decoded")
+
+    def __init__(self, payload: Mapping[str, Any]) -> None:
+        self._encoded: Optional[bytes] = json.dumps(
+            payload, separators=(",", ":"), ensure_ascii=False, default=str
+        ).encode()
+        self._decoded: Optional[Dict[str, Any]] = None
+
+    def _load(self) -> Dict[str, Any]:
+        if self._decoded is None:
+            self._decoded = json.loads(self._encoded)
+            self._encoded = None
+        return self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        return f"LazyPayload({self._load()!r})"
+
+
+def _drop_raw(payload: Dict[str, Any]) -> Mapping[str, Any]:
+    return _NO_RAW
+
+
+def _retainer(raw_mode: str) -> Optional[Callable[[Dict[str, Any]], Mapping[str, Any]]]:
+    """Función que aplica `raw_mode` al payload (None = guardarlo tal cual)."""
+    if raw_mode == RAW_KEEP:
         return None
+    if raw_mode == RAW_DROP:
+        return _drop_raw
+    if raw_mode == RAW_LAZY:
+        return LazyPayload
+    raise ValueError(f"Unknown raw mode {raw_mode}")
 
 
-def _build_book_entries(payload: Any) -> List[BookEntry]:
-    if not isinstance(payload, list):
-        return []
-    entries: List[BookEntry] = []
-    for item in payload:
-        if isinstance(item, dict):
-            entry = BookEntry.from_payload(item)
-            if entry:
-                entries.append(entry)
-    return entries
+def _intern(value: Any) -> Any:
+    # Mercado, moneda, plazo, etc. se repiten en toda la cadena: una sola copia.
+    return sys.intern(value) if isinstance(value, str) else value
 
 
-@dataclass
-class MarketQuote:
+# Pocos vencimientos distintos por cadena: se comparte el mismo datetime.
+_parse_cached_datetime = lru_cache(maxsize=256)(optional_datetime)
+
+
+def _parse_expiry(value: Any) -> Optional[datetime]:
+    if isinstance(value, str):
+        return _parse_cached_datetime(value)
+    return optional_datetime(value)
+
+
+def _bid_price(entry: BookEntry) -> float:
+    return entry.bid_price
+
+
+def _ask_price(entry: BookEntry) -> float:
+    return entry.ask_price
+
+
+def _depth(cumulative: Tuple[float, ...], levels: Optional[int]) -> float:
+    # cumulative[i] = cantidad en los primeros i niveles; `levels` como en un slice [:levels].
+    last = len(cumulative) - 1
+    if levels is None:
+        count = last
+    elif levels < 0:
+        count = max(0, last + levels)
+    else:
+        count = min(levels, last)
+    return cumulative[count]
+
+
+class _Book:
+    """Vista derivada de `book_entries`.
+
+    El top of book sale de una pasada lineal; las puntas ordenadas y las
+    cantidades acumuladas recién se calculan si se piden.
+    """
+
+    __slots__ = ("entries", "best_bid", "best_ask", "_bids", "_asks", "_bid_depths", "_ask_depths")
+
+    def __init__(self, entries: Tuple[BookEntry, ...]) -> None:
+        self.entries = entries
+        self.best_bid, self.best_ask = top_of_book(entries)
+        self._bids: Optional[Tuple[BookEntry, ...]] = None
+        self._asks: Optional[Tuple[BookEntry, ...]] = None
+        self._bid_depths: Optional[Tuple[float, ...]] = None
+        self._ask_depths: Optional[Tuple[float, ...]] = None
+
+    @property
+    def bids(self) -> Tuple[BookEntry, ...]:
+        if self._bids is None:
+            self._bids = tuple(sorted(
+                (entry for entry in self.entries if entry.bid_price > 0),
+                key=_bid_price,
+                reverse=True,
+            ))
+        return self._bids
+
+    @property
+    def asks(self) -> Tuple[BookEntry, ...]:
+        if self._asks is None:
+            self._asks = tuple(sorted(
+                (entry for entry in self.entries if entry.ask_price > 0),
+                key=_ask_price,
+            ))
+        return self._asks
+
+    def bid_depth(self, levels: Optional[int]) -> float:
+        if self._bid_depths is None:
+            self._bid_depths = tuple(accumulate((entry.bid_size for entry in self.bids), initial=0.0))
+        return _depth(self._bid_depths, levels)
+
+    def ask_depth(self, levels: Optional[int]) -> float:
+        if self._ask_depths is None:
+            self._ask_depths = tuple(accumulate((entry.ask_size for entry in self.asks), initial=0.0))
+        return _depth(self._ask_depths, levels)
+
+
+class _BookSlot:
+    # Slot fuera de los campos de la dataclass: el caché del libro no aparece
+    # en fields()/asdict() ni participa de eq/repr.
+    __slots__ = ("_book_cache",)
+
+
+def _option_type(value: Any) -> Optional[str]:
+    return _intern(value.upper()) if value else None
+
+
+# Tablas payload -> atributo. El orden de `keys` es el orden de fallback.
+QUOTE_FIELDS: Tuple[FieldSpec, ...] = (
+    FieldSpec("symbol", ("simbolo",), required="Can't find symbol"),
+    FieldSpec("description", ("descripcion", ("simbolo", str))),
+    FieldSpec("book_entries", ("puntas",), parse_book_entries),
+    FieldSpec("last_price", ("ultimoPrecio",), optional_float),
+    FieldSpec("variation", ("variacionPorcentual",), optional_float),
+    FieldSpec("open_price", ("apertura",), optional_float),
+    FieldSpec("high", ("maximo",), optional_float),
+    FieldSpec("low", ("minimo",), optional_float),
+    FieldSpec("previous_close", ("ultimoCierre",), optional_float),
+    FieldSpec("volume", ("volumen",), optional_float),
+    FieldSpec("trade_count", ("cantidadOperaciones",), optional_float),
+    FieldSpec("timestamp", ("fecha",), optional_datetime),
+    FieldSpec("market", ("mercado",), _intern),
+    FieldSpec("currency", ("moneda",), _intern),
+    FieldSpec("term", ("plazo",), _intern),
+    FieldSpec("min_lot", ("laminaMinima",), optional_float),
+    FieldSpec("lot", ("lote",), optional_float),
+)
+
+OPTION_FIELDS: Tuple[FieldSpec, ...] = QUOTE_FIELDS + (
+    FieldSpec("option_type", ("tipoOpcion", "tipo", "type"), _option_type, fallback=RAW),
+    FieldSpec("strike", ("precioEjercicio", "strike"), optional_float),
+    FieldSpec("expiry", ("fechaVencimiento", "vencimiento"), _parse_expiry, fallback=RAW),
+)
+
+_TICKER_OVERRIDES = {
+    "variation": FieldSpec("variation", ("variacion", "variacionPorcentual"), optional_float),
+    "previous_close": FieldSpec("previous_close", ("cierreAnterior", "ultimoCierre"), optional_float),
+    "timestamp": FieldSpec("timestamp", ("fechaHora", "fecha"), optional_datetime),
+}
+
+TICKER_COTIZATION_FIELDS: Tuple[FieldSpec, ...] = tuple(
+    _TICKER_OVERRIDES.get(spec.attribute, spec) for spec in QUOTE_FIELDS
+) + (
+    FieldSpec("trend", ("tendencia",), _intern),
+    FieldSpec("amount_traded", ("montoOperado",), optional_float),
+    FieldSpec("nominal_volume", ("volumenNominal",), optional_float),
+    FieldSpec("average_price", ("precioPromedio",), optional_float),
+    FieldSpec("adjusted_price", ("precioAjuste",), optional_float),
+    FieldSpec("open_interest", ("interesesAbiertos",), optional_float),
+)
+
+@dataclass(slots=True)
+class MarketQuote(_BookSlot):
     symbol: str
     description: str
-    book_entries: List[BookEntry]
+    book_entries: Tuple[BookEntry, ...]
     last_price: Optional[float]
     variation: Optional[float]
     open_price: Optional[float]
@@ -54,103 +221,87 @@ class MarketQuote:
     term: Optional[str]
     min_lot: Optional[float]
     lot: Optional[float]
-    raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+    raw: Mapping[str, Any] = field(default_factory=dict, repr=False)
+
+    def _book(self) -> _Book:
+        # Parsear una cadena no paga el libro; se arma al primer acceso y se
+        # rehace si reasignan `book_entries`.
+        book = getattr(self, "_book_cache", None)
+        if book is None or book.entries is not self.book_entries:
+            book = self._book_cache = _Book(self.book_entries)
+        return book
 
     @property
     def best_bid(self) -> Optional[BookEntry]:
-        bids = [entry for entry in self.book_entries if entry.bid_price > 0]
-        return max(bids, key=lambda entry: entry.bid_price, default=None)
+        return self._book().best_bid
 
     @property
     def best_ask(self) -> Optional[BookEntry]:
-        asks = [entry for entry in self.book_entries if entry.ask_price > 0]
-        return min(asks, key=lambda entry: entry.ask_price, default=None)
+        return self._book().best_ask
+
+    @property
+    def bids(self) -> Tuple[BookEntry, ...]:
+        """Puntas con precio de compra, de mejor a peor."""
+        return self._book().bids
+
+    @property
+    def asks(self) -> Tuple[BookEntry, ...]:
+        return self._book().asks
 
     @property
     def spread(self) -> Optional[float]:
-        bid = self.best_bid
-        ask = self.best_ask
-        if not bid or not ask:
+        book = self._book()
+        if book.best_bid is None or book.best_ask is None:
             return None
-        return ask.ask_price - bid.bid_price
+        return book.best_ask.ask_price - book.best_bid.bid_price
 
     @property
     def mid_price(self) -> Optional[float]:
-        bid = self.best_bid
-        ask = self.best_ask
-        if not bid or not ask:
+        book = self._book()
+        if book.best_bid is None or book.best_ask is None:
+            return None
+        return (book.best_ask.ask_price + book.best_bid.bid_price) / 2
+
+    @property
+    def weighted_mid(self) -> Optional[float]:
+        """Mid ponderado por las cantidades del top of book (se corre hacia el lado más fino)."""
+        book = self._book()
+        bid, ask = book.best_bid, book.best_ask
+        if bid is None or ask is None:
             return None
-        return (ask.ask_price + bid.bid_price) / 2
+        size = bid.bid_size + ask.ask_size
+        if size <= 0:
+            return (ask.ask_price + bid.bid_price) / 2
+        return (bid.bid_price * ask.ask_size + ask.ask_price * bid.bid_size) / size
 
+    def bid_depth(self, levels: Optional[int] = None) -> float:
+        """Cantidad acumulada en los mejores `levels` niveles de compra (todos si es None)."""
+        return self._book().bid_depth(levels)
 
-@dataclass
+    def ask_depth(self, levels: Optional[int] = None) -> float:
+        return self._book().ask_depth(levels)
+
+
+@dataclass(slots=True)
 class Option(MarketQuote):
     option_type: Optional[str] = None
     strike: Optional[float] = None
     expiry: Optional[datetime] = None
 
     @classmethod
-    def from_payload(cls, payload: Dict[str, Any]) -> "Option":
-        symbol = payload.get("simbolo")
-        if not symbol:
-            raise ValueError("Can't find symbol")
-
-        description = payload.get("descripcion") or str(symbol)
-        last_price = _parse_optional_float(payload.get("ultimoPrecio"))
-        variation = _parse_optional_float(payload.get("variacionPorcentual"))
-        open_price = _parse_optional_float(payload.get("apertura"))
-        high = _parse_optional_float(payload.get("maximo"))
-        low = _parse_optional_float(payload.get("minimo"))
-        previous_close = _parse_optional_float(payload.get("ultimoCierre"))
-        volume = _parse_optional_float(payload.get("volumen"))
-        trade_count = _parse_optional_float(payload.get("cantidadOperaciones"))
-        strike = (
-            _parse_optional_float(payload.get("precioEjercicio"))
-            or _parse_optional_float(payload.get("strike"))
-        )
-        expiry = _parse_optional_datetime(
-            payload.get("fechaVencimiento") or payload.get("vencimiento")
-        )
-        timestamp = _parse_optional_datetime(payload.get("fecha"))
-        option_type = (
-            payload.get("tipoOpcion")
-            or payload.get("tipo")
-            or payload.get("type")
-            or None
-        )
-        market = payload.get("mercado")
-        currency = payload.get("moneda")
-        term = payload.get("plazo")
-        min_lot = _parse_optional_float(payload.get("laminaMinima"))
-        lot = _parse_optional_float(payload.get("lote"))
-        book_entries = _build_book_entries(payload.get("puntas"))
+    def from_payload(cls, payload: Dict[str, Any], raw_mode: str = RAW_KEEP) -> "Option":
+        return _parse_option(cls, payload, _retainer(raw_mode))
 
-        return cls(
-            symbol=symbol,
-            description=description,
-            book_entries=book_entries,
-            last_price=last_price,
-            variation=variation,
-            open_price=open_price,
-            high=high,
-            low=low,
-            previous_close=previous_close,
-            volume=volume,
-            trade_count=trade_count,
-            timestamp=timestamp,
-            market=market,
-            currency=currency,
-            term=term,
-            min_lot=min_lot,
-            lot=lot,
-            raw=payload,
-            option_type=option_type.upper() if option_type else None,
-            strike=strike,
-            expiry=expiry,
-        )
 
+_parse_option = compile_parser(OPTION_FIELDS, payload_attribute="raw", name="parse_option", target=Option)
 
-@dataclass
+
+def option_parser(raw_mode: str = RAW_KEEP) -> Callable[[Mapping[str, Any]], Option]:
+    """`Option.from_payload` con `raw_mode` ya resuelto, para parsear fila por fila."""
+    return partial(_parse_option, Option, retain=_retainer(raw_mode))
+
+
+@dataclass(slots=True)
 class TickerCotization(MarketQuote):
     trend: Optional[str] = None
     amount_traded: Optional[float] = None
@@ -160,51 +311,34 @@ class TickerCotization(MarketQuote):
     open_interest: Optional[float] = None
 
     @classmethod
-    def from_payload(cls, payload: Dict[str, Any]) -> "TickerCotization":
-        base = Option.from_payload  # reuse parsing for shared fields
-        data = base(payload)
-        if data is None:
-            raise ValueError("Can't found data")
-            
-        trend = payload.get("tendencia")
-        amount_traded = _parse_optional_float(payload.get("montoOperado"))
-        nominal_volume = _parse_optional_float(payload.get("volumenNominal"))
-        average_price = _parse_optional_float(payload.get("precioPromedio"))
-        adjusted_price = _parse_optional_float(payload.get("precioAjuste"))
-        open_interest = _parse_optional_float(payload.get("interesesAbiertos"))
+    def from_payload(cls, payload: Dict[str, Any], raw_mode: str = RAW_KEEP) -> "TickerCotization":
+        return _parse_ticker_cotization(cls, payload, _retainer(raw_mode))
 
-        return cls(
-            symbol=data.symbol,
-            description=data.description,
-            book_entries=data.book_entries,
-            last_price=data.last_price,
-            variation=_parse_optional_float(payload.get("variacion"))
-            or data.variation,
-            open_price=data.open_price,
-            high=data.high,
-            low=data.low,
-            previous_close=_parse_optional_float(payload.get("cierreAnterior"))
-            or data.previous_close,
-            volume=data.volume,
-            trade_count=data.trade_count,
-            timestamp=_parse_optional_datetime(payload.get("fechaHora"))
-            or data.timestamp,
-            market=data.market,
-            currency=data.currency,
-            term=data.term,
-            min_lot=data.min_lot,
-            lot=data.lot,
-            raw=payload,
-            trend=trend,
-            amount_traded=amount_traded,
-            nominal_volume=nominal_volume,
-            average_price=average_price,
-            adjusted_price=adjusted_price,
-            open_interest=open_interest,
-        )
+
+_parse_ticker_cotization = compile_parser(
+    TICKER_COTIZATION_FIELDS, payload_attribute="raw", name="parse_ticker_cotization", target=TickerCotization
+)
 
 
 @dataclass
+class CotizationBatch:
+    cotizations: Dict[str, TickerCotization]
+    errors: Dict[str, Exception]
+    latencies: Dict[str, float]
+    elapsed: float
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        if not self.latencies:
+            return None
+        return sum(self.latencies.values()) / len(self.latencies)
+
+    @property
+    def max_latency(self) -> Optional[float]:
+        return max(self.latencies.values(), default=None)
+
+
+@dataclass(slots=True)
 class Title:
     symbol: str
     description: Optional[str]
@@ -216,18 +350,23 @@ class Title:
 
     @classmethod
     def from_payload(cls, payload: Dict[str, Any]) -> "Title":
-        return cls(
-            symbol=payload.get("simbolo") or payload.get("symbol") or "",
-            description=payload.get("descripcion"),
-            country=payload.get("pais"),
-            market=payload.get("mercado"),
-            asset_type=payload.get("tipo"),
-            term=payload.get("plazo"),
-            currency=payload.get("moneda"),
-        )
+        return _parse_title(cls, payload)
 
 
-@dataclass
+TITLE_FIELDS: Tuple[FieldSpec, ...] = (
+    FieldSpec("symbol", ("simbolo", "symbol"), fallback=RAW, default=""),
+    FieldSpec("description", ("descripcion",)),
+    FieldSpec("country", ("pais",), _intern),
+    FieldSpec("market", ("mercado",), _intern),
+    FieldSpec("asset_type", ("tipo",), _intern),
+    FieldSpec("term", ("plazo",), _intern),
+    FieldSpec("currency", ("moneda",), _intern),
+)
+
+_parse_title = compile_parser(TITLE_FIELDS, name="parse_title", target=Title)
+
+
+@dataclass(slots=True)
 class Asset:
     quantity: float
     committed: Optional[float]
@@ -240,46 +379,55 @@ class Asset:
     value: Optional[float]
     title: Title
     parking: Optional[Any]
-    raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+    raw: Mapping[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def from_payload(cls, payload: Dict[str, Any]) -> "Asset":
-        return cls(
-            quantity=float(payload.get("cantidad") or 0.0),
-            committed=_parse_optional_float(payload.get("comprometido")),
-            points_variation=_parse_optional_float(payload.get("puntosVariacion")),
-            daily_variation=_parse_optional_float(payload.get("variacionDiaria")),
-            last_price=_parse_optional_float(payload.get("ultimoPrecio")),
-            average_cost=_parse_optional_float(payload.get("ppc")),
-            profit_pct=_parse_optional_float(payload.get("gananciaPorcentaje")),
-            profit_amount=_parse_optional_float(payload.get("gananciaDinero")),
-            value=_parse_optional_float(payload.get("valorizado")),
-            title=Title.from_payload(payload.get("titulo") or {}),
-            parking=payload.get("parking"),
-            raw=payload,
-        )
+    def from_payload(cls, payload: Dict[str, Any], raw_mode: str = RAW_KEEP) -> "Asset":
+        return _parse_asset(cls, payload, _retainer(raw_mode))
 
     @property
     def market_value(self) -> float:
         return self.quantity * (self.last_price or 0.0)
 
 
+def _title(payload: Dict[str, Any]) -> Title:
+    return Title.from_payload(payload)
+
+
+ASSET_FIELDS: Tuple[FieldSpec, ...] = (
+    FieldSpec("quantity", ("cantidad",), float, fallback=RAW, default=0.0),
+    FieldSpec("committed", ("comprometido",), optional_float),
+    FieldSpec("points_variation", ("puntosVariacion",), optional_float),
+    FieldSpec("daily_variation", ("variacionDiaria",), optional_float),
+    FieldSpec("last_price", ("ultimoPrecio",), optional_float),
+    FieldSpec("average_cost", ("ppc",), optional_float),
+    FieldSpec("profit_pct", ("gananciaPorcentaje",), optional_float),
+    FieldSpec("profit_amount", ("gananciaDinero",), optional_float),
+    FieldSpec("value", ("valorizado",), optional_float),
+    FieldSpec("title", ("titulo",), _title, fallback=RAW, default=MappingProxyType({})),
+    FieldSpec("parking", ("parking",)),
+)
+
+_parse_asset = compile_parser(ASSET_FIELDS, payload_attribute="raw", name="parse_asset", target=Asset)
+
+
 @dataclass
 class Portfolio:
     country: str
     assets: List[Asset]
-    raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+    raw: Mapping[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def from_payload(cls, payload: Dict[str, Any]) -> "Portfolio":
+    def from_payload(cls, payload: Dict[str, Any], raw_mode: str = RAW_KEEP) -> "Portfolio":
+        retain = _retainer(raw_mode)
         return cls(
             country=payload.get("pais") or "",
             assets=[
-                Asset.from_payload(item)
+                _parse_asset(Asset, item, retain)
                 for item in payload.get("activos") or []
                 if isinstance(item, dict)
             ],
-            raw=payload,
+            raw=payload if retain is None else retain(payload),
         )
 
     @property
@@ -306,19 +454,24 @@ class Account:
 
     @classmethod
     def from_payload(cls, payload: Dict[str, Any]) -> "Account":
-        return cls(
-            first_name=payload.get("nombre") or "",
-            last_name=payload.get("apellido") or "",
-            account_number=payload.get("numeroCuenta"),
-            dni=payload.get("dni"),
-            tax_id=payload.get("cuitCuil"),
-            gender=payload.get("sexo"),
-            investor_profile=payload.get("perfilInversor"),
-            notify_tax_update=bool(payload.get("actualizarDDJJ")),
-            notify_investor_test=bool(payload.get("actualizarTestInversor")),
-            regret_withdrawal=bool(payload.get("esBajaArrepentimiento")),
-            email=payload.get("email"),
-            account_open=bool(payload.get("cuentaAbierta")),
-            accept_terms=bool(payload.get("actualizarTyC")),
-            accept_app_terms=bool(payload.get("actualizarTyCApp")),
-        )
+        return _parse_account(cls, payload)
+
+
+ACCOUNT_FIELDS: Tuple[FieldSpec, ...] = (
+    FieldSpec("first_name", ("nombre",), fallback=RAW, default=""),
+    FieldSpec("last_name", ("apellido",), fallback=RAW, default=""),
+    FieldSpec("account_number", ("numeroCuenta",)),
+    FieldSpec("dni", ("dni",)),
+    FieldSpec("tax_id", ("cuitCuil",)),
+    FieldSpec("gender", ("sexo",)),
+    FieldSpec("investor_profile", ("perfilInversor",)),
+    FieldSpec("notify_tax_update", ("actualizarDDJJ",), bool),
+    FieldSpec("notify_investor_test", ("actualizarTestInversor",), bool),
+    FieldSpec("regret_withdrawal", ("esBajaArrepentimiento",), bool),
+    FieldSpec("email", ("email",)),
+    FieldSpec("account_open", ("cuentaAbierta",), bool),
+    FieldSpec("accept_terms", ("actualizarTyC",), bool),
+    FieldSpec("accept_app_terms", ("actualizarTyCApp",), bool),
+)
+
+_parse_account = compile_parser(ACCOUNT_FIELDS, name="parse_account", target=Account)
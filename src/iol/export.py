@@ -0,0 +1,456 @@
+"""Export columnar del historial de `extractions` a Parquet o Arrow IPC.
+
+    python -m src.iol.export --db db.sqlite --out history/               # incremental
+    python -m src.iol.export --db db.sqlite --out history/ --format arrow --since 2024-01-01
+
+Cada lote escribe un archivo por partición (endpoint, día) con el tramo de ids
+que contiene, en layout hive (`endpoint=options/date=2024-01-05/part-...`) que
+leen pyarrow.dataset, DuckDB o polars. Las cadenas de opciones quedan una fila
+por opción y las cotizaciones una fila por extracción; el resto de los
+endpoints va como JSON crudo. El último id exportado se guarda en
+`_export_state.json`, así la corrida siguiente sigue desde ahí.
+"""
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import re
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - dependencia opcional
+    pa = None
+    pq = None
+
+from src.seedwork.enums import ExtractionStatus
+from src.seedwork.repositories import ExtractionRecord, SQLiteExtractionRepo, Timestamp
+from src.seedwork.sqlite_db import connect
+
+from src.iol.entities import RAW_DROP, TickerCotization
+from src.iol.enums import InstrumentType
+from src.iol.frames import OptionChainFrame, _naive
+from src.iol.resources import (
+    ALL_COTIZATIONS_PATH,
+    ME_PATH,
+    PORTFOLIO_PATH,
+    TICKER_COTIZATION_PATH,
+    TOKEN_PATH,
+)
+
+
+FORMAT_PARQUET = "parquet"
+FORMAT_ARROW = "arrow"
+FORMATS = (FORMAT_PARQUET, FORMAT_ARROW)
+DEFAULT_BATCH_ROWS = 250_000
+DEFAULT_COMPRESSION = "zstd"
+STATE_FILE = "_export_state.json"
+
+ENDPOINT_OPTIONS = "options"
+ENDPOINT_QUOTES = "quotes"
+ENDPOINT_PORTFOLIO = "portfolio"
+ENDPOINT_ME = "me"
+ENDPOINT_OTHER = "other"
+
+Columns = Tuple[Tuple[str, str], ...]
+
+_BASE_COLUMNS: Columns = (
+    ("extraction_id", "int64"),
+    ("fetched_at", "timestamp"),
+    ("identifier", "string"),
+)
+# Mismas columnas que OptionChainFrame.
+CHAIN_COLUMNS: Columns = _BASE_COLUMNS + (
+    ("country", "string"),
+    ("instrument", "string"),
+    ("symbol", "string"),
+    ("option_type", "string"),
+    ("last_price", "float64"),
+    ("variation", "float64"),
+    ("volume", "float64"),
+    ("trade_count", "float64"),
+    ("timestamp", "timestamp"),
+    ("bid_price", "float64"),
+    ("bid_size", "float64"),
+    ("ask_price", "float64"),
+    ("ask_size", "float64"),
+    ("strike", "float64"),
+    ("expiry", "timestamp"),
+)
+# Atributos de TickerCotization, salvo las puntas (mejor bid/ask).
+_QUOTE_ATTRIBUTES: Columns = (
+    ("symbol", "string"),
+    ("last_price", "float64"),
+    ("variation", "float64"),
+    ("open_price", "float64"),
+    ("high", "float64"),
+    ("low", "float64"),
+    ("previous_close", "float64"),
+    ("volume", "float64"),
+    ("trade_count", "float64"),
+    ("amount_traded", "float64"),
+    ("nominal_volume", "float64"),
+    ("average_price", "float64"),
+    ("adjusted_price", "float64"),
+    ("open_interest", "float64"),
+    ("currency", "string"),
+    ("term", "string"),
+    ("trend", "string"),
+)
+QUOTE_COLUMNS: Columns = _BASE_COLUMNS + (("market", "string"),) + _QUOTE_ATTRIBUTES + (
+    ("bid_price", "float64"),
+    ("bid_size", "float64"),
+    ("ask_price", "float64"),
+    ("ask_size", "float64"),
+    ("timestamp", "timestamp"),
+)
+RAW_COLUMNS: Columns = _BASE_COLUMNS + (
+    ("url", "string"),
+    ("status_code", "int64"),
+    ("content", "string"),
+)
+
+
+def _path_pattern(path: str) -> "re.Pattern[str]":
+    # ".../{market}/Titulos/{symbol}/..." -> ".../(?P<market>[^/]+)/Titulos/(?P<symbol>[^/]+)/..."
+    parts = re.split(r"\{(\w+)\}", path)
+    parts[1::2] = [f"(?P<{name}>[^/]+)" for name in parts[1::2]]
+    parts[0::2] = [re.escape(part) for part in parts[0::2]]
+    return re.compile("".join(parts))
+
+
+_CHAIN_URL = _path_pattern(ALL_COTIZATIONS_PATH)
+_QUOTE_URL = _path_pattern(TICKER_COTIZATION_PATH)
+_RAW_ENDPOINTS = ((_path_pattern(PORTFOLIO_PATH), ENDPOINT_PORTFOLIO), (_path_pattern(ME_PATH), ENDPOINT_ME))
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise RuntimeError("pyarrow is required to export extractions")
+
+
+def _arrow_type(kind: str) -> "pa.DataType":
+    if kind == "timestamp":
+        return pa.timestamp("ms")
+    return pa.type_for_alias(kind)
+
+
+_SCHEMAS: Dict[Columns, "pa.Schema"] = {}
+
+
+def _schema(columns: Columns) -> "pa.Schema":
+    schema = _SCHEMAS.get(columns)
+    if schema is None:
+        schema = _SCHEMAS[columns] = pa.schema([(name, _arrow_type(kind)) for name, kind in columns])
+    return schema
+
+
+def _table(columns: Columns, values: Dict[str, Any]) -> "pa.Table":
+    # from_pandas: NaN/NaT de las columnas NumPy pasan a null.
+    schema = _schema(columns)
+    arrays = [pa.array(values[column.name], type=column.type, from_pandas=True) for column in schema]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _fetched_at(record: ExtractionRecord) -> datetime:
+    return _naive(record.fetched_at)
+
+
+@dataclass
+class ExportResult:
+    extractions: int = 0
+    rows: int = 0
+    # Extracciones sin filas: payload vacío o que no parsea.
+    skipped: int = 0
+    files: List[Path] = field(default_factory=list)
+    last_id: Optional[int] = None
+
+
+class _Partition:
+    """Filas pendientes de un (endpoint, día): tablas ya armadas + tuplas sueltas."""
+
+    __slots__ = ("columns", "tables", "rows", "first_id", "last_id")
+
+    def __init__(self, columns: Columns, first_id: int) -> None:
+        self.columns = columns
+        self.tables: List["pa.Table"] = []
+        self.rows: List[tuple] = []
+        self.first_id = first_id
+        self.last_id = first_id
+
+    def table(self) -> "pa.Table":
+        tables = list(self.tables)
+        if self.rows:
+            names = [name for name, _ in self.columns]
+            tables.append(_table(self.columns, dict(zip(names, zip(*self.rows)))))
+        return pa.concat_tables(tables) if len(tables) > 1 else tables[0]
+
+
+class ExtractionExporter:
+    """Exporta las extracciones exitosas de `repo` a `out_dir`, de a lotes de ~`batch_rows` filas.
+
+    La memoria queda acotada por el lote: al juntar `batch_rows` filas entre
+    todas las particiones se escriben los archivos y se avanza el estado.
+    Cada archivo se escribe a un `.tmp` y se renombra; si una corrida se corta
+    antes de guardar el estado, la siguiente borra sus partes huérfanas.
+    """
+
+    def __init__(
+        self,
+        repo: SQLiteExtractionRepo,
+        out_dir: Union[str, Path],
+        format: str = FORMAT_PARQUET,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        compression: Optional[str] = DEFAULT_COMPRESSION,
+    ) -> None:
+        _require_pyarrow()
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format}")
+        if batch_rows < 1:
+            raise ValueError("batch_rows must be positive")
+        self.repo = repo
+        self.out_dir = Path(out_dir)
+        self.format = format
+        self.batch_rows = batch_rows
+        self.compression = compression
+
+    # Estado
+
+    @property
+    def state_path(self) -> Path:
+        return self.out_dir / STATE_FILE
+
+    def load_state(self) -> Dict[str, Any]:
+        if not self.state_path.exists():
+            return {}
+        state = json.loads(self.state_path.read_text())
+        if state.get("format", self.format) != self.format:
+            raise ValueError(f"{self.out_dir} was exported as {state['format']}, not {self.format}")
+        return state
+
+    def last_exported_id(self) -> Optional[int]:
+        return self.load_state().get("last_id")
+
+    def _save_state(self, last_id: int) -> None:
+        state = {"last_id": last_id, "format": self.format, "updated_at": datetime.now().isoformat()}
+        tmp = self.state_path.with_name(STATE_FILE + ".tmp")
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, self.state_path)
+
+    def _discard_orphans(self, last_id: Optional[int]) -> None:
+        for path in self.out_dir.glob("endpoint=*/date=*/part-*"):
+            if path.name.endswith(".tmp"):
+                path.unlink()
+                continue
+            first_id = int(path.name.split("-")[1])
+            if last_id is None or first_id > last_id:
+                path.unlink()
+
+    # Conversión
+
+    def _convert(self, record: ExtractionRecord) -> Optional[Tuple[str, Columns, Union["pa.Table", tuple]]]:
+        """(endpoint, columnas, tabla o fila) de una extracción; None si no aporta filas."""
+        url = record.url
+        if url == TOKEN_PATH:
+            return None  # nunca exportar tokens
+
+        match = _CHAIN_URL.fullmatch(url)
+        if match:
+            content = record.content()
+            titulos = content.get("titulos") if isinstance(content, dict) else None
+            if not titulos:
+                return None  # p. ej. extracciones streameadas, que no guardan el payload
+            frame = OptionChainFrame.from_titulos(titulos)
+            rows = len(frame)
+            if not rows:
+                return None
+            instrument = str(record.params.get("cotizacionInstrumentoModel.instrumento") or "todos")
+            endpoint = ENDPOINT_OPTIONS if instrument == InstrumentType.OPTIONS else f"all_{instrument.lower()}"
+            values = {
+                "extraction_id": np.full(rows, record.id, dtype=np.int64),
+                "fetched_at": np.full(rows, _fetched_at(record), dtype="datetime64[ms]"),
+                "identifier": [record.identifier] * rows,
+                "country": [match["country"]] * rows,
+                "instrument": [instrument] * rows,
+                **frame.columns,
+            }
+            return endpoint, CHAIN_COLUMNS, _table(CHAIN_COLUMNS, values)
+
+        match = _QUOTE_URL.fullmatch(url)
+        if match:
+            content = record.content()
+            if not isinstance(content, dict):
+                return None
+            if not content.get("simbolo"):
+                content = dict(content, simbolo=match["symbol"])
+            try:
+                quote = TickerCotization.from_payload(content, raw_mode=RAW_DROP)
+            except (TypeError, ValueError):
+                return None
+            bid, ask = quote.best_bid, quote.best_ask
+            row = (
+                (record.id, _fetched_at(record), record.identifier, match["market"])
+                + tuple(getattr(quote, name) for name, _ in _QUOTE_ATTRIBUTES)
+                + (
+                    bid.bid_price if bid else None,
+                    bid.bid_size if bid else None,
+                    ask.ask_price if ask else None,
+                    ask.ask_size if ask else None,
+                    _naive(quote.timestamp),
+                )
+            )
+            return ENDPOINT_QUOTES, QUOTE_COLUMNS, row
+
+        endpoint = next((name for pattern, name in _RAW_ENDPOINTS if pattern.fullmatch(url)), ENDPOINT_OTHER)
+        content = record.content()
+        row = (
+            record.id,
+            _fetched_at(record),
+            record.identifier,
+            url,
+            record.status_code,
+            None if content is None else json.dumps(content, ensure_ascii=False, separators=(",", ":")),
+        )
+        return endpoint, RAW_COLUMNS, row
+
+    # Escritura
+
+    def _write(self, table: "pa.Table", path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        if self.format == FORMAT_PARQUET:
+            pq.write_table(table, tmp, compression=self.compression or "none")
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+
+    def _flush(self, pending: Dict[Tuple[str, str], _Partition], last_id: int, result: ExportResult) -> None:
+        for (endpoint, day), partition in pending.items():
+            table = partition.table()
+            path = (
+                self.out_dir / f"endpoint={endpoint}" / f"date={day}"
+                / f"part-{partition.first_id:012d}-{partition.last_id:012d}.{self.format}"
+            )
+            self._write(table, path)
+            result.rows += table.num_rows
+            result.files.append(path)
+        pending.clear()
+        # Recién con todas las partes escritas: un corte antes deja huérfanos, no huecos.
+        self._save_state(last_id)
+        result.last_id = last_id
+
+    def run(
+        self,
+        since: Optional[Timestamp] = None,
+        until: Optional[Timestamp] = None,
+        *,
+        url_prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        progress: Optional[Callable[[ExportResult], None]] = None,
+    ) -> ExportResult:
+        """Exporta lo posterior al último id exportado; `limit` acota las extracciones de esta corrida."""
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        after_id = self.last_exported_id()
+        self._discard_orphans(after_id)
+
+        result = ExportResult(last_id=after_id)
+        pending: Dict[Tuple[str, str], _Partition] = {}
+        buffered = 0
+        last_seen = None
+        records = self.repo.query(
+            since,
+            until,
+            url_prefix=url_prefix,
+            status=ExtractionStatus.SUCCESS,
+            after_id=after_id,
+            order_by="id",
+            limit=limit,
+        )
+        for record in records:
+            result.extractions += 1
+            last_seen = record.id
+            converted = self._convert(record)
+            if converted is None:
+                result.skipped += 1
+                continue
+            endpoint, columns, rows = converted
+            key = (endpoint, record.fetched_at.date().isoformat())
+            partition = pending.get(key)
+            if partition is None:
+                partition = pending[key] = _Partition(columns, record.id)
+            partition.last_id = record.id
+            if isinstance(rows, tuple):
+                partition.rows.append(rows)
+                buffered += 1
+            else:
+                partition.tables.append(rows)
+                buffered += rows.num_rows
+            if buffered >= self.batch_rows:
+                self._flush(pending, last_seen, result)
+                buffered = 0
+                if progress is not None:
+                    progress(result)
+
+        if last_seen is not None and (pending or last_seen != result.last_id):
+            self._flush(pending, last_seen, result)
+        return result
+
+
+def open_dataset(out_dir: Union[str, Path], endpoint: str = ENDPOINT_OPTIONS) -> Any:
+    """`pyarrow.dataset.Dataset` de un endpoint exportado, con `date` como columna de partición."""
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+
+    out_dir = Path(out_dir)
+    state_path = out_dir / STATE_FILE
+    format = json.loads(state_path.read_text())["format"] if state_path.exists() else FORMAT_PARQUET
+    return ds.dataset(
+        out_dir / f"endpoint={endpoint}",
+        format="ipc" if format == FORMAT_ARROW else format,
+        partitioning="hive",
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", required=True, help="DB con la tabla extractions")
+    parser.add_argument("--out", required=True, help="directorio destino (se retoma si ya existe)")
+    parser.add_argument("--format", choices=FORMATS, default=FORMAT_PARQUET)
+    parser.add_argument("--batch-rows", type=int, default=DEFAULT_BATCH_ROWS, help="filas en memoria por lote")
+    parser.add_argument("--compression", default=DEFAULT_COMPRESSION, help="codec (none para sin compresión)")
+    parser.add_argument("--since", help="fetched_at ISO desde (inclusive)")
+    parser.add_argument("--until", help="fetched_at ISO hasta (exclusive)")
+    parser.add_argument("--url-prefix")
+    parser.add_argument("--limit", type=int, help="máximo de extracciones en esta corrida")
+    args = parser.parse_args(argv)
+
+    exporter = ExtractionExporter(
+        SQLiteExtractionRepo(connection=connect(args.db)),
+        args.out,
+        format=args.format,
+        batch_rows=args.batch_rows,
+        compression=None if args.compression == "none" else args.compression,
+    )
+
+    def report(result: ExportResult) -> None:
+        print(f"  ... {result.extractions} extractions, {result.rows} rows (id {result.last_id})", file=sys.stderr)
+
+    result = exporter.run(args.since, args.until, url_prefix=args.url_prefix, limit=args.limit, progress=report)
+    print(
+        f"exported {result.extractions} extractions ({result.skipped} skipped) -> "
+        f"{result.rows} rows in {len(result.files)} files; last id {result.last_id}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
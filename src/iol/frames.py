@@ -0,0 +1,171 @@
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import warnings
+
+import numpy as np
+
+from src.iol.entities import Option
+from src.iol.value_objects import parse_book_entries, top_of_book
+from src.seedwork.parsing import optional_datetime, optional_float
+
+
+def _float_column(values: List[Any]) -> np.ndarray:
+    # numpy ya convierte None -> NaN y strings numéricos; solo ante basura
+    # caemos al parser fila por fila.
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        parsed = [optional_float(value) for value in values]
+        return np.array(parsed, dtype=np.float64)
+
+
+def _naive(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo is None:
+        return value
+    return value.replace(tzinfo=None)
+
+
+def _datetime_column(values: List[Any]) -> np.ndarray:
+    cleaned = [value or None for value in values]
+    # Con offset numpy pasa a UTC (y avisa); preferimos la hora local como en Option.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            return np.array(cleaned, dtype="datetime64[ms]")
+    except (TypeError, ValueError, Warning):
+        parsed = [_naive(optional_datetime(value)) for value in cleaned]
+        return np.array(parsed, dtype="datetime64[ms]")
+
+
+def _top_of_book(puntas: Any) -> Sequence[Optional[float]]:
+    bid, ask = top_of_book(parse_book_entries(puntas))
+    return (
+        None if bid is None else bid.bid_price,
+        None if bid is None else bid.bid_size,
+        None if ask is None else ask.ask_price,
+        None if ask is None else ask.ask_size,
+    )
+
+
+@dataclass
+class OptionChainFrame:
+    """Cadena de opciones en columnas NumPy, decodificada directo del payload `titulos`.
+
+    Los faltantes quedan como NaN (floats), NaT (fechas) o None (strings).
+    """
+
+    symbol: np.ndarray
+    option_type: np.ndarray
+    last_price: np.ndarray
+    variation: np.ndarray
+    volume: np.ndarray
+    trade_count: np.ndarray
+    timestamp: np.ndarray
+    bid_price: np.ndarray
+    bid_size: np.ndarray
+    ask_price: np.ndarray
+    ask_size: np.ndarray
+    strike: np.ndarray
+    expiry: np.ndarray
+
+    @classmethod
+    def from_titulos(cls, titulos: Iterable[Dict[str, Any]]) -> "OptionChainFrame":
+        symbol: List[Any] = []
+        option_type: List[Any] = []
+        last_price: List[Any] = []
+        variation: List[Any] = []
+        volume: List[Any] = []
+        trade_count: List[Any] = []
+        timestamp: List[Any] = []
+        bid_price: List[Any] = []
+        bid_size: List[Any] = []
+        ask_price: List[Any] = []
+        ask_size: List[Any] = []
+        strike: List[Any] = []
+        expiry: List[Any] = []
+
+        for payload in titulos:
+            if not isinstance(payload, dict) or not payload.get("simbolo"):
+                continue
+            symbol.append(payload["simbolo"])
+            kind = payload.get("tipoOpcion") or payload.get("tipo") or payload.get("type")
+            option_type.append(kind.upper() if kind else None)
+            last_price.append(payload.get("ultimoPrecio"))
+            variation.append(payload.get("variacionPorcentual"))
+            volume.append(payload.get("volumen"))
+            trade_count.append(payload.get("cantidadOperaciones"))
+            timestamp.append(payload.get("fecha"))
+            strike.append(
+                optional_float(payload.get("precioEjercicio"))
+                or optional_float(payload.get("strike"))
+            )
+            expiry.append(payload.get("fechaVencimiento") or payload.get("vencimiento"))
+
+            best_bid, best_bid_size, best_ask, best_ask_size = _top_of_book(payload.get("puntas"))
+            bid_price.append(best_bid)
+            bid_size.append(best_bid_size)
+            ask_price.append(best_ask)
+            ask_size.append(best_ask_size)
+
+        return cls(
+            symbol=np.array(symbol, dtype=object),
+            option_type=np.array(option_type, dtype=object),
+            last_price=_float_column(last_price),
+            variation=_float_column(variation),
+            volume=_float_column(volume),
+            trade_count=_float_column(trade_count),
+            timestamp=_datetime_column(timestamp),
+            bid_price=_float_column(bid_price),
+            bid_size=_float_column(bid_size),
+            ask_price=_float_column(ask_price),
+            ask_size=_float_column(ask_size),
+            strike=_float_column(strike),
+            expiry=_datetime_column(expiry),
+        )
+
+    @classmethod
+    def from_options(cls, options: Iterable[Option]) -> "OptionChainFrame":
+        """Igual que `from_titulos` pero desde Options ya parseadas (no necesita `raw`)."""
+        options = list(options)
+        bids = [option.best_bid for option in options]
+        asks = [option.best_ask for option in options]
+        return cls(
+            symbol=np.array([option.symbol for option in options], dtype=object),
+            option_type=np.array([option.option_type for option in options], dtype=object),
+            last_price=_float_column([option.last_price for option in options]),
+            variation=_float_column([option.variation for option in options]),
+            volume=_float_column([option.volume for option in options]),
+            trade_count=_float_column([option.trade_count for option in options]),
+            timestamp=_datetime_column([option.timestamp for option in options]),
+            bid_price=_float_column([bid.bid_price if bid else None for bid in bids]),
+            bid_size=_float_column([bid.bid_size if bid else None for bid in bids]),
+            ask_price=_float_column([ask.ask_price if ask else None for ask in asks]),
+            ask_size=_float_column([ask.ask_size if ask else None for ask in asks]),
+            strike=_float_column([option.strike for option in options]),
+            expiry=_datetime_column([option.expiry for option in options]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbol)
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @property
+    def spread(self) -> np.ndarray:
+        return self.ask_price - self.bid_price
+
+    @property
+    def mid_price(self) -> np.ndarray:
+        return (self.ask_price + self.bid_price) / 2
+
+    def take(self, selector: Any) -> "OptionChainFrame":
+        """Filtra filas con una máscara booleana o array de índices."""
+        return OptionChainFrame(**{name: column[selector] for name, column in self.columns.items()})
+
+    def to_pandas(self, copy: bool = False) -> Any:
+        import pandas as pd
+
+        return pd.DataFrame(self.columns, copy=copy)
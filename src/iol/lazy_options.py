@@ -0,0 +1,131 @@
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union, overload
+
+from src.iol.constants import OPTION_SYMBOL_PATTERN
+from src.iol.entities import RAW_KEEP, Option, option_parser
+
+
+class _OptionStore:
+    """Payloads crudos + Options ya parseadas, compartido entre una lista y sus filtros."""
+
+    __slots__ = ("payloads", "options", "parse", "_symbols")
+
+    def __init__(self, payloads: Sequence[Mapping[str, Any]], raw_mode: str) -> None:
+        self.payloads = payloads
+        self.options: List[Optional[Option]] = [None] * len(payloads)
+        self.parse = option_parser(raw_mode)
+        self._symbols: Optional[List[str]] = None
+
+    @property
+    def symbols(self) -> List[str]:
+        if self._symbols is None:
+            self._symbols = [payload.get("simbolo") or "" for payload in self.payloads]
+        return self._symbols
+
+    def option(self, row: int) -> Option:
+        option = self.options[row]
+        if option is None:
+            option = self.options[row] = self.parse(self.payloads[row])
+        return option
+
+
+class LazyOptionList(Sequence[Option]):
+    """Secuencia de Options sobre el payload `titulos` que parsea cada fila al accederla.
+
+    Los filtros (`underlying`, `prefix`, `where`) miran solo `simbolo` y
+    devuelven otra LazyOptionList que comparte las Options ya parseadas. Una
+    fila sin símbolo recién falla (ValueError) cuando se la accede.
+    """
+
+    __slots__ = ("_store", "_rows", "_index")
+
+    def __init__(
+        self,
+        payloads: Sequence[Mapping[str, Any]],
+        raw_mode: str = RAW_KEEP,
+        *,
+        _store: Optional[_OptionStore] = None,
+        _rows: Optional[Sequence[int]] = None,
+    ) -> None:
+        self._store = _store or _OptionStore(payloads, raw_mode)
+        self._rows: Sequence[int] = range(len(payloads)) if _rows is None else _rows
+        self._index: Optional[Dict[str, int]] = None
+
+    def _view(self, rows: Sequence[int]) -> "LazyOptionList":
+        return LazyOptionList(self._store.payloads, _store=self._store, _rows=rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> Option: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LazyOptionList": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Option, "LazyOptionList"]:
+        if isinstance(index, slice):
+            return self._view(self._rows[index])
+        return self._store.option(self._rows[index])
+
+    def __iter__(self) -> Iterator[Option]:
+        option = self._store.option
+        for row in self._rows:
+            yield option(row)
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, str):
+            return item in self._symbol_index()
+        return super().__contains__(item)
+
+    def __repr__(self) -> str:
+        return f"LazyOptionList({len(self)} options, {self.parsed} parsed)"
+
+    @property
+    def symbols(self) -> List[str]:
+        symbols = self._store.symbols
+        return [symbols[row] for row in self._rows]
+
+    @property
+    def parsed(self) -> int:
+        """Cuántas filas de esta vista ya se materializaron."""
+        options = self._store.options
+        return sum(options[row] is not None for row in self._rows)
+
+    def _symbol_index(self) -> Dict[str, int]:
+        if self._index is None:
+            symbols = self._store.symbols
+            index: Dict[str, int] = {}
+            for row in self._rows:
+                # Ante símbolos repetidos gana el primero, como en una búsqueda lineal.
+                index.setdefault(symbols[row], row)
+            index.pop("", None)
+            self._index = index
+        return self._index
+
+    def get(self, symbol: str, default: Optional[Option] = None) -> Optional[Option]:
+        row = self._symbol_index().get(symbol)
+        return default if row is None else self._store.option(row)
+
+    def where(self, predicate: Callable[[str], bool]) -> "LazyOptionList":
+        """Filas cuyo símbolo cumple `predicate`, sin parsear el resto."""
+        symbols = self._store.symbols
+        return self._view([row for row in self._rows if predicate(symbols[row])])
+
+    def prefix(self, prefix: str) -> "LazyOptionList":
+        return self.where(lambda symbol: symbol.startswith(prefix))
+
+    def underlying(self, underlying: str) -> "LazyOptionList":
+        return self.where(lambda symbol: _underlying(symbol) == underlying)
+
+    def underlyings(self) -> Tuple[str, ...]:
+        found = {_underlying(symbol) for symbol in self.symbols}
+        found.discard(None)
+        return tuple(sorted(found))  # type: ignore[arg-type]
+
+    def to_list(self) -> List[Option]:
+        return list(self)
+
+
+def _underlying(symbol: str) -> Optional[str]:
+    match = OPTION_SYMBOL_PATTERN.search(symbol)
+    return match["underlying"] if match else None
@@ -0,0 +1,267 @@
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from src.iol.constants import OPTION_SYMBOL_PATTERN, OPTION_TYPES
+from src.iol.entities import Option
+from src.iol.frames import OptionChainFrame
+
+
+ATM_THRESHOLD = 0.03
+# Los strikes vienen codificados en el símbolo; si superan 3x el spot están en décimas.
+STRIKE_SCALE_THRESHOLD = 3
+STRIKE_SCALE = 10
+
+Slice = Tuple[int, int]
+GroupKey = Tuple[str, str, Any]
+
+
+def _expiry_key(value: np.datetime64) -> Any:
+    return value.astype("datetime64[D]").item()
+
+
+def _parse_symbols(symbols: np.ndarray) -> Tuple[np.ndarray, List[Optional[str]], List[Optional[str]], np.ndarray]:
+    valid = np.zeros(len(symbols), dtype=bool)
+    underlying: List[Optional[str]] = []
+    option_type: List[Optional[str]] = []
+    raw_strike = np.full(len(symbols), np.nan)
+    for index, symbol in enumerate(symbols):
+        match = OPTION_SYMBOL_PATTERN.search(symbol or "")
+        if match is None:
+            underlying.append(None)
+            option_type.append(None)
+            continue
+        valid[index] = True
+        underlying.append(match["underlying"])
+        option_type.append(OPTION_TYPES[match["cp"]])
+        raw_strike[index] = float(match["strike"])
+    return valid, underlying, option_type, raw_strike
+
+
+def _slices(keys: List[Any]) -> Dict[Any, Slice]:
+    """Convierte claves ya ordenadas en {clave: (inicio, fin)}."""
+    slices: Dict[Any, Slice] = {}
+    start = 0
+    for index in range(1, len(keys) + 1):
+        if index == len(keys) or keys[index] != keys[start]:
+            slices[keys[start]] = (start, index)
+            start = index
+    return slices
+
+
+@dataclass
+class OptionChain:
+    """Cadena de opciones indexada por subyacente, tipo, vencimiento y strike.
+
+    Las filas quedan ordenadas por (subyacente, tipo, vencimiento, strike), así
+    cada índice es un rango contiguo y los strikes se buscan con `searchsorted`.
+    El parseo de símbolos se hace una sola vez; `with_spots` recalcula strike
+    normalizado, moneyness y bucket de forma vectorizada para cada poll.
+    """
+
+    frame: OptionChainFrame
+    underlying: np.ndarray
+    option_type: np.ndarray
+    raw_strike: np.ndarray
+    strike: np.ndarray
+    spot: np.ndarray
+    underlyings: np.ndarray
+    underlying_code: np.ndarray
+    group_id: np.ndarray
+    _by_underlying: Dict[str, Slice] = field(repr=False)
+    _by_type: Dict[Tuple[str, str], Slice] = field(repr=False)
+    _by_group: Dict[GroupKey, Slice] = field(repr=False)
+
+    @classmethod
+    def from_options(cls, options: Iterable[Option]) -> "OptionChain":
+        return cls.from_frame(OptionChainFrame.from_options(options))
+
+    @classmethod
+    def from_frame(cls, frame: OptionChainFrame) -> "OptionChain":
+        valid, underlying, option_type, raw_strike = _parse_symbols(frame.symbol)
+        frame = frame.take(valid)
+        underlying_arr = np.array(underlying, dtype=object)[valid]
+        option_type_arr = np.array(option_type, dtype=object)[valid]
+        raw_strike = raw_strike[valid]
+
+        underlyings, underlying_code = np.unique(underlying_arr.astype(str), return_inverse=True)
+        is_put = (option_type_arr == "PUT").astype(np.int8)
+        strike = np.where(np.isnan(frame.strike), raw_strike, frame.strike)
+        order = np.lexsort((strike, frame.expiry.astype(np.int64), is_put, underlying_code))
+
+        frame = frame.take(order)
+        underlying_arr = underlying_arr[order]
+        option_type_arr = option_type_arr[order]
+        underlying_code = underlying_code[order]
+
+        group_keys: List[GroupKey] = [
+            (name, kind, _expiry_key(expiry))
+            for name, kind, expiry in zip(underlying_arr, option_type_arr, frame.expiry)
+        ]
+        by_group = _slices(group_keys)
+        group_id = np.empty(len(group_keys), dtype=np.int64)
+        for number, (start, stop) in enumerate(by_group.values()):
+            group_id[start:stop] = number
+
+        return cls(
+            frame=frame,
+            underlying=underlying_arr,
+            option_type=option_type_arr,
+            raw_strike=raw_strike[order],
+            strike=strike[order],
+            spot=np.full(len(frame), np.nan),
+            underlyings=underlyings,
+            underlying_code=underlying_code,
+            group_id=group_id,
+            _by_underlying=_slices(list(underlying_arr)),
+            _by_type=_slices([key[:2] for key in group_keys]),
+            _by_group=by_group,
+        )
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def with_spots(self, spots: Mapping[str, float]) -> "OptionChain":
+        """Aplica precios spot por subyacente y reordena cada grupo por strike normalizado."""
+        spot_by_code = np.array([spots.get(name, np.nan) for name in self.underlyings], dtype=np.float64)
+        spot = spot_by_code[self.underlying_code] if len(self) else np.empty(0)
+        scaled = self.raw_strike > spot * STRIKE_SCALE_THRESHOLD
+        normalized = np.where(scaled, self.raw_strike / STRIKE_SCALE, self.raw_strike)
+        strike = np.where(np.isnan(self.frame.strike), normalized, self.frame.strike)
+
+        # Los grupos no cambian de lugar, solo el orden dentro de cada uno.
+        order = np.lexsort((strike, self.group_id))
+        return replace(
+            self,
+            frame=self.frame.take(order),
+            underlying=self.underlying[order],
+            option_type=self.option_type[order],
+            raw_strike=self.raw_strike[order],
+            strike=strike[order],
+            spot=spot[order],
+            underlying_code=self.underlying_code[order],
+        )
+
+    @property
+    def moneyness(self) -> np.ndarray:
+        intrinsic = np.where(self.option_type == "CALL", self.spot - self.strike, self.strike - self.spot)
+        return intrinsic / self.spot
+
+    @property
+    def bucket(self) -> np.ndarray:
+        moneyness = self.moneyness
+        bucket = np.select(
+            [np.abs(moneyness) < ATM_THRESHOLD, moneyness > 0],
+            ["ATM", "ITM"],
+            default="OTM",
+        ).astype(object)
+        bucket[np.isnan(moneyness)] = None
+        return bucket
+
+    def liquid(self, min_volume: float = 5, min_trades: float = 2) -> np.ndarray:
+        """Máscara de filas con precio, volumen y operaciones mínimas."""
+        frame = self.frame
+        with np.errstate(invalid="ignore"):
+            return (frame.last_price > 0) & (frame.volume >= min_volume) & (frame.trade_count >= min_trades)
+
+    def score(self) -> np.ndarray:
+        bucket = self.bucket
+        return (
+            np.minimum(self.frame.variation, 50)
+            + np.minimum(self.frame.volume * 2, 40)
+            + np.where(bucket == "ATM", 20, 0)
+            + np.where(bucket == "OTM", 10, 0)
+        )
+
+    def select(
+        self,
+        underlying: str,
+        option_type: Optional[str] = None,
+        expiry: Any = None,
+    ) -> np.ndarray:
+        """Índices de fila para el subyacente, opcionalmente por tipo y vencimiento."""
+        if option_type is None:
+            start, stop = self._by_underlying.get(underlying, (0, 0))
+            return np.arange(start, stop)
+        if expiry is None:
+            start, stop = self._by_type.get((underlying, option_type), (0, 0))
+            return np.arange(start, stop)
+        start, stop = self._by_group.get((underlying, option_type, expiry), (0, 0))
+        return np.arange(start, stop)
+
+    def _groups(self, underlying: str, option_type: str, expiry: Any) -> List[Slice]:
+        if expiry is not None:
+            found = self._by_group.get((underlying, option_type, expiry))
+            return [found] if found else []
+        return [
+            bounds
+            for (name, kind, _), bounds in self._by_group.items()
+            if name == underlying and kind == option_type
+        ]
+
+    def strikes_between(
+        self,
+        underlying: str,
+        option_type: str,
+        low: float,
+        high: float,
+        expiry: Any = None,
+    ) -> np.ndarray:
+        """Índices con strike en [low, high], por búsqueda binaria en cada grupo."""
+        found: List[np.ndarray] = []
+        for start, stop in self._groups(underlying, option_type, expiry):
+            strikes = self.strike[start:stop]
+            left = np.searchsorted(strikes, low, side="left")
+            right = np.searchsorted(strikes, high, side="right")
+            found.append(np.arange(start + left, start + right))
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def nearest_strike(
+        self,
+        underlying: str,
+        option_type: str,
+        strike: float,
+        expiry: Any = None,
+    ) -> Optional[int]:
+        best: Optional[int] = None
+        best_distance = np.inf
+        for start, stop in self._groups(underlying, option_type, expiry):
+            strikes = self.strike[start:stop]
+            position = int(np.searchsorted(strikes, strike))
+            for candidate in (position - 1, position):
+                if 0 <= candidate < len(strikes):
+                    distance = abs(strikes[candidate] - strike)
+                    if distance < best_distance:
+                        best, best_distance = start + candidate, distance
+        return best
+
+    def top_k(self, k: int, scores: Optional[np.ndarray] = None, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Índices de los k mayores scores (selección parcial + orden de solo k elementos)."""
+        scores = self.score() if scores is None else scores
+        scores = np.where(np.isnan(scores), -np.inf, scores)
+        candidates = np.arange(len(scores))
+        if mask is not None:
+            candidates = candidates[mask]
+        k = min(k, len(candidates))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        values = scores[candidates]
+        partition = np.argpartition(-values, k - 1)[:k]
+        return candidates[partition[np.argsort(-values[partition], kind="stable")]]
+
+    def to_pandas(self, rows: Optional[np.ndarray] = None) -> Any:
+        import pandas as pd
+
+        columns: Dict[str, Any] = dict(self.frame.columns)
+        columns.update(
+            underlying=self.underlying,
+            option_type=self.option_type,
+            raw_strike=self.raw_strike,
+            strike=self.strike,
+            spot=self.spot,
+            moneyness=self.moneyness,
+            bucket=self.bucket,
+        )
+        frame = pd.DataFrame(columns, copy=False)
+        return frame if rows is None else frame.iloc[rows]
@@ -0,0 +1,148 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from src.seedwork.snapshots import SQLiteSnapshotRepo
+
+from src.iol.client import IOLClient
+from src.iol.entities import Option
+from src.iol.enums import Country
+
+
+TRACKED_FIELDS = ("last_price", "variation", "volume", "trade_count", "book_entries")
+
+Fingerprint = Tuple[Any, ...]
+
+
+def _fingerprint(option: Option, fields: Tuple[str, ...]) -> Fingerprint:
+    values = []
+    for name in fields:
+        value = getattr(option, name)
+        values.append(tuple(value) if isinstance(value, list) else value)
+    return tuple(values)
+
+
+@dataclass(frozen=True)
+class QuoteChange:
+    symbol: str
+    option: Option
+    changes: Dict[str, Tuple[Any, Any]]
+
+
+@dataclass
+class ChainDelta:
+    polled_at: datetime
+    elapsed: float
+    added: List[Option] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[QuoteChange] = field(default_factory=list)
+    overrun: bool = False
+    missed_ticks: int = 0
+    failed: bool = False
+    # Excepción del fetch si el poll falló por error (red, token, ...).
+    error: Optional[Exception] = None
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+@dataclass
+class QuotePoller:
+    """Pollea la cadena de opciones y emite solo lo que cambió desde el poll anterior.
+
+    Se usa como async iterator (`async for delta in poller`). Los ticks son a
+    intervalo fijo; si un poll tarda más que `interval` el delta sale marcado
+    con `overrun` y los ticks perdidos se saltean en vez de acumularse. Una
+    cadena vacía o un error del fetch se toman como poll fallido (`failed`,
+    con `error`): no tocan el snapshot y el loop sigue en el próximo tick.
+    Con `snapshots` cada poll exitoso se persiste de forma incremental.
+    """
+
+    client: IOLClient
+    interval: float = 5.0
+    country: Country = Country.ARG
+    fields: Tuple[str, ...] = TRACKED_FIELDS
+    emit_empty: bool = False
+    snapshots: Optional[SQLiteSnapshotRepo] = None
+    stream: str = "options"
+    overruns: int = 0
+    polls: int = 0
+    failures: int = 0
+    _snapshot: Dict[str, Fingerprint] = field(default_factory=dict, init=False, repr=False)
+    _stopped: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._snapshot)
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    def diff(self, options: List[Option], polled_at: Optional[datetime] = None, elapsed: float = 0.0) -> ChainDelta:
+        delta = ChainDelta(polled_at=polled_at or datetime.now(), elapsed=elapsed)
+        previous = self._snapshot
+        current: Dict[str, Fingerprint] = {}
+
+        for option in options:
+            fingerprint = _fingerprint(option, self.fields)
+            current[option.symbol] = fingerprint
+            before = previous.get(option.symbol)
+            if before is None:
+                delta.added.append(option)
+            elif before != fingerprint:
+                changes = {
+                    name: (old, new)
+                    for name, old, new in zip(self.fields, before, fingerprint)
+                    if old != new
+                }
+                delta.changed.append(QuoteChange(option.symbol, option, changes))
+
+        delta.removed = [symbol for symbol in previous if symbol not in current]
+        self._snapshot = current
+        return delta
+
+    async def poll(self) -> ChainDelta:
+        started = time.monotonic()
+        polled_at = datetime.now()
+        error: Optional[Exception] = None
+        try:
+            options = await self.client.fetch_all_options(country=self.country)
+        except Exception as exc:
+            options, error = [], exc
+        elapsed = time.monotonic() - started
+        self.polls += 1
+        if not options:
+            self.failures += 1
+            return ChainDelta(polled_at=polled_at, elapsed=elapsed, failed=True, error=error)
+        if self.snapshots is not None:
+            rows = {option.symbol: dict(option.raw) for option in options}
+            await asyncio.to_thread(self.snapshots.save, self.stream, rows, polled_at)
+        return self.diff(options, polled_at=polled_at, elapsed=elapsed)
+
+    def __aiter__(self) -> AsyncIterator[ChainDelta]:
+        return self.deltas()
+
+    async def deltas(self) -> AsyncIterator[ChainDelta]:
+        self._stopped = False
+        next_tick = time.monotonic()
+        while not self._stopped:
+            delta = await self.poll()
+
+            next_tick += self.interval
+            now = time.monotonic()
+            if now > next_tick:
+                missed = int((now - next_tick) // self.interval) + 1
+                next_tick += missed * self.interval
+                delta.overrun = True
+                delta.missed_ticks = missed
+                self.overruns += 1
+
+            if delta.failed or delta.overrun or self.emit_empty or not delta.empty:
+                yield delta
+
+            if self._stopped:
+                break
+            await asyncio.sleep(max(next_tick - time.monotonic(), 0))
@@ -0,0 +1,122 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import inspect
+import itertools
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+from src.seedwork.interfaces import AuthService, AsyncAuthService
+
+from src.iol.client import IOLClient
+
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+DEFAULT_COOLDOWN = 60.0
+
+
+@dataclass
+class AccountState:
+    identifier: str
+    inflight: int = 0
+    served: int = 0
+    failures: int = 0
+    down_until: float = 0.0
+    last_error: Optional[BaseException] = None
+
+    @property
+    def available(self) -> bool:
+        return self.down_until <= time.monotonic()
+
+
+@dataclass
+class IOLClientPool(IOLClient):
+    """IOLClient que reparte los requests de solo lectura entre varias cuentas.
+
+    Cotizaciones y cadenas de opciones van a la cuenta elegida por `strategy`
+    (round robin o la de menos requests en vuelo); perfil y portafolio siguen
+    yendo a `identifier`. Una cuenta cuyo token no se puede obtener/renovar
+    sale de rotación por `cooldown` segundos.
+    """
+
+    auth_service: Union[AuthService[str], AsyncAuthService[str]]
+    identifiers: Sequence[str]
+    strategy: str = LEAST_LOADED
+    cooldown: float = DEFAULT_COOLDOWN
+    _accounts: Dict[str, AccountState] = field(default_factory=dict, init=False, repr=False)
+    _cycle: Any = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.strategy not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError(f"Unknown strategy {self.strategy}")
+        self._accounts = {identifier: AccountState(identifier) for identifier in self.identifiers}
+        self._cycle = itertools.cycle(list(self._accounts))
+
+    @property
+    def accounts(self) -> List[AccountState]:
+        return list(self._accounts.values())
+
+    async def _get_token(self, identifier: str) -> None:
+        result = self.auth_service.get(identifier)
+        if inspect.isawaitable(result):
+            await result
+
+    async def _authenticate(self, state: AccountState) -> bool:
+        try:
+            await self._get_token(state.identifier)
+        except Exception as exc:
+            self._mark_down(state, exc)
+            return False
+        state.down_until = 0.0
+        return True
+
+    def _mark_down(self, state: AccountState, exc: BaseException) -> None:
+        state.failures += 1
+        state.last_error = exc
+        state.down_until = time.monotonic() + self.cooldown
+
+    async def start(self, refresh_in_background: bool = True) -> List[str]:
+        """Autentica todas las cuentas en paralelo; devuelve las que quedaron activas."""
+        results = await asyncio.gather(*(self._authenticate(state) for state in self.accounts))
+        active = [state.identifier for state, ok in zip(self.accounts, results) if ok]
+        start_refresher = getattr(self.auth_service, "start_refresher", None)
+        if refresh_in_background and start_refresher is not None:
+            for identifier in active:
+                start_refresher(identifier)
+        return active
+
+    def _pick(self, excluded: set) -> AccountState:
+        candidates = [
+            state for state in self._accounts.values()
+            if state.available and state.identifier not in excluded
+        ]
+        if not candidates:
+            raise RuntimeError("No IOL accounts available in the pool")
+        if self.strategy == LEAST_LOADED:
+            return min(candidates, key=lambda state: (state.inflight, state.served))
+        while True:
+            state = self._accounts[next(self._cycle)]
+            if state in candidates:
+                return state
+
+    @asynccontextmanager
+    async def _lease(self) -> AsyncIterator[str]:
+        excluded: set = set()
+        while True:
+            state = self._pick(excluded)
+            state.inflight += 1
+            try:
+                await self._get_token(state.identifier)
+            except Exception as exc:
+                state.inflight -= 1
+                self._mark_down(state, exc)
+                excluded.add(state.identifier)
+                continue
+            break
+
+        try:
+            yield state.identifier
+        finally:
+            state.inflight -= 1
+            state.served += 1
@@ -1,4 +1,5 @@
 from src.seedwork.entities import Request
+from src.seedwork.rate_limit import RateLimit
 from src.seedwork.enums import ExtractionType, RequestMethod
 
 from src.iol.constants import HOST, API_ROOT_V2
@@ -64,4 +65,30 @@ class GetAllCotizationsRequest(Request):
                 "cotizacionInstrumentoModel.pais": country
             },
             method=RequestMethod.GET,
-        )
\ No newline at end of file
+        )
+
+
+# TTLs sugeridos (segundos) para CachedExtractionService.
+DEFAULT_CACHE_TTLS = {
+    MeRequest: 60.0,
+    PortfolioRequest: 1.0,
+    TickerCotizationRequest: 1.0,
+    GetAllCotizationsRequest: 1.0,
+}
+
+
+TOKEN_RATE_LIMIT = RateLimit(name="token", rate=0.5, burst=2)
+PROFILE_RATE_LIMIT = RateLimit(name="profile", rate=1.0, burst=2)
+PORTFOLIO_RATE_LIMIT = RateLimit(name="portfolio", rate=2.0, burst=4)
+QUOTES_RATE_LIMIT = RateLimit(name="quotes", rate=20.0, burst=40)
+
+# Límites por identifier y clase de endpoint para RateLimiter; ajustar a lo
+# que tolere la cuenta antes de que IOL empiece a devolver 429.
+DEFAULT_RATE_LIMITS = {
+    AuthenticateRequest: TOKEN_RATE_LIMIT,
+    RefreshTokenRequest: TOKEN_RATE_LIMIT,
+    MeRequest: PROFILE_RATE_LIMIT,
+    PortfolioRequest: PORTFOLIO_RATE_LIMIT,
+    TickerCotizationRequest: QUOTES_RATE_LIMIT,
+    GetAllCotizationsRequest: QUOTES_RATE_LIMIT,
+}
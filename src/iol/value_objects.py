@@ -1,15 +1,10 @@
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.seedwork.parsing import optional_float
 
-def _parse_float(value: Any) -> Optional[float]:
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookEntry:
     bid_price: float
     bid_size: float
@@ -17,21 +12,46 @@ class BookEntry:
     ask_size: float
 
     @classmethod
-    def from_payload(cls, payload: Dict[str, Any]) -> "BookEntry":
-        if not isinstance(payload, dict):
-            return None
-
-        bid_price = _parse_float(payload.get("precioCompra"))
-        ask_price = _parse_float(payload.get("precioVenta"))
-        bid_size = _parse_float(payload.get("cantidadCompra")) or 0.0
-        ask_size = _parse_float(payload.get("cantidadVenta")) or 0.0
-
+    def from_payload(cls, payload: Dict[str, Any]) -> Optional["BookEntry"]:
+        entries = parse_book_entries([payload])
+        return entries[0] if entries else None
+
+
+def parse_book_entries(payload: Any) -> Tuple[BookEntry, ...]:
+    """Puntas de un payload `puntas`; se saltean las que no son dict o no tienen precio."""
+    if not isinstance(payload, list):
+        return ()
+    entries: List[BookEntry] = []
+    append = entries.append
+    for item in payload:
+        if not isinstance(item, dict):
+            continue
+        get = item.get
+        # El JSON ya trae floats: el camino rápido de optional_float va inline.
+        bid_price = get("precioCompra")
+        if type(bid_price) is not float:
+            bid_price = optional_float(bid_price)
+        ask_price = get("precioVenta")
+        if type(ask_price) is not float:
+            ask_price = optional_float(ask_price)
         if bid_price is None and ask_price is None:
-            return None
-
-        return cls(
-            bid_price=bid_price or 0.0,
-            bid_size=bid_size,
-            ask_price=ask_price or 0.0,
-            ask_size=ask_size,
-        )
+            continue
+        bid_size = get("cantidadCompra")
+        if type(bid_size) is not float:
+            bid_size = optional_float(bid_size)
+        ask_size = get("cantidadVenta")
+        if type(ask_size) is not float:
+            ask_size = optional_float(ask_size)
+        append(BookEntry(bid_price or 0.0, bid_size or 0.0, ask_price or 0.0, ask_size or 0.0))
+    return tuple(entries)
+
+
+def top_of_book(entries: Tuple[BookEntry, ...]) -> Tuple[Optional[BookEntry], Optional[BookEntry]]:
+    """Mejor compra y mejor venta en una pasada; ante empates gana la primera punta."""
+    bid = ask = None
+    for entry in entries:
+        if entry.bid_price > 0 and (bid is None or entry.bid_price > bid.bid_price):
+            bid = entry
+        if entry.ask_price > 0 and (ask is None or entry.ask_price < ask.ask_price):
+            ask = entry
+    return bid, ask
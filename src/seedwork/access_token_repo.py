@@ -1,13 +1,26 @@
 from datetime import datetime
 import sqlite3
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 from .interfaces import AccessTokenRepo
 from .sqlite_db import get_shared_connection
 from .value_objects import AccessToken
 
 
+class InMemoryAccessTokenRepo(AccessTokenRepo[str]):
+    tokens: Dict[str, AccessToken]
+
+    def __init__(self) -> None:
+        self.tokens = {}
+
+    def get(self, identifier: str) -> Optional[AccessToken]:
+        return self.tokens.get(identifier)
+
+    def save(self, identifier: str, token: AccessToken) -> None:
+        self.tokens[identifier] = token
+
+
 class SQLiteAccessTokenRepo(AccessTokenRepo[str]):
     """SQLite-backed repository for caching access tokens per identifier."""
 
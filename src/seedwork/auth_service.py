@@ -1,34 +1,202 @@
-from dataclasses import dataclass
-from typing import Optional, TypeVar
+import asyncio
+from dataclasses import dataclass, field
+import threading
+from typing import Dict, Optional, Tuple, TypeVar
 
-from .interfaces import AccessTokenProvider, AccessTokenRepo, AuthService
+from .interfaces import (
+    AccessTokenProvider,
+    AccessTokenRepo,
+    AsyncAccessTokenProvider,
+    AsyncAuthService,
+    AuthService,
+)
+from .metrics import METRICS, timed
 from .value_objects import AccessToken
 
 
 T = TypeVar("T")
 
+DEFAULT_REFRESH_MARGIN = 30.0
+REFRESH_RETRY_DELAY = 5.0
+
 
 @dataclass
 class StandardAuthService(AuthService[T]):
-    """AuthService that caches tokens in a repository and refreshes when needed."""
+    """AuthService that caches tokens in memory and in a repository and refreshes when needed.
+
+    Concurrent callers for the same identifier share a single refresh/auth call.
+    `start_refresher` renews the token in a background thread `refresh_margin`
+    seconds before its caducity, so `get` only renews if that thread fell behind.
+    """
 
     token_provider: AccessTokenProvider[T]
     token_repo: AccessTokenRepo[T]
+    refresh_margin: float = DEFAULT_REFRESH_MARGIN
+    _tokens: Dict[T, AccessToken] = field(default_factory=dict, init=False, repr=False)
+    _locks: Dict[T, threading.Lock] = field(default_factory=dict, init=False, repr=False)
+    _locks_guard: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _refreshers: Dict[T, Tuple[threading.Thread, threading.Event]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
+    def _lock(self, identifier: T) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(identifier, threading.Lock())
+
+    @timed("auth_get", endpoint="identifier")
     def get(self, identifier: T) -> AccessToken:
-        cached = self.token_repo.get(identifier)
-        if cached and not cached.is_expired:
+        token = self._tokens.get(identifier)
+        if token and not token.is_expired:
+            return token
+        return self._renew(identifier, stale=token)
+
+    def _renew(self, identifier: T, stale: Optional[AccessToken], force: bool = False) -> AccessToken:
+        with self._lock(identifier):
+            cached = self._tokens.get(identifier) or self.token_repo.get(identifier)
+            # Otro caller ya renovó mientras esperábamos el lock.
+            if cached and not cached.is_expired and (not force or cached is not stale):
+                self._tokens[identifier] = cached
+                return cached
+
+            token: Optional[AccessToken] = None
+            renewal = "refresh"
+            if cached and cached.refresh_token:
+                try:
+                    token = self.token_provider.refresh(identifier, cached.refresh_token)
+                except Exception:
+                    token = None
+
+            if token is None:
+                renewal = "auth"
+                token = self.token_provider.auth(identifier)
+            METRICS.inc("auth_renewals", endpoint=str(identifier), outcome=renewal)
+
+            self.token_repo.save(identifier, token)
+            self._tokens[identifier] = token
+            return token
+
+    def _refresh_loop(self, identifier: T, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                token = self.get(identifier)
+                # Piso de espera: con un token ya dentro del margen no renovar en loop.
+                if stop.wait(max(token.seconds_left() - self.refresh_margin, REFRESH_RETRY_DELAY)):
+                    return
+                self._renew(identifier, stale=token, force=True)
+            except Exception:
+                stop.wait(REFRESH_RETRY_DELAY)
+
+    def start_refresher(self, identifier: T) -> threading.Thread:
+        """Un refresher por identifier; si ya hay uno vivo lo devuelve."""
+        with self._locks_guard:
+            running = self._refreshers.get(identifier)
+            if running is not None and running[0].is_alive() and not running[1].is_set():
+                return running[0]
+            stop = threading.Event()
+            thread = threading.Thread(
+                target=self._refresh_loop,
+                args=(identifier, stop),
+                name=f"token-refresher-{identifier}",
+                daemon=True,
+            )
+            self._refreshers[identifier] = (thread, stop)
+        thread.start()
+        return thread
+
+    def stop_refreshers(self) -> None:
+        with self._locks_guard:
+            refreshers = list(self._refreshers.values())
+            self._refreshers.clear()
+        for _, stop in refreshers:
+            stop.set()
+
+
+@dataclass
+class AsyncStandardAuthService(AsyncAuthService[T]):
+    """Async AuthService; repository access runs in a worker thread to keep the loop free.
+
+    Same semantics as StandardAuthService: in-memory cache, one in-flight
+    renewal per identifier and an optional background refresher task.
+    """
+
+    token_provider: AsyncAccessTokenProvider[T]
+    token_repo: AccessTokenRepo[T]
+    refresh_margin: float = DEFAULT_REFRESH_MARGIN
+    _tokens: Dict[T, AccessToken] = field(default_factory=dict, init=False, repr=False)
+    _inflight: Dict[T, "asyncio.Task[AccessToken]"] = field(default_factory=dict, init=False, repr=False)
+    _refreshers: Dict[T, "asyncio.Task[None]"] = field(default_factory=dict, init=False, repr=False)
+
+    @timed("auth_get", endpoint="identifier")
+    async def get(self, identifier: T) -> AccessToken:
+        token = self._tokens.get(identifier)
+        if token and not token.is_expired:
+            return token
+        return await self._renew(identifier, stale=token)
+
+    async def _renew(self, identifier: T, stale: Optional[AccessToken], force: bool = False) -> AccessToken:
+        while True:
+            task = self._inflight.get(identifier)
+            if task is None:
+                task = asyncio.ensure_future(self._acquire(identifier, stale, force))
+                self._inflight[identifier] = task
+                task.add_done_callback(lambda done: self._forget_inflight(identifier, done))
+            # shield: si un caller se cancela, la renovación sigue para los demás.
+            token = await asyncio.shield(task)
+            # Un renew no forzado que ya estaba en vuelo puede devolver el mismo
+            # token por vencer: en ese caso se lanza uno forzado.
+            if not force or token is not stale:
+                return token
+
+    def _forget_inflight(self, identifier: T, task: "asyncio.Task[AccessToken]") -> None:
+        if self._inflight.get(identifier) is task:
+            del self._inflight[identifier]
+
+    async def _acquire(self, identifier: T, stale: Optional[AccessToken], force: bool) -> AccessToken:
+        cached = self._tokens.get(identifier)
+        if cached is None:
+            cached = await asyncio.to_thread(self.token_repo.get, identifier)
+        if cached and not cached.is_expired and (not force or cached is not stale):
+            self._tokens[identifier] = cached
             return cached
 
         token: Optional[AccessToken] = None
+        renewal = "refresh"
         if cached and cached.refresh_token:
             try:
-                token = self.token_provider.refresh(identifier, cached.refresh_token)
+                token = await self.token_provider.refresh(identifier, cached.refresh_token)
             except Exception:
                 token = None
 
         if token is None:
-            token = self.token_provider.auth(identifier)
+            renewal = "auth"
+            token = await self.token_provider.auth(identifier)
+        METRICS.inc("auth_renewals", endpoint=str(identifier), outcome=renewal)
 
-        self.token_repo.save(identifier, token)
+        await asyncio.to_thread(self.token_repo.save, identifier, token)
+        self._tokens[identifier] = token
         return token
+
+    async def _refresh_loop(self, identifier: T) -> None:
+        while True:
+            try:
+                token = await self.get(identifier)
+                await asyncio.sleep(max(token.seconds_left() - self.refresh_margin, REFRESH_RETRY_DELAY))
+                await self._renew(identifier, stale=token, force=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await asyncio.sleep(REFRESH_RETRY_DELAY)
+
+    def start_refresher(self, identifier: T) -> "asyncio.Task[None]":
+        task = self._refreshers.get(identifier)
+        if task is None or task.done():
+            task = asyncio.get_running_loop().create_task(self._refresh_loop(identifier))
+            self._refreshers[identifier] = task
+        return task
+
+    async def stop_refreshers(self) -> None:
+        tasks = list(self._refreshers.values())
+        self._refreshers.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,169 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Hashable, Mapping, Optional, Type
+
+from .entities import Extraction, Request
+from .interfaces import ExtractionService
+
+
+def _freeze(value: Any) -> str:
+    return json.dumps(value, default=str, sort_keys=True, separators=(",", ":"))
+
+
+def request_cache_key(identifier: str, request: Request) -> Hashable:
+    return (
+        identifier,
+        request.method.value,
+        request.url,
+        _freeze(request.params),
+        _freeze(request.json),
+    )
+
+
+# Sin el tamaño del body (respuestas que no vinieron de la red): bytes por item.
+ESTIMATED_ITEM_BYTES = 512
+
+
+def _payload_size(extraction: Extraction) -> int:
+    """Bytes del body guardado, o una estimación barata; nunca re-serializa el payload."""
+    for attempt in reversed(extraction.attempts):
+        if attempt.success and attempt.response.size is not None:
+            return attempt.response.size
+    content = extraction.data
+    if not isinstance(content, dict):
+        return ESTIMATED_ITEM_BYTES
+    items = len(content) + sum(len(value) for value in content.values() if isinstance(value, (list, dict)))
+    return max(items, 1) * ESTIMATED_ITEM_BYTES
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    extraction: Extraction
+    expires_at: float
+    size: int
+
+
+@dataclass
+class CachedExtractionService(ExtractionService):
+    """Cache TTL + LRU delante de otro ExtractionService.
+
+    El TTL se elige por clase de Request (`ttls`, respetando herencia) con
+    `default_ttl` como fallback; TTL 0 desactiva el cache para esa clase.
+    Requests idénticos en vuelo se resuelven con una sola llamada al servicio
+    interno. Solo se cachean extracciones exitosas; al superar `max_entries` o
+    `max_bytes` (bytes del body recibido, o una estimación) se descartan las
+    menos usadas.
+    """
+
+    service: ExtractionService
+    ttls: Mapping[Type[Request], float] = field(default_factory=dict)
+    default_ttl: float = 0.0
+    max_entries: int = 1024
+    max_bytes: int = 256 * 1024 * 1024
+    stats: CacheStats = field(default_factory=CacheStats)
+    _entries: "OrderedDict[Hashable, _Entry]" = field(default_factory=OrderedDict, init=False, repr=False)
+    _inflight: Dict[Hashable, "asyncio.Future[Extraction]"] = field(default_factory=dict, init=False, repr=False)
+    _bytes: int = field(default=0, init=False, repr=False)
+
+    @property
+    def extractor(self) -> Any:  # type: ignore[override]
+        return self.service.extractor
+
+    @property
+    def extraction_repo(self) -> Any:  # type: ignore[override]
+        return self.service.extraction_repo
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, request: Request) -> float:
+        for klass in type(request).__mro__:
+            if klass in self.ttls:
+                return self.ttls[klass]
+        return self.default_ttl
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    async def extract(self, identifier: str, request: Request) -> Extraction:
+        ttl = self.ttl_for(request)
+        if ttl <= 0:
+            return await self.service.extract(identifier, request)
+
+        key = request_cache_key(identifier, request)
+        entry = self._lookup(key)
+        if entry is not None:
+            self.stats.hits += 1
+            return entry.extraction
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(pending)
+
+        self.stats.misses += 1
+        task = asyncio.ensure_future(self.service.extract(identifier, request))
+        self._inflight[key] = task
+        try:
+            extraction = await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._inflight.pop(key, None)
+            else:
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        if extraction.success:
+            self._store(key, extraction, ttl)
+        return extraction
+
+    async def stream(self, identifier: str, request: Request, key: Optional[str] = None) -> AsyncIterator[Any]:
+        async for item in self.service.stream(identifier, request, key=key):
+            yield item
+
+    def _lookup(self, key: Hashable) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _store(self, key: Hashable, extraction: Extraction, ttl: float) -> None:
+        size = _payload_size(extraction)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = _Entry(extraction, time.monotonic() + ttl, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.stats.evictions += 1
@@ -1,19 +1,30 @@
-from dataclasses import dataclass
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 import time
-from typing import Dict, Any, List
+from typing import AsyncIterator, Dict, Any, Iterator, List, Optional
 
 import httpx
 
 from .entities import Attempt, Request
-from .interfaces import HttpClient
+from .interfaces import AsyncHttpClient, HttpClient
+from .metrics import METRICS, endpoint_label, timed
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
 from .value_objects import APIResponse
 
 
+def _status_outcome(response: APIResponse) -> str:
+    return str(response.status_code)
+
+
 @dataclass
 class HttpxClientAdapter(HttpClient):
     """Adaptador que conecta httpx con HttpClient del seedwork."""
     client: httpx.Client
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    rate_limiter: Optional[RateLimiter] = None
 
     def _safe_json(self, response: httpx.Response) -> Dict[str, Any]:
         try:
@@ -21,7 +32,11 @@ class HttpxClientAdapter(HttpClient):
         except ValueError:
             return {}
 
+    @timed("http_request", endpoint="request", outcome=_status_outcome)
     def _request(self, request: Request) -> APIResponse:  # type: ignore[override]
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire(request)
+            METRICS.observe("rate_limit_wait", waited, endpoint=endpoint_label(request))
         response = self.client.request(
             request.method.value,
             request.url,
@@ -29,29 +44,135 @@ class HttpxClientAdapter(HttpClient):
             json=request.json,
             params=request.params,
         )
+        with METRICS.timer("json_decode", endpoint=endpoint_label(request)):
+            content = self._safe_json(response)
         return APIResponse(
             status_code=response.status_code,
-            content=self._safe_json(response),
+            content=content,
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            size=len(response.content),
         )
 
 
+    @contextmanager
+    def stream(self, request: Request) -> Iterator[httpx.Response]:
+        """Abre la respuesta sin leer el body; sin reintentos."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(request)
+        with self.client.stream(
+            request.method.value,
+            request.url,
+            headers=request.headers,
+            json=request.json,
+            params=request.params,
+        ) as response:
+            yield response
+
     def request(self, request: Request) -> List[Attempt]:
         attempts: List[Attempt] = []
+        policy = self.retry_policy
+        policy.start(request)
+
+        for number in range(request.retries):
+            fetched_at = datetime.now()
+            try:
+                response = self._request(request)
+            except httpx.TransportError:
+                if not policy.should_retry(request, number, None):
+                    raise
+                METRICS.inc("http_retries", endpoint=endpoint_label(request), outcome="transport_error")
+                time.sleep(policy.delay(request, number, None))
+                continue
 
-        for attempt in range(request.retries):
-            fetched_at = datetime.now()    
-            response = self._request(request)
             attempt = Attempt(
                 fetched_at=fetched_at,
                 response=response,
             )
             attempts.append(attempt)
-            
-            if attempt.success:
+
+            if attempt.success or not policy.should_retry(request, number, response):
+                break
+
+            METRICS.inc("http_retries", endpoint=endpoint_label(request), outcome=str(response.status_code))
+            time.sleep(policy.delay(request, number, response))
+
+        return attempts
+
+
+@dataclass
+class AsyncHttpxClientAdapter(AsyncHttpClient):
+    """Versión asíncrona de HttpxClientAdapter sobre httpx.AsyncClient."""
+    client: httpx.AsyncClient
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    rate_limiter: Optional[RateLimiter] = None
+
+    def _safe_json(self, response: httpx.Response) -> Dict[str, Any]:
+        try:
+            return response.json()
+        except ValueError:
+            return {}
+
+    @timed("http_request", endpoint="request", outcome=_status_outcome)
+    async def _request(self, request: Request) -> APIResponse:  # type: ignore[override]
+        if self.rate_limiter is not None:
+            waited = await self.rate_limiter.wait(request)
+            METRICS.observe("rate_limit_wait", waited, endpoint=endpoint_label(request))
+        response = await self.client.request(
+            request.method.value,
+            request.url,
+            headers=request.headers,
+            json=request.json,
+            params=request.params,
+        )
+        with METRICS.timer("json_decode", endpoint=endpoint_label(request)):
+            content = self._safe_json(response)
+        return APIResponse(
+            status_code=response.status_code,
+            content=content,
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            size=len(response.content),
+        )
+
+    @asynccontextmanager
+    async def stream(self, request: Request) -> AsyncIterator[httpx.Response]:
+        """Abre la respuesta sin leer el body; sin reintentos."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.wait(request)
+        async with self.client.stream(
+            request.method.value,
+            request.url,
+            headers=request.headers,
+            json=request.json,
+            params=request.params,
+        ) as response:
+            yield response
+
+    async def request(self, request: Request) -> List[Attempt]:
+        attempts: List[Attempt] = []
+        policy = self.retry_policy
+        policy.start(request)
+
+        for number in range(request.retries):
+            fetched_at = datetime.now()
+            try:
+                response = await self._request(request)
+            except httpx.TransportError:
+                if not policy.should_retry(request, number, None):
+                    raise
+                METRICS.inc("http_retries", endpoint=endpoint_label(request), outcome="transport_error")
+                await asyncio.sleep(policy.delay(request, number, None))
+                continue
+
+            attempt = Attempt(
+                fetched_at=fetched_at,
+                response=response,
+            )
+            attempts.append(attempt)
+
+            if attempt.success or not policy.should_retry(request, number, response):
                 break
 
-            backoff = request.backoff
-            if backoff:
-                time.sleep(backoff)
+            METRICS.inc("http_retries", endpoint=endpoint_label(request), outcome=str(response.status_code))
+            await asyncio.sleep(policy.delay(request, number, response))
 
         return attempts
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
@@ -17,6 +17,7 @@ class Request:
     params: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
     backoff: Optional[float] = None
+    identifier: Optional[str] = None
 
     @classmethod
     def create(
@@ -36,7 +37,7 @@ class Request:
             headers.update(token.as_header())
         params = dict(params) if params else {}
         
-        return Request(
+        return cls(
             url=url,
             method=method,
             headers=headers,
@@ -50,16 +51,20 @@ class Request:
         headers = self.headers.copy()
         headers.update(token.as_header())
         
-        return Request(
+        return type(self)(
             url=self.url,
             method=self.method,
             headers=headers,
             json=self.json,
             params=self.params,
             backoff=self.backoff,
-            extraction_type=self.extraction_type
+            extraction_type=self.extraction_type,
+            identifier=self.identifier,
         )
 
+    def with_identifier(self, identifier: str) -> "Request":
+        return replace(self, identifier=identifier)
+
 
 @dataclass(frozen=True)
 class Attempt:
@@ -13,3 +13,5 @@ class ExtractionType(StrEnum):
 class ExtractionStatus(StrEnum):
     SUCCESS = "SUCCESS"
     ERROR = "ERROR"
+    # 200 consumido en streaming: no se guardó el payload, solo `streamed_items`.
+    STREAMED = "STREAMED"
@@ -1,8 +1,57 @@
 from dataclasses import dataclass
+from datetime import datetime
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
 
-from .entities import Extraction, Request
+from .entities import Attempt, Extraction, Request
 from .enums import ExtractionStatus
-from .interfaces import Extractor, AuthService, HttpClient
+from .interfaces import (
+    AsyncAuthService,
+    AsyncExtractor,
+    AsyncHttpClient,
+    AuthService,
+    Extractor,
+    HttpClient,
+)
+from .metrics import timed
+from .streaming import JSONArrayStream
+from .value_objects import APIResponse
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _error_content(body: bytes) -> Dict[str, Any]:
+    try:
+        content = json.loads(body)
+    except ValueError:
+        return {}
+    return content if isinstance(content, dict) else {}
+
+
+def _status_outcome(extraction: Extraction) -> str:
+    return extraction.status.value
+
+
+def _streamed_extraction(
+    request: Request,
+    fetched_at: datetime,
+    status_code: int,
+    content: Dict[str, Any],
+) -> Extraction:
+    """Extraction de un request streameado; el payload no se retiene, solo su conteo.
+
+    Queda como STREAMED (no SUCCESS) para que nadie lea el conteo como la respuesta.
+    """
+    attempt = Attempt(
+        fetched_at=fetched_at,
+        response=APIResponse(status_code=status_code, content=content),
+    )
+    return Extraction(
+        request=request,
+        attempts=[attempt],
+        status=ExtractionStatus.STREAMED if attempt.success else ExtractionStatus.ERROR,
+    )
 
 
 @dataclass
@@ -15,8 +64,33 @@ class StandardExtractor(Extractor):
 
     def _apply_request_auth(self, identifier: str, request: Request) -> Request:
         token = self.auth_service.get(identifier)
-        return request.with_authorization(token)
+        return request.with_identifier(identifier).with_authorization(token)
+
+    def auth_stream(
+        self,
+        identifier: str,
+        request: Request,
+        key: Optional[str] = None,
+        on_complete: Optional[Callable[[Extraction], None]] = None,
+    ) -> Iterator[Any]:
+        """Itera los elementos del array `key` a medida que llegan los bytes."""
+        request = self._apply_request_auth(identifier, request)
+        fetched_at = datetime.now()
+        decoder = JSONArrayStream(key)
+
+        with self.client.stream(request) as response:
+            if response.status_code == 200:
+                for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                    yield from decoder.feed(chunk)
+                yield from decoder.close()
+                content: Dict[str, Any] = {"streamed_items": decoder.count}
+            else:
+                content = _error_content(response.read())
 
+        if on_complete:
+            on_complete(_streamed_extraction(request, fetched_at, response.status_code, content))
+
+    @timed("extract", endpoint="request", outcome=_status_outcome)
     def extract(self, request: Request) -> Extraction:
         attempts = self.client.request(request=request)
         status = ExtractionStatus.SUCCESS if any(attempt.success for attempt in attempts) else ExtractionStatus.ERROR
@@ -25,3 +99,52 @@ class StandardExtractor(Extractor):
             attempts=attempts,
             status=status,
         )
+
+
+@dataclass
+class AsyncStandardExtractor(AsyncExtractor):
+    client: AsyncHttpClient
+    auth_service: AsyncAuthService[str]
+
+    async def auth_extract(self, identifier: str, request: Request) -> Extraction:
+        return await self.extract(request=await self._apply_request_auth(identifier, request))
+
+    async def _apply_request_auth(self, identifier: str, request: Request) -> Request:
+        token = await self.auth_service.get(identifier)
+        return request.with_identifier(identifier).with_authorization(token)
+
+    async def auth_stream(
+        self,
+        identifier: str,
+        request: Request,
+        key: Optional[str] = None,
+        on_complete: Optional[Callable[[Extraction], Awaitable[None]]] = None,
+    ) -> AsyncIterator[Any]:
+        """Itera los elementos del array `key` a medida que llegan los bytes."""
+        request = await self._apply_request_auth(identifier, request)
+        fetched_at = datetime.now()
+        decoder = JSONArrayStream(key)
+
+        async with self.client.stream(request) as response:
+            if response.status_code == 200:
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    for item in decoder.feed(chunk):
+                        yield item
+                for item in decoder.close():
+                    yield item
+                content: Dict[str, Any] = {"streamed_items": decoder.count}
+            else:
+                content = _error_content(await response.aread())
+
+        if on_complete:
+            await on_complete(_streamed_extraction(request, fetched_at, response.status_code, content))
+
+    @timed("extract", endpoint="request", outcome=_status_outcome)
+    async def extract(self, request: Request) -> Extraction:
+        attempts = await self.client.request(request=request)
+        status = ExtractionStatus.SUCCESS if any(attempt.success for attempt in attempts) else ExtractionStatus.ERROR
+        return Extraction(
+            request=request,
+            attempts=attempts,
+            status=status,
+        )
@@ -1,10 +1,12 @@
-from typing import Generator, List, Optional, Protocol, Generic, TypeVar
-
-import httpx
+from typing import TYPE_CHECKING, Any, AsyncContextManager, AsyncIterator, ContextManager, Generator, Iterator, List, Optional, Protocol, Generic, TypeVar
 
 from .value_objects import AccessToken, APIResponse
 from .entities import Attempt, Request, Extraction
 
+if TYPE_CHECKING:
+    # httpx solo hace falta para anotar; importarlo acá encarece cualquier import del seedwork.
+    import httpx
+
 
 T = TypeVar("T")
 
@@ -14,6 +16,11 @@ class AccessTokenProvider(Generic[T], Protocol):
     def refresh(self, identifier: T, refresh_token: str) -> AccessToken: ...
 
 
+class AsyncAccessTokenProvider(Generic[T], Protocol):
+    async def auth(self, identifier: T) -> AccessToken: ...
+    async def refresh(self, identifier: T, refresh_token: str) -> AccessToken: ...
+
+
 class AccessTokenRepo(Generic[T], Protocol):
     def get(self, identifier: T) -> Optional[AccessToken]: ...
     def save(self, identifier: T, token: AccessToken) -> None: ...
@@ -26,11 +33,27 @@ class AuthService(Generic[T], Protocol):
     def get(self, identifier: T) -> AccessToken: ...
 
 
+class AsyncAuthService(Generic[T], Protocol):
+    token_provider: AsyncAccessTokenProvider[T]
+    token_repo: AccessTokenRepo[T]
+
+    async def get(self, identifier: T) -> AccessToken: ...
+
+
 class HttpClient(Protocol):
-    client: httpx.Client
+    client: "httpx.Client"
 
     def _request(self, request: Request) -> APIResponse: ...
     def request(self, request: Request) -> List[Attempt]: ...
+    def stream(self, request: Request) -> ContextManager["httpx.Response"]: ...
+
+
+class AsyncHttpClient(Protocol):
+    client: "httpx.AsyncClient"
+
+    async def _request(self, request: Request) -> APIResponse: ...
+    async def request(self, request: Request) -> List[Attempt]: ...
+    def stream(self, request: Request) -> AsyncContextManager["httpx.Response"]: ...
 
 
 class Extractor(Protocol):
@@ -39,6 +62,16 @@ class Extractor(Protocol):
 
     def extract(self, *args, **kwargs) -> Extraction: ...
     def auth_extract(self, *args, **kwargs) -> Extraction: ...
+    def auth_stream(self, *args, **kwargs) -> Iterator[Any]: ...
+
+
+class AsyncExtractor(Protocol):
+    client: AsyncHttpClient
+    auth_service: AsyncAuthService[str]
+
+    async def extract(self, *args, **kwargs) -> Extraction: ...
+    async def auth_extract(self, *args, **kwargs) -> Extraction: ...
+    def auth_stream(self, *args, **kwargs) -> AsyncIterator[Any]: ...
 
 
 class ExtractionRepo(Protocol):
@@ -50,6 +83,7 @@ class ExtractionService(Protocol):
     extraction_repo: ExtractionRepo
 
     async def extract(self, *args, **kwargs) -> Extraction: ...
+    def stream(self, *args, **kwargs) -> AsyncIterator[Any]: ...
 
 
 class RequestBuilder(Protocol):
@@ -0,0 +1,263 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import functools
+import inspect
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from .entities import Request
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Buckets (segundos) pensados para latencias de red y de SQLite.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class Histogram:
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            # Un casillero extra para +Inf.
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Cota superior del bucket donde cae el cuantil `q` (None si cae en +Inf)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return None
+
+
+class MetricsRegistry:
+    """Histogramas de latencia y contadores por etapa, con labels `endpoint`/`outcome`.
+
+    Desactivado por defecto: con `enabled = False` los hooks (`timed`,
+    `timer`, `observe`, `inc`) solo chequean el flag y siguen de largo.
+    """
+
+    def __init__(self, namespace: str = "iol", buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        self.enabled = False
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> "MetricsRegistry":
+        self.enabled = True
+        return self
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def observe(self, stage: str, seconds: float, **labels: str) -> None:
+        if not self.enabled:
+            return
+        key = (stage, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    @contextmanager
+    def timer(self, stage: str, **labels: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            yield
+        except BaseException as exc:
+            outcome = type(exc).__name__
+            raise
+        finally:
+            self.observe(stage, time.perf_counter() - started, outcome=outcome, **labels)
+
+    def histogram(self, stage: str, **labels: str) -> Optional[Histogram]:
+        with self._lock:
+            return self._histograms.get((stage, tuple(sorted(labels.items()))))
+
+    def counter(self, name: str, **labels: str) -> float:
+        with self._lock:
+            return self._counters.get((name, tuple(sorted(labels.items()))), 0.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            histograms = [
+                {
+                    "stage": stage,
+                    "labels": dict(labels),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "mean": histogram.mean,
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                    "p99": histogram.quantile(0.99),
+                    "buckets": dict(zip([*map(str, histogram.buckets), "+Inf"], histogram.counts)),
+                }
+                for (stage, labels), histogram in sorted(self._histograms.items())
+            ]
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+        return {"histograms": histograms, "counters": counters}
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self) -> str:
+        """Formato de texto de Prometheus (exposition format 0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+        declared = set()
+        for (stage, labels), histogram in histograms:
+            name = f"{self.namespace}_{stage}_seconds"
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for bound, count in zip([*map(repr, histogram.buckets), "+Inf"], histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', bound),))} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum!r}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        for (counter, labels), value in counters:
+            name = f"{self.namespace}_{counter}_total"
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{_format_labels(labels)} {value!r}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+METRICS = MetricsRegistry()
+
+
+def endpoint_label(value: Any) -> str:
+    """Label de endpoint: la clase del Request (también si viene dentro de una Extraction)."""
+    request = getattr(value, "request", value)
+    if isinstance(request, Request):
+        return type(request).__name__
+    return str(value)
+
+
+def timed(
+    stage: str,
+    endpoint: Optional[str] = None,
+    outcome: Optional[Callable[[Any], str]] = None,
+    registry: MetricsRegistry = METRICS,
+) -> Callable[[F], F]:
+    """Registra la latencia de la función (sync o async) en `registry`.
+
+    `endpoint` es el nombre del parámetro del que sale el label (ver
+    `endpoint_label`); sin él se usa el nombre de la función. `outcome` mapea
+    el resultado a un label; si la función lanza, el outcome es el tipo de la
+    excepción.
+    """
+
+    def decorator(func: F) -> F:
+        parameters = list(inspect.signature(func).parameters)
+        position = parameters.index(endpoint) if endpoint else None
+
+        def labels(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+            if position is None:
+                return func.__name__
+            value = kwargs[endpoint] if endpoint in kwargs else args[position]
+            return endpoint_label(value)
+
+        def record(started: float, args: Tuple[Any, ...], kwargs: Dict[str, Any], result_outcome: str) -> None:
+            registry.observe(
+                stage,
+                time.perf_counter() - started,
+                endpoint=labels(args, kwargs),
+                outcome=result_outcome,
+            )
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not registry.enabled:
+                    return await func(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as exc:
+                    record(started, args, kwargs, type(exc).__name__)
+                    raise
+                record(started, args, kwargs, outcome(result) if outcome else "ok")
+                return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not registry.enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as exc:
+                record(started, args, kwargs, type(exc).__name__)
+                raise
+            record(started, args, kwargs, outcome(result) if outcome else "ok")
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,150 @@
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+
+# Cómo combinar varias claves de un FieldSpec:
+# VALUE convierte cada clave y se queda con el primer resultado truthy
+# (`conv(a) or conv(b)`); RAW elige el primer valor crudo truthy y lo convierte
+# una sola vez (`conv(a or b)`).
+VALUE = "value"
+RAW = "raw"
+
+Converter = Callable[[Any], Any]
+Key = Union[str, Tuple[str, Converter]]
+
+
+def optional_float(value: Any) -> Optional[float]:
+    # Camino rápido para lo que ya viene como número desde el JSON.
+    kind = type(value)
+    if kind is float:
+        return value
+    if kind is int:
+        return float(value)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def optional_datetime(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Cómo sale un atributo del payload: claves (en orden de fallback) y conversión.
+
+    Una clave puede ser `(clave, conversor)` para convertirla distinto que el
+    resto (solo con `fallback=VALUE`). `default` es el último operando del `or`.
+    `required` es el mensaje del ValueError si el valor resulta falsy.
+    """
+
+    attribute: str
+    keys: Tuple[Key, ...]
+    converter: Optional[Converter] = None
+    fallback: str = VALUE
+    default: Any = None
+    required: Optional[str] = None
+
+
+def compile_parser(
+    specs: Sequence[FieldSpec],
+    payload_attribute: Optional[str] = None,
+    name: str = "parse",
+    target: Optional[type] = None,
+) -> Callable[..., Any]:
+    """Genera `parse(cls, payload, retain=None)` que arma `cls(...)` en una pasada.
+
+    Cada clave se lee una sola vez con `payload.get`. Si `payload_attribute`
+    está, ese atributo recibe `retain(payload)` (o el payload tal cual si
+    `retain` es None). Con `target` (una dataclass) los argumentos van por
+    posición en el orden de su `__init__`, bastante más barato que por nombre
+    con ~20 campos; `cls` puede ser una subclase que agregue campos al final.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = [f"def {name}(cls, payload, retain=None):", "    get = payload.get"]
+    arguments: List[str] = []
+
+    def ref(value: Any) -> str:
+        symbol = f"_c{len(namespace)}"
+        namespace[symbol] = value
+        return symbol
+
+    # Las claves que usan varios campos se leen una sola vez.
+    uses: Dict[str, int] = {}
+    for spec in specs:
+        for key in spec.keys:
+            key = key[0] if isinstance(key, tuple) else key
+            uses[key] = uses.get(key, 0) + 1
+    shared: Dict[str, str] = {}
+    for key, count in uses.items():
+        if count > 1:
+            shared[key] = f"k{len(shared)}"
+            lines.append(f"    {shared[key]} = get({key!r})")
+
+    def read(key: str) -> str:
+        return shared.get(key) or f"get({key!r})"
+
+    for spec in specs:
+        keys = [key if isinstance(key, tuple) else (key, None) for key in spec.keys]
+        if spec.fallback == RAW:
+            if any(converter is not None for _, converter in keys):
+                raise ValueError(f"{spec.attribute}: per-key converters need fallback=VALUE")
+            operands = [read(key) for key, _ in keys]
+            if spec.default is not None:
+                operands.append(ref(spec.default))
+            expression = " or ".join(operands)
+            if spec.converter is not None:
+                expression = f"{ref(spec.converter)}({expression})"
+        elif spec.fallback == VALUE:
+            operands = []
+            for key, converter in keys:
+                converter = converter or spec.converter
+                operand = read(key)
+                operands.append(f"{ref(converter)}({operand})" if converter is not None else operand)
+            if spec.default is not None:
+                operands.append(ref(spec.default))
+            expression = " or ".join(operands)
+        else:
+            raise ValueError(f"Unknown fallback {spec.fallback}")
+
+        if spec.required is not None:
+            variable = f"v_{spec.attribute}"
+            lines.append(f"    {variable} = {expression}")
+            lines.append(f"    if not {variable}:")
+            lines.append(f"        raise ValueError({spec.required!r})")
+            expression = variable
+        arguments.append(f"{spec.attribute}={expression}")
+
+    if payload_attribute is not None:
+        arguments.append(f"{payload_attribute}=payload if retain is None else retain(payload)")
+
+    if target is not None:
+        if not is_dataclass(target):
+            raise TypeError(f"{target!r} is not a dataclass")
+        by_name = dict(argument.split("=", 1) for argument in arguments)
+        positional: List[str] = []
+        # El prefijo del __init__ que cubren los specs va por posición; el resto, por nombre.
+        for init_field in (f for f in fields(target) if f.init):
+            if init_field.name not in by_name:
+                break
+            positional.append(by_name.pop(init_field.name))
+        arguments = positional + [f"{attribute}={expression}" for attribute, expression in by_name.items()]
+
+    lines.append("    return cls(")
+    lines.extend(f"        {argument}," for argument in arguments)
+    lines.append("    )")
+    exec("\n".join(lines), namespace)
+    parse = namespace[name]
+    parse.__source__ = "\n".join(lines)
+    return parse
@@ -0,0 +1,111 @@
+from collections import OrderedDict
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from typing import Any, Optional
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dependencia opcional
+    zstandard = None
+
+
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+DEFAULT_CODEC = CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return zlib.compress(data, ZLIB_LEVEL)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd payloads")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class PayloadStore:
+    """Blobs JSON comprimidos y direccionados por contenido (blake2b del JSON).
+
+    Un payload idéntico se guarda una sola vez; las filas que lo usan solo
+    guardan el hash. No hace commit: escribe dentro de la transacción del caller.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        codec: str = DEFAULT_CODEC,
+        known_hashes: int = 4096,
+    ) -> None:
+        self._connection = connection
+        self._codec = codec
+        self._known: "OrderedDict[str, None]" = OrderedDict()
+        self._known_limit = known_hashes
+        # `save` del repo sync corre en varios threads a la vez (asyncio.to_thread).
+        self._known_lock = threading.Lock()
+        self._ensure_table()
+
+    def _ensure_table(self) -> None:
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS payloads (
+                hash TEXT PRIMARY KEY,
+                codec TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                data BLOB NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+    def _remember(self, digest: str) -> None:
+        with self._known_lock:
+            self._known[digest] = None
+            self._known.move_to_end(digest)
+            if len(self._known) > self._known_limit:
+                self._known.popitem(last=False)
+
+    def _is_known(self, digest: str) -> bool:
+        with self._known_lock:
+            if digest not in self._known:
+                return False
+            self._known.move_to_end(digest)
+            return True
+
+    def forget(self) -> None:
+        with self._known_lock:
+            self._known.clear()
+
+    def put(self, payload: Any) -> str:
+        data = json.dumps(payload, default=str, ensure_ascii=False).encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if self._is_known(digest):
+            return digest
+
+        exists = self._connection.execute(
+            "SELECT 1 FROM payloads WHERE hash = ?", (digest,)
+        ).fetchone()
+        if exists is None:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO payloads (hash, codec, size, data) VALUES (?, ?, ?, ?)",
+                (digest, self._codec, len(data), _compress(data, self._codec)),
+            )
+        self._remember(digest)
+        return digest
+
+    def get(self, digest: str) -> Optional[Any]:
+        row = self._connection.execute(
+            "SELECT codec, data FROM payloads WHERE hash = ?", (digest,)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(_decompress(row[1], row[0]))
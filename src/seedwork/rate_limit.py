@@ -0,0 +1,153 @@
+import asyncio
+from dataclasses import dataclass, field, replace
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple, Type
+
+from .entities import Request
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """`rate` requests por segundo con ráfagas de hasta `burst`.
+
+    Las clases de Request que comparten `name` comparten bucket (p. ej. auth y
+    refresh sobre el mismo endpoint de token).
+    """
+
+    name: str
+    rate: float
+    burst: float = 1.0
+
+
+@dataclass
+class BucketStats:
+    waiting: int = 0
+    acquired: int = 0
+    delayed: int = 0
+    cancelled: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+@dataclass
+class _Bucket:
+    limit: RateLimit
+    tat: float = 0.0
+    stats: BucketStats = field(default_factory=BucketStats)
+
+    def reserve(self, now: float) -> float:
+        """Reserva el próximo turno (GCRA) y devuelve cuánto hay que esperarlo.
+
+        Los turnos se asignan en orden de llegada, así la espera es FIFO.
+        """
+        interval = 1.0 / self.limit.rate
+        tolerance = interval * (self.limit.burst - 1)
+        tat = max(self.tat, now)
+        delay = max(tat - tolerance - now, 0.0)
+        self.tat = tat + interval
+        return delay
+
+    def cancel(self, reserved_tat: float) -> None:
+        """Devuelve un turno no usado si sigue siendo la última reserva.
+
+        Si alguien reservó después ya quedó encolado detrás; correr `tat`
+        le daría el mismo turno a dos, así que en ese caso se pierde el hueco.
+        """
+        if self.tat == reserved_tat:
+            self.tat -= 1.0 / self.limit.rate
+
+
+BucketKey = Tuple[Optional[str], str]
+
+
+@dataclass
+class RateLimiter:
+    """Token bucket por (identifier, clase de endpoint), compartido entre threads y tasks.
+
+    `limits` mapea clases de Request (respetando herencia) a su RateLimit;
+    las que no figuran usan `default` o no se limitan.
+    """
+
+    limits: Mapping[Type[Request], RateLimit] = field(default_factory=dict)
+    default: Optional[RateLimit] = None
+    _buckets: Dict[BucketKey, _Bucket] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def limit_for(self, request: Request) -> Optional[RateLimit]:
+        for klass in type(request).__mro__:
+            if klass in self.limits:
+                return self.limits[klass]
+        return self.default
+
+    def _reserve(self, request: Request) -> Tuple[Optional[_Bucket], float, float]:
+        limit = self.limit_for(request)
+        if limit is None:
+            return None, 0.0, 0.0
+        with self._lock:
+            key = (request.identifier, limit.name)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(limit)
+            delay = bucket.reserve(time.monotonic())
+            reserved_tat = bucket.tat
+            stats = bucket.stats
+            stats.acquired += 1
+            stats.total_wait += delay
+            stats.max_wait = max(stats.max_wait, delay)
+            if delay > 0:
+                stats.delayed += 1
+                stats.waiting += 1
+        return bucket, delay, reserved_tat
+
+    def _release(self, bucket: _Bucket) -> None:
+        with self._lock:
+            bucket.stats.waiting -= 1
+
+    def _cancel(self, bucket: _Bucket, delay: float, reserved_tat: float) -> None:
+        with self._lock:
+            bucket.cancel(reserved_tat)
+            stats = bucket.stats
+            stats.acquired -= 1
+            stats.delayed -= 1
+            stats.cancelled += 1
+            stats.total_wait -= delay
+
+    def acquire(self, request: Request) -> float:
+        """Bloquea hasta que el request tenga turno; devuelve la espera."""
+        bucket, delay, _ = self._reserve(request)
+        if bucket is not None and delay > 0:
+            try:
+                time.sleep(delay)
+            finally:
+                self._release(bucket)
+        return delay
+
+    async def wait(self, request: Request) -> float:
+        """Como `acquire`, pero cediendo el event loop mientras espera.
+
+        Si la task se cancela (p. ej. por un timeout) antes de su turno, el
+        turno se devuelve para no demorar a los que vienen después.
+        """
+        bucket, delay, reserved_tat = self._reserve(request)
+        if bucket is not None and delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._cancel(bucket, delay, reserved_tat)
+                raise
+            finally:
+                self._release(bucket)
+        return delay
+
+    def stats(self) -> Dict[BucketKey, BucketStats]:
+        with self._lock:
+            return {key: replace(bucket.stats) for key, bucket in self._buckets.items()}
+
+    def queue_depth(self) -> int:
+        with self._lock:
+            return sum(bucket.stats.waiting for bucket in self._buckets.values())
@@ -0,0 +1,374 @@
+"""Reproduce extracciones grabadas con el mismo código que habla con la API.
+
+    replay = Replay(repo, since=datetime(2024, 1, 5, 11), until=datetime(2024, 1, 5, 17))
+    client = IOLClient(service=replay.service(), identifier="TEST")
+    async for at in replay.ticks(url_prefix=".../Cotizaciones/"):
+        chain = await client.fetch_all_options()     # lo grabado a la hora `at`
+
+Cada request se contesta con la última extracción grabada para su URL y
+params con `fetched_at <= clock.now()`. Sin tokens ni red. Los requests que
+se grabaron en modo streaming (`stream_all_options`) solo guardaron el conteo
+de items: no entran al índice (status STREAMED) y las filas viejas que los
+guardaron como SUCCESS se saltean al decodificarlas.
+"""
+import asyncio
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import json
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .entities import Attempt, Extraction, Request
+from .enums import ExtractionStatus
+from .interfaces import AsyncAuthService, AsyncHttpClient, AuthService, ExtractionService, HttpClient
+from .repositories import ExtractionRecord, SQLiteExtractionRepo, Timestamp
+from .value_objects import AccessToken, APIResponse
+
+if TYPE_CHECKING:
+    import httpx
+
+
+DEFAULT_READ_AHEAD = 16
+# Payloads que se guardan además del read-ahead, por si se vuelven a pedir
+# (p. ej. una cotización que no se regrabó entre dos ticks).
+DECODED_CACHE_SIZE = 64
+NOT_RECORDED_STATUS = 404
+
+Key = Tuple[str, str]
+
+
+def _is_streamed_placeholder(content: Any) -> bool:
+    # Filas de antes del status STREAMED: SUCCESS con solo el conteo de items.
+    return isinstance(content, dict) and len(content) == 1 and "streamed_items" in content
+
+
+def _key(url: str, params: Dict[str, Any]) -> Key:
+    return url, json.dumps(params, sort_keys=True, default=str) if params else ""
+
+
+class ReplayClock:
+    """Reloj simulado. Con `speed=None` solo avanza cuando se lo mueve (lo más
+    rápido posible); con `speed=60` corre 60 veces más rápido que el real."""
+
+    def __init__(self, start: datetime, speed: Optional[float] = None) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self._at = start
+        self._anchor = time.monotonic()
+
+    def now(self) -> datetime:
+        if self.speed is None:
+            return self._at
+        return self._at + timedelta(seconds=(time.monotonic() - self._anchor) * self.speed)
+
+    def set(self, at: datetime) -> None:
+        self._at = at
+        self._anchor = time.monotonic()
+
+    def advance(self, seconds: float) -> None:
+        self.set(self.now() + timedelta(seconds=seconds))
+
+    def _pending(self, at: datetime) -> float:
+        """Segundos reales hasta `at` (0 si ya pasó); sin `speed`, salta hasta ahí."""
+        if self.speed is None:
+            if at > self._at:
+                self.set(at)
+            return 0.0
+        return max((at - self.now()).total_seconds() / self.speed, 0.0)
+
+    def sleep_until(self, at: datetime) -> None:
+        time.sleep(self._pending(at))
+
+    async def wait_until(self, at: datetime) -> None:
+        await asyncio.sleep(self._pending(at))
+
+
+class ReplayIndex:
+    """Extracciones de una ventana agrupadas por (url, params) y ordenadas por `fetched_at`.
+
+    Solo se cargan metadatos. Los payloads (SQLite + descompresión + JSON) se
+    decodifican en un thread aparte, `read_ahead` registros por delante del
+    último servido; lo repetido (mismo hash) se decodifica una sola vez.
+    """
+
+    def __init__(
+        self,
+        repo: SQLiteExtractionRepo,
+        since: Optional[Timestamp] = None,
+        until: Optional[Timestamp] = None,
+        url_prefix: Optional[str] = None,
+        only_success: bool = False,
+        max_staleness: Optional[timedelta] = None,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> None:
+        self.max_staleness = max_staleness
+        self.read_ahead = read_ahead
+        status = ExtractionStatus.SUCCESS if only_success else None
+        self.timeline: List[ExtractionRecord] = [
+            record
+            for record in repo.query(since, until, url_prefix=url_prefix, status=status)
+            if record.status != ExtractionStatus.STREAMED
+        ]
+        self._positions = {record.id: position for position, record in enumerate(self.timeline)}
+        self._by_key: Dict[Key, List[ExtractionRecord]] = defaultdict(list)
+        for record in self.timeline:
+            self._by_key[_key(record.url, record.params)].append(record)
+        self._times = {key: [record.fetched_at for record in records] for key, records in self._by_key.items()}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="replay-read-ahead")
+        # Payloads decodificados (o en camino) por hash: lo repetido se decodifica una vez.
+        self._decoded: "OrderedDict[Union[str, int], Future]" = OrderedDict()
+        self._decoded_limit = read_ahead + DECODED_CACHE_SIZE
+        # Última posición ya encolada para read-ahead.
+        self._horizon = -1
+        # Ids de filas viejas cuyo contenido resultó ser solo el conteo de un stream.
+        self._placeholders: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self.timeline)
+
+    @property
+    def start(self) -> Optional[datetime]:
+        return self.timeline[0].fetched_at if self.timeline else None
+
+    @property
+    def end(self) -> Optional[datetime]:
+        return self.timeline[-1].fetched_at if self.timeline else None
+
+    def lookup(self, url: str, params: Dict[str, Any], at: datetime) -> Optional[ExtractionRecord]:
+        key = _key(url, params)
+        times = self._times.get(key)
+        if not times:
+            return None
+        records = self._by_key[key]
+        position = bisect_right(times, at) - 1
+        while position >= 0 and records[position].id in self._placeholders:
+            position -= 1
+        if position < 0:
+            return None
+        record = records[position]
+        if self.max_staleness is not None and at - record.fetched_at > self.max_staleness:
+            return None
+        return record
+
+    def times(self, url: Optional[str] = None, url_prefix: Optional[str] = None) -> List[datetime]:
+        """Instantes (sin repetir, en orden) en que se grabó algo que matchea."""
+        return sorted({
+            record.fetched_at
+            for record in self.timeline
+            if (url is None or record.url == url) and (url_prefix is None or record.url.startswith(url_prefix))
+        })
+
+    def _submit(self, record: ExtractionRecord) -> Future:
+        key = record.response_hash or record.id
+        future = self._decoded.get(key)
+        if future is not None:
+            self._decoded.move_to_end(key)
+            return future
+        future = self._decoded[key] = self._executor.submit(record.content)
+        if len(self._decoded) > self._decoded_limit:
+            self._decoded.popitem(last=False)[1].cancel()
+        return future
+
+    def _future(self, record: ExtractionRecord) -> Future:
+        future = self._submit(record)
+        position = self._positions[record.id]
+        start = max(position, self._horizon) + 1
+        for upcoming in self.timeline[start: position + 1 + self.read_ahead]:
+            self._submit(upcoming)
+        self._horizon = max(self._horizon, position + self.read_ahead)
+        return future
+
+    def content(self, record: ExtractionRecord) -> Any:
+        return self._future(record).result()
+
+    async def acontent(self, record: ExtractionRecord) -> Any:
+        return await asyncio.wrap_future(self._future(record))
+
+    def fetch(self, url: str, params: Dict[str, Any], at: datetime) -> Tuple[Optional[ExtractionRecord], Any]:
+        """(registro, contenido) a servir en `at`; (None, None) si no hay nada grabado."""
+        while True:
+            record = self.lookup(url, params, at)
+            if record is None:
+                return None, None
+            content = self.content(record)
+            if not _is_streamed_placeholder(content):
+                return record, content
+            self._placeholders.add(record.id)
+
+    async def afetch(self, url: str, params: Dict[str, Any], at: datetime) -> Tuple[Optional[ExtractionRecord], Any]:
+        while True:
+            record = self.lookup(url, params, at)
+            if record is None:
+                return None, None
+            content = await self.acontent(record)
+            if not _is_streamed_placeholder(content):
+                return record, content
+            self._placeholders.add(record.id)
+
+    def close(self) -> None:
+        for future in self._decoded.values():
+            future.cancel()
+        self._decoded.clear()
+        self._executor.shutdown(wait=False)
+
+
+def _response(record: Optional[ExtractionRecord], content: Any) -> APIResponse:
+    if record is None:
+        return APIResponse(status_code=NOT_RECORDED_STATUS, content={"message": "No recorded extraction"})
+    status_code = record.status_code or (200 if record.success else 500)
+    return APIResponse(status_code=status_code, content=content)
+
+
+def _extraction(request: Request, record: Optional[ExtractionRecord], content: Any, now: datetime) -> Extraction:
+    response = _response(record, content)
+    return Extraction(
+        request=request,
+        status=ExtractionStatus(record.status) if record is not None else ExtractionStatus.ERROR,
+        attempts=[Attempt(fetched_at=record.fetched_at if record is not None else now, response=response)],
+    )
+
+
+def _httpx_response(response: APIResponse) -> "httpx.Response":
+    import httpx
+
+    return httpx.Response(
+        response.status_code,
+        content=json.dumps(response.content, ensure_ascii=False).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+
+
+@dataclass
+class ReplayExtractionService(ExtractionService):
+    """ExtractionService que contesta desde lo grabado, sin auth ni persistencia."""
+
+    index: ReplayIndex
+    clock: ReplayClock
+
+    async def extract(self, identifier: str, request: Request) -> Extraction:
+        record, content = await self.index.afetch(request.url, request.params, self.clock.now())
+        return _extraction(request.with_identifier(identifier), record, content, self.clock.now())
+
+    async def stream(self, identifier: str, request: Request, key: Optional[str] = None) -> AsyncIterator[Any]:
+        extraction = await self.extract(identifier, request)
+        items = extraction.data.get(key) if key is not None else extraction.data
+        for item in items or []:
+            yield item
+
+
+@dataclass
+class ReplayHttpClient(HttpClient):
+    """HttpClient sobre lo grabado; combinarlo con ReplayAuthService para no pedir tokens."""
+
+    index: ReplayIndex
+    clock: ReplayClock
+    client: Any = None
+
+    def _request(self, request: Request) -> APIResponse:  # type: ignore[override]
+        return _response(*self.index.fetch(request.url, request.params, self.clock.now()))
+
+    def request(self, request: Request) -> List[Attempt]:
+        return [Attempt(fetched_at=self.clock.now(), response=self._request(request))]
+
+    @contextmanager
+    def stream(self, request: Request) -> Iterator["httpx.Response"]:
+        yield _httpx_response(self._request(request))
+
+
+@dataclass
+class AsyncReplayHttpClient(AsyncHttpClient):
+    index: ReplayIndex
+    clock: ReplayClock
+    client: Any = None
+
+    async def _request(self, request: Request) -> APIResponse:  # type: ignore[override]
+        return _response(*await self.index.afetch(request.url, request.params, self.clock.now()))
+
+    async def request(self, request: Request) -> List[Attempt]:
+        return [Attempt(fetched_at=self.clock.now(), response=await self._request(request))]
+
+    @asynccontextmanager
+    async def stream(self, request: Request) -> AsyncIterator["httpx.Response"]:
+        yield _httpx_response(await self._request(request))
+
+
+def _replay_token() -> AccessToken:
+    return AccessToken(life_time=10 ** 9, value="replay", refresh_token="replay", obtained_at=datetime.now())
+
+
+class ReplayAuthService(AuthService[str]):
+    """Token fijo que no vence: en replay no hay a quién pedírselo."""
+
+    def __init__(self) -> None:
+        self.token_provider = None
+        self.token_repo = None
+        self._token = _replay_token()
+
+    def get(self, identifier: str) -> AccessToken:
+        return self._token
+
+
+class AsyncReplayAuthService(AsyncAuthService[str]):
+    def __init__(self) -> None:
+        self.token_provider = None
+        self.token_repo = None
+        self._token = _replay_token()
+
+    async def get(self, identifier: str) -> AccessToken:
+        return self._token
+
+
+class Replay:
+    """Índice + reloj de una ventana de historia, y los componentes que la sirven."""
+
+    def __init__(
+        self,
+        repo: SQLiteExtractionRepo,
+        since: Optional[Timestamp] = None,
+        until: Optional[Timestamp] = None,
+        *,
+        speed: Optional[float] = None,
+        url_prefix: Optional[str] = None,
+        only_success: bool = False,
+        max_staleness: Optional[timedelta] = None,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> None:
+        self.index = ReplayIndex(repo, since, until, url_prefix, only_success, max_staleness, read_ahead)
+        start = datetime.fromisoformat(since) if isinstance(since, str) else since
+        self.clock = ReplayClock(start or self.index.start or datetime.now(), speed)
+
+    def service(self) -> ReplayExtractionService:
+        return ReplayExtractionService(index=self.index, clock=self.clock)
+
+    def http_client(self) -> ReplayHttpClient:
+        return ReplayHttpClient(index=self.index, clock=self.clock)
+
+    def async_http_client(self) -> AsyncReplayHttpClient:
+        return AsyncReplayHttpClient(index=self.index, clock=self.clock)
+
+    async def ticks(self, url: Optional[str] = None, url_prefix: Optional[str] = None) -> AsyncIterator[datetime]:
+        """Mueve el reloj a cada instante grabado (esperando según `speed`) y lo entrega.
+
+        Los instantes que el reloj ya pasó se saltean: con `speed`, si el
+        consumidor se atrasa pierde ticks, como un poller en vivo.
+        """
+        for at in self.index.times(url, url_prefix):
+            if at < self.clock.now():
+                continue
+            await self.clock.wait_until(at)
+            yield at
+
+    def iter_ticks(self, url: Optional[str] = None, url_prefix: Optional[str] = None) -> Iterator[datetime]:
+        for at in self.index.times(url, url_prefix):
+            if at < self.clock.now():
+                continue
+            self.clock.sleep_until(at)
+            yield at
+
+    def close(self) -> None:
+        self.index.close()
@@ -1,18 +1,68 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 import json
+import queue
 import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-from .entities import Attempt, Extraction
+from .entities import Attempt, Extraction, Request
+from .enums import ExtractionStatus, RequestMethod
 from .interfaces import ExtractionRepo
-from .sqlite_db import get_shared_connection
+from .metrics import METRICS, timed
+from .payload_store import PayloadStore
+from .sqlite_db import connect, connection_path, get_shared_connection
+from .value_objects import APIResponse
 
 
 def _serialize(obj: Any) -> str:
     return json.dumps(obj, default=str, ensure_ascii=False)
 
 
+_INSERT_EXTRACTION = """
+    INSERT INTO extractions (
+        identifier,
+        url,
+        method,
+        status,
+        success,
+        retries,
+        fetched_at,
+        created_at,
+        status_code,
+        headers_hash,
+        params,
+        json_body,
+        attempts,
+        response_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Columnas agregadas después de la versión inicial de la tabla.
+_PAYLOAD_COLUMNS = {
+    "status_code": "INTEGER",
+    "headers_hash": "TEXT",
+    "response_hash": "TEXT",
+}
+
+# Cada filtro de `query` va con `fetched_at` al final, así el rango de tiempo
+# y el orden salen del mismo índice.
+_INDEXES = {
+    "idx_extractions_fetched_at": "fetched_at",
+    "idx_extractions_url": "url, fetched_at",
+    "idx_extractions_status": "status, fetched_at",
+    "idx_extractions_identifier": "identifier, fetched_at",
+}
+
+_RECORD_COLUMNS = "id, identifier, url, method, status, success, retries, fetched_at, status_code, response_hash, params"
+_ORDER_BY = {"fetched_at": "fetched_at, id", "id": "id"}
+DEFAULT_QUERY_BATCH_SIZE = 1000
+
+Timestamp = Union[datetime, str]
+
+
 class InMemoryExtractionRepo(ExtractionRepo):
     saved: List[Extraction]
 
@@ -32,6 +82,7 @@ class SQLiteExtractionRepo(ExtractionRepo):
     ) -> None:
         self._connection = connection or get_shared_connection(db_path)
         self._ensure_table()
+        self._payloads = PayloadStore(self._connection)
 
     def _ensure_table(self) -> None:
         self._connection.execute(
@@ -54,61 +105,411 @@ class SQLiteExtractionRepo(ExtractionRepo):
             )
             """
         )
+        existing = {row[1] for row in self._connection.execute("PRAGMA table_info(extractions)")}
+        for column, kind in _PAYLOAD_COLUMNS.items():
+            if column not in existing:
+                self._connection.execute(f"ALTER TABLE extractions ADD COLUMN {column} {kind}")
+        for name, columns in _INDEXES.items():
+            self._connection.execute(f"CREATE INDEX IF NOT EXISTS {name} ON extractions ({columns})")
         self._connection.commit()
 
-    def _serialize_attempts(self, attempts: Sequence[Attempt]) -> str:
+    def _serialize_attempts(self, attempts: Sequence[Attempt], digests: Sequence[str]) -> str:
         serialized = []
-        for attempt in attempts:
+        for attempt, digest in zip(attempts, digests):
             serialized.append(
                 {
                     "fetched_at": attempt.fetched_at.isoformat(),
                     "status_code": attempt.response.status_code,
-                    "content": attempt.response.content,
+                    "payload": digest,
                 }
             )
         return _serialize(serialized)
 
-    def save(self, extraction: Extraction) -> Extraction:
+    def _to_row(self, extraction: Extraction, payloads: Optional[PayloadStore] = None) -> Tuple[Any, ...]:
+        payloads = payloads or self._payloads
         request = extraction.request
         last_attempt = extraction.attempts[-1]
-        response_payload = {
-            "status_code": last_attempt.response.status_code,
-            "content": last_attempt.response.content,
-        }
-
-        self._connection.execute(
-            """
-            INSERT INTO extractions (
-                identifier,
-                url,
-                method,
-                status,
-                success,
-                retries,
-                fetched_at,
-                created_at,
-                headers,
-                params,
-                json_body,
-                attempts,
-                response
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                getattr(request, "identifier", None) or None,
-                request.url,
-                request.method.value,
-                extraction.status.value,
-                1 if extraction.success else 0,
-                extraction.retries,
-                last_attempt.fetched_at.isoformat(),
-                request.created_at.isoformat(),
-                _serialize(request.headers),
-                _serialize(request.params),
-                _serialize(request.json),
-                self._serialize_attempts(extraction.attempts),
-                _serialize(response_payload),
-            ),
+        # La respuesta guardada es el contenido del último intento: mismo blob.
+        digests = [payloads.put(attempt.response.content) for attempt in extraction.attempts]
+        return (
+            getattr(request, "identifier", None) or None,
+            request.url,
+            request.method.value,
+            extraction.status.value,
+            1 if extraction.success else 0,
+            extraction.retries,
+            last_attempt.fetched_at.isoformat(),
+            request.created_at.isoformat(),
+            last_attempt.response.status_code,
+            payloads.put(request.headers),
+            _serialize(request.params),
+            _serialize(request.json),
+            self._serialize_attempts(extraction.attempts, digests),
+            digests[-1],
         )
+
+    @timed("repo_save", endpoint="extraction")
+    def save(self, extraction: Extraction) -> Extraction:
+        self._insert(extraction)
+        return extraction
+
+    def _insert(self, extraction: Extraction) -> None:
+        self._connection.execute(_INSERT_EXTRACTION, self._to_row(extraction))
         self._connection.commit()
+
+    def load_payload(self, digest: str) -> Optional[Any]:
+        return self._payloads.get(digest)
+
+    def decode_response(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """`{"status_code", "content"}` de una fila, tanto nueva (blob) como legacy (JSON)."""
+        if row["response_hash"] is not None:
+            return {
+                "status_code": row["status_code"],
+                "content": self._payloads.get(row["response_hash"]),
+            }
+        return json.loads(row["response"]) if row["response"] else {}
+
+    def decode_attempts(self, row: sqlite3.Row) -> List[Dict[str, Any]]:
+        attempts = json.loads(row["attempts"]) if row["attempts"] else []
+        for attempt in attempts:
+            if "payload" in attempt:
+                attempt["content"] = self._payloads.get(attempt.pop("payload"))
+        return attempts
+
+    def decode_headers(self, row: sqlite3.Row) -> Dict[str, Any]:
+        if row["headers_hash"] is not None:
+            return self._payloads.get(row["headers_hash"]) or {}
+        return json.loads(row["headers"]) if row["headers"] else {}
+
+    def row(self, extraction_id: int) -> Optional[sqlite3.Row]:
+        return self._connection.execute("SELECT * FROM extractions WHERE id = ?", (extraction_id,)).fetchone()
+
+    def query(
+        self,
+        since: Optional[Timestamp] = None,
+        until: Optional[Timestamp] = None,
+        *,
+        url: Optional[str] = None,
+        url_prefix: Optional[str] = None,
+        identifier: Optional[str] = None,
+        status: Optional[Union[ExtractionStatus, str]] = None,
+        after_id: Optional[int] = None,
+        order_by: str = "fetched_at",
+        descending: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+    ) -> Iterator["ExtractionRecord"]:
+        """Extracciones con `since <= fetched_at < until` que cumplen los filtros.
+
+        Devuelve `ExtractionRecord`s de a `batch_size` filas (`fetchmany`), sin
+        leer headers, intentos ni respuestas: eso se decodifica recién al pedirlo.
+        """
+        if order_by not in _ORDER_BY:
+            raise ValueError(f"Unknown order {order_by}")
+        where, params = _where(since, until, url, url_prefix, identifier, status, after_id)
+        direction = " DESC" if descending else ""
+        order = ", ".join(column + direction for column in _ORDER_BY[order_by].split(", "))
+        sql = f"SELECT {_RECORD_COLUMNS} FROM extractions{where} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self._connection.execute(sql, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield ExtractionRecord(
+                        id=row[0],
+                        identifier=row[1],
+                        url=row[2],
+                        method=row[3],
+                        status=row[4],
+                        success=bool(row[5]),
+                        retries=row[6],
+                        fetched_at=datetime.fromisoformat(row[7]),
+                        status_code=row[8],
+                        response_hash=row[9],
+                        params=_decode_params(row[10]),
+                        repo=self,
+                    )
+        finally:
+            cursor.close()
+
+    def count(
+        self,
+        since: Optional[Timestamp] = None,
+        until: Optional[Timestamp] = None,
+        *,
+        url: Optional[str] = None,
+        url_prefix: Optional[str] = None,
+        identifier: Optional[str] = None,
+        status: Optional[Union[ExtractionStatus, str]] = None,
+        after_id: Optional[int] = None,
+    ) -> int:
+        where, params = _where(since, until, url, url_prefix, identifier, status, after_id)
+        return self._connection.execute(f"SELECT COUNT(*) FROM extractions{where}", params).fetchone()[0]
+
+
+def _decode_params(value: Optional[str]) -> Dict[str, Any]:
+    # Casi todos los requests de IOL van sin params: evitamos el json.loads.
+    if not value or value == "{}":
+        return {}
+    return json.loads(value) or {}
+
+
+def _timestamp(value: Timestamp) -> str:
+    # fetched_at se guarda con isoformat(): comparar como texto respeta el orden.
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _where(
+    since: Optional[Timestamp],
+    until: Optional[Timestamp],
+    url: Optional[str],
+    url_prefix: Optional[str],
+    identifier: Optional[str],
+    status: Optional[str],
+    after_id: Optional[int],
+) -> Tuple[str, List[Any]]:
+    clauses: List[str] = []
+    params: List[Any] = []
+    if since is not None:
+        clauses.append("fetched_at >= ?")
+        params.append(_timestamp(since))
+    if until is not None:
+        clauses.append("fetched_at < ?")
+        params.append(_timestamp(until))
+    if url is not None:
+        clauses.append("url = ?")
+        params.append(url)
+    if url_prefix:
+        # Rango en vez de LIKE para que use el índice.
+        clauses.append("url >= ? AND url < ?")
+        params.extend((url_prefix, url_prefix[:-1] + chr(ord(url_prefix[-1]) + 1)))
+    if identifier is not None:
+        clauses.append("identifier = ?")
+        params.append(identifier)
+    if status is not None:
+        clauses.append("status = ?")
+        params.append(str(status))
+    if after_id is not None:
+        clauses.append("id > ?")
+        params.append(after_id)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionRecord:
+    """Metadatos de una fila de `extractions`; los payloads se leen a pedido."""
+
+    id: int
+    identifier: Optional[str]
+    url: str
+    method: str
+    status: str
+    success: bool
+    retries: int
+    fetched_at: datetime
+    status_code: Optional[int]
+    response_hash: Optional[str]
+    params: Dict[str, Any]
+    repo: SQLiteExtractionRepo = field(repr=False, compare=False)
+
+    def _row(self) -> sqlite3.Row:
+        row = self.repo.row(self.id)
+        if row is None:
+            raise LookupError(f"Extraction {self.id} not found")
+        return row
+
+    def content(self) -> Any:
+        """Contenido de la respuesta (último intento)."""
+        if self.response_hash is not None:
+            return self.repo.load_payload(self.response_hash)
+        return self.repo.decode_response(self._row()).get("content")
+
+    def response(self) -> Dict[str, Any]:
+        if self.response_hash is not None:
+            return {"status_code": self.status_code, "content": self.content()}
+        return self.repo.decode_response(self._row())
+
+    def headers(self) -> Dict[str, Any]:
+        return self.repo.decode_headers(self._row())
+
+    def attempts(self) -> List[Dict[str, Any]]:
+        return self.repo.decode_attempts(self._row())
+
+    def to_extraction(self) -> Extraction:
+        """Reconstruye la Extraction guardada (request, headers e intentos)."""
+        row = self._row()
+        request = Request(
+            url=self.url,
+            method=RequestMethod(self.method),
+            headers=self.repo.decode_headers(row),
+            json=json.loads(row["json_body"]) if row["json_body"] else None,
+            params=dict(self.params),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            identifier=self.identifier,
+        )
+        attempts = [
+            Attempt(
+                fetched_at=datetime.fromisoformat(attempt["fetched_at"]),
+                response=APIResponse(status_code=attempt["status_code"], content=attempt.get("content")),
+            )
+            for attempt in self.repo.decode_attempts(row)
+        ]
+        return Extraction(request=request, status=ExtractionStatus(self.status), attempts=attempts)
+
+
+_FLUSH = object()
+_STOP = object()
+
+
+class WriteBehindSQLiteExtractionRepo(SQLiteExtractionRepo):
+    """Encola las extracciones y las persiste en lotes desde un thread escritor.
+
+    `save` solo encola (bloquea únicamente si la cola está llena); el escritor
+    serializa y hace `executemany` en una transacción por lote cuando se junta
+    `batch_size` o pasa `flush_interval` segundos. `flush()` espera a que la
+    cola se vacíe y `close()` además detiene el escritor. Si un lote falla, el
+    primer error se relanza en el próximo `save`, `flush` o `close`;
+    `dropped_rows` cuenta todas las extracciones perdidas.
+
+    El escritor necesita su propia conexión: con una base sin archivo
+    (`:memory:`) no hay forma de abrirla, y en vez de intercalar transacciones
+    con los otros repos sobre la conexión compartida, `save` escribe en el
+    momento como `SQLiteExtractionRepo`.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        connection: Optional[sqlite3.Connection] = None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue: int = 10_000,
+    ) -> None:
+        super().__init__(db_path=db_path, connection=connection)
+        self._batch_size = max(batch_size, 1)
+        self._flush_interval = flush_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._error: Optional[BaseException] = None
+        self.dropped_rows = 0
+        self._closed = False
+        # El escritor usa su propia conexión en WAL, así no comparte
+        # transacción con el resto de los repos.
+        self._writer_path = connection_path(self._connection)
+        self._writer: Optional[threading.Thread] = None
+        if self._writer_path is not None:
+            self._writer = threading.Thread(
+                target=self._run, name="extraction-writer", daemon=True
+            )
+            self._writer.start()
+
+    @timed("repo_save", endpoint="extraction")
+    def save(self, extraction: Extraction) -> Extraction:
+        if self._closed:
+            raise RuntimeError("Repository is closed")
+        if self._writer is None:
+            self._insert(extraction)
+            return extraction
+        # Un lote anterior se perdió: avisarle al caller en vez de seguir encolando.
+        self._raise_writer_error()
+        self._queue.put(extraction)
         return extraction
+
+    def flush(self) -> None:
+        if self._writer is None:
+            return
+        if self._closed:
+            # Ya no hay escritor que drene la cola; close() ya persistió todo.
+            self._raise_writer_error()
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+        self._raise_writer_error()
+
+    def query(self, *args: Any, **kwargs: Any) -> Iterator["ExtractionRecord"]:
+        # Lo que sigue en la cola todavía no está en la tabla.
+        self.flush()
+        return super().query(*args, **kwargs)
+
+    def count(self, *args: Any, **kwargs: Any) -> int:
+        self.flush()
+        return super().count(*args, **kwargs)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is None:
+            return
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._raise_writer_error()
+
+    def _raise_writer_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _open_writer_connection(self) -> sqlite3.Connection:
+        connection = connect(self._writer_path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _write_batch(
+        self,
+        connection: sqlite3.Connection,
+        payloads: PayloadStore,
+        batch: List[Extraction],
+    ) -> None:
+        try:
+            with METRICS.timer("repo_write_batch", endpoint="extractions"), connection:
+                rows = [self._to_row(extraction, payloads) for extraction in batch]
+                connection.executemany(_INSERT_EXTRACTION, rows)
+            METRICS.inc("repo_rows", len(batch), endpoint="extractions")
+        except BaseException as exc:
+            # Los blobs del lote se revirtieron: que no queden como conocidos.
+            payloads.forget()
+            self.dropped_rows += len(batch)
+            # Se reporta el primero: los siguientes suelen ser consecuencia.
+            if self._error is None:
+                self._error = exc
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _run(self) -> None:
+        connection = self._open_writer_connection()
+        payloads = PayloadStore(connection)
+        batch: List[Extraction] = []
+        deadline: Optional[float] = None
+        stopping = False
+
+        while not stopping:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            force = False
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                force = True
+            else:
+                if item is _FLUSH or item is _STOP:
+                    force = True
+                    stopping = item is _STOP
+                    self._queue.task_done()
+                else:
+                    batch.append(item)
+                    if deadline is None:
+                        deadline = time.monotonic() + self._flush_interval
+
+            if batch and (force or len(batch) >= self._batch_size):
+                self._write_batch(connection, payloads, batch)
+                batch = []
+                deadline = None
+
+        connection.close()
@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from typing import FrozenSet, Optional
+
+from .entities import Request
+from .value_objects import APIResponse
+
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Segundos a esperar según un header Retry-After (delta o fecha HTTP)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@dataclass
+class RetryBudget:
+    """Presupuesto global de reintentos compartido por todos los requests.
+
+    Cada request deposita `ratio` tokens y cada reintento consume uno, así los
+    reintentos nunca superan ~`ratio` del tráfico; `min_per_second` garantiza
+    un piso para cuando hay poco tráfico.
+    """
+
+    ratio: float = 0.2
+    min_per_second: float = 1.0
+    max_tokens: float = 20.0
+    _tokens: float = field(default=0.0, init=False, repr=False)
+    _updated: float = field(default_factory=time.monotonic, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._tokens = self.max_tokens
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self._tokens + elapsed * self.min_per_second, self.max_tokens)
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+@dataclass
+class RetryPolicy:
+    """Decide si reintentar y cuánto esperar: backoff exponencial con full jitter.
+
+    `Request.backoff`, si está, reemplaza a `base_delay`. Un Retry-After del
+    servidor tiene prioridad sobre el backoff calculado y se respeta entero: si
+    pide esperar más que `max_delay` no se reintenta y el caller recibe la
+    respuesta (con `retry_after`). Solo se reintentan los status de
+    `retryable_statuses` y errores de red.
+    """
+
+    base_delay: float = 0.25
+    multiplier: float = 2.0
+    max_delay: float = 10.0
+    jitter: bool = True
+    retryable_statuses: FrozenSet[int] = RETRYABLE_STATUSES
+    budget: Optional[RetryBudget] = field(default_factory=RetryBudget)
+
+    def start(self, request: Request) -> None:
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def is_retryable(self, response: Optional[APIResponse]) -> bool:
+        return response is None or response.status_code in self.retryable_statuses
+
+    def should_retry(self, request: Request, number: int, response: Optional[APIResponse]) -> bool:
+        """`number` es el índice (desde 0) del intento que acaba de fallar."""
+        if number + 1 >= request.retries or not self.is_retryable(response):
+            return False
+        if response is not None and response.retry_after is not None and response.retry_after > self.max_delay:
+            return False
+        return self.budget is None or self.budget.withdraw()
+
+    def delay(self, request: Request, number: int, response: Optional[APIResponse]) -> float:
+        retry_after = response.retry_after if response is not None else None
+        if retry_after is not None:
+            return retry_after
+        base = request.backoff if request.backoff is not None else self.base_delay
+        ceiling = min(base * self.multiplier ** number, self.max_delay)
+        return random.uniform(0, ceiling) if self.jitter else ceiling
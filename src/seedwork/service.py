@@ -1,6 +1,9 @@
+import asyncio
 from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
 from .entities import Extraction, Request
-from .interfaces import ExtractionService, Extractor, ExtractionRepo
+from .interfaces import AsyncExtractor, ExtractionService, Extractor, ExtractionRepo
 
 
 @dataclass
@@ -11,4 +14,31 @@ class StandardExtractionService(ExtractionService):
     async def extract(self, identifier: str, request: Request) -> Extraction:
         extraction = self.extractor.auth_extract(identifier, request)
         self.extraction_repo.save(extraction)
-        return extraction
\ No newline at end of file
+        return extraction
+
+    async def stream(self, identifier: str, request: Request, key: Optional[str] = None) -> AsyncIterator[Any]:
+        for item in self.extractor.auth_stream(
+            identifier, request, key=key, on_complete=self.extraction_repo.save
+        ):
+            yield item
+
+
+@dataclass
+class AsyncStandardExtractionService(ExtractionService):
+    """Extrae sin bloquear el event loop; la persistencia corre en un worker thread."""
+    extractor: AsyncExtractor
+    extraction_repo: ExtractionRepo
+
+    async def extract(self, identifier: str, request: Request) -> Extraction:
+        extraction = await self.extractor.auth_extract(identifier, request)
+        await asyncio.to_thread(self.extraction_repo.save, extraction)
+        return extraction
+
+    async def _save(self, extraction: Extraction) -> None:
+        await asyncio.to_thread(self.extraction_repo.save, extraction)
+
+    async def stream(self, identifier: str, request: Request, key: Optional[str] = None) -> AsyncIterator[Any]:
+        async for item in self.extractor.auth_stream(
+            identifier, request, key=key, on_complete=self._save
+        ):
+            yield item
@@ -0,0 +1,172 @@
+from datetime import datetime
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .sqlite_db import get_shared_connection
+
+
+def _serialize(obj: Any) -> str:
+    return json.dumps(obj, default=str, ensure_ascii=False)
+
+
+class SQLiteSnapshotRepo:
+    """Snapshots de colecciones por clave (p. ej. la cadena de opciones por símbolo).
+
+    Cada `stream` guarda un keyframe completo cada `keyframe_interval`
+    snapshots y entre keyframes solo las filas que cambiaron (payload nuevo) o
+    desaparecieron (payload NULL). `at()` reconstruye cualquier instante
+    aplicando los deltas desde el keyframe anterior.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        connection: Optional[sqlite3.Connection] = None,
+        keyframe_interval: int = 100,
+    ) -> None:
+        self._connection = connection or get_shared_connection(db_path)
+        self._keyframe_interval = max(keyframe_interval, 1)
+        # Último estado escrito por stream: {clave: payload serializado}.
+        self._state: Dict[str, Dict[str, str]] = {}
+        self._since_keyframe: Dict[str, int] = {}
+        self._ensure_table()
+
+    def _ensure_table(self) -> None:
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY,
+                stream TEXT NOT NULL,
+                taken_at TEXT NOT NULL,
+                keyframe INTEGER NOT NULL,
+                changes INTEGER NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS snapshot_rows (
+                snapshot_id INTEGER NOT NULL,
+                key TEXT NOT NULL,
+                payload TEXT
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_snapshots_stream_taken_at ON snapshots (stream, taken_at)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_snapshot_rows_snapshot ON snapshot_rows (snapshot_id)"
+        )
+        # history(): las filas de una clave sin recorrer todos los deltas.
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_snapshot_rows_key ON snapshot_rows (key, snapshot_id)"
+        )
+        self._connection.commit()
+
+    def save(
+        self,
+        stream: str,
+        rows: Mapping[str, Any],
+        taken_at: Optional[datetime] = None,
+    ) -> int:
+        """Guarda el estado `rows` ({clave: payload}) y devuelve el id del snapshot."""
+        taken_at = taken_at or datetime.now()
+        current = {key: _serialize(payload) for key, payload in rows.items()}
+        previous = self._state.get(stream)
+        since_keyframe = self._since_keyframe.get(stream, 0)
+        keyframe = previous is None or since_keyframe + 1 >= self._keyframe_interval
+
+        if keyframe:
+            changes: List[Tuple[str, Optional[str]]] = list(current.items())
+        else:
+            changes = [
+                (key, payload) for key, payload in current.items()
+                if previous.get(key) != payload
+            ]
+            changes.extend((key, None) for key in previous if key not in current)
+
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO snapshots (stream, taken_at, keyframe, changes) VALUES (?, ?, ?, ?)",
+                (stream, taken_at.isoformat(), 1 if keyframe else 0, len(changes)),
+            )
+            snapshot_id = cursor.lastrowid
+            self._connection.executemany(
+                "INSERT INTO snapshot_rows (snapshot_id, key, payload) VALUES (?, ?, ?)",
+                ((snapshot_id, key, payload) for key, payload in changes),
+            )
+
+        self._state[stream] = current
+        self._since_keyframe[stream] = 0 if keyframe else since_keyframe + 1
+        return snapshot_id
+
+    def _target(self, stream: str, when: Optional[datetime]) -> Optional[sqlite3.Row]:
+        if when is None:
+            return self._connection.execute(
+                "SELECT id, taken_at FROM snapshots WHERE stream = ? ORDER BY id DESC LIMIT 1",
+                (stream,),
+            ).fetchone()
+        return self._connection.execute(
+            """
+            SELECT id, taken_at FROM snapshots
+            WHERE stream = ? AND taken_at <= ?
+            ORDER BY taken_at DESC, id DESC LIMIT 1
+            """,
+            (stream, when.isoformat()),
+        ).fetchone()
+
+    def at(self, stream: str, when: Optional[datetime] = None) -> Dict[str, Any]:
+        """Estado del stream en `when` (o el último), reconstruido desde su keyframe."""
+        target = self._target(stream, when)
+        if target is None:
+            return {}
+        keyframe = self._connection.execute(
+            """
+            SELECT MAX(id) FROM snapshots
+            WHERE stream = ? AND keyframe = 1 AND id <= ?
+            """,
+            (stream, target[0]),
+        ).fetchone()[0]
+        if keyframe is None:
+            return {}
+
+        state: Dict[str, str] = {}
+        cursor = self._connection.execute(
+            """
+            SELECT r.key, r.payload FROM snapshot_rows r
+            JOIN snapshots s ON s.id = r.snapshot_id
+            WHERE s.stream = ? AND s.id BETWEEN ? AND ?
+            ORDER BY s.id
+            """,
+            (stream, keyframe, target[0]),
+        )
+        for key, payload in cursor:
+            if payload is None:
+                state.pop(key, None)
+            else:
+                state[key] = payload
+        return {key: json.loads(payload) for key, payload in state.items()}
+
+    def history(self, stream: str, key: str) -> Iterator[Tuple[datetime, Optional[Any]]]:
+        """Cambios de una sola clave en el tiempo (None = la clave desapareció).
+
+        Los keyframes repiten filas sin cambios; esas se omiten.
+        """
+        cursor = self._connection.execute(
+            """
+            SELECT s.taken_at, r.payload FROM snapshot_rows r
+            JOIN snapshots s ON s.id = r.snapshot_id
+            WHERE s.stream = ? AND r.key = ?
+            ORDER BY r.snapshot_id
+            """,
+            (stream, key),
+        )
+        last: Optional[str] = None
+        for taken_at, payload in cursor:
+            if payload is not None and payload == last:
+                continue
+            last = payload
+            yield datetime.fromisoformat(taken_at), json.loads(payload) if payload is not None else None
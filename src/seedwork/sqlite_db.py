@@ -6,11 +6,28 @@ from typing import Optional, Union
 _SHARED_CONNECTION: Optional[sqlite3.Connection] = None
 
 
+def resolve_db_path(db_path: Optional[Union[str, Path]] = None) -> Path:
+    path = Path(db_path) if db_path else Path(__file__).resolve().parent.parent / "db.sqlite"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def connect(db_path: Optional[Union[str, Path]] = None) -> sqlite3.Connection:
+    connection = sqlite3.connect(str(resolve_db_path(db_path)), check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    return connection
+
+
+def connection_path(connection: sqlite3.Connection) -> Optional[Path]:
+    """Devuelve el archivo detrás de la conexión, o None si es en memoria."""
+    for row in connection.execute("PRAGMA database_list"):
+        if row[1] == "main":
+            return Path(row[2]) if row[2] else None
+    return None
+
+
 def get_shared_connection(db_path: Optional[Union[str, Path]] = None) -> sqlite3.Connection:
     global _SHARED_CONNECTION
     if _SHARED_CONNECTION is None:
-        path = Path(db_path) if db_path else Path(__file__).resolve().parent.parent / "db.sqlite"
-        path.parent.mkdir(parents=True, exist_ok=True)
-        _SHARED_CONNECTION = sqlite3.connect(str(path), check_same_thread=False)
-        _SHARED_CONNECTION.row_factory = sqlite3.Row
+        _SHARED_CONNECTION = connect(db_path)
     return _SHARED_CONNECTION
@@ -0,0 +1,126 @@
+import codecs
+import json
+import re
+from typing import Any, List, Optional
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+_START = "start"
+_OBJECT = "object"
+_ARRAY = "array"
+_DONE = "done"
+
+
+class JSONArrayStream:
+    """Decodifica de a pedazos los elementos de un array JSON.
+
+    Con `key` el array buscado es el valor de esa clave en el objeto raíz
+    (p. ej. `{"titulos": [...]}`); sin `key` el documento es el array. Solo se
+    retiene en memoria el elemento incompleto que quedó al final del chunk.
+    """
+
+    def __init__(self, key: Optional[str] = None) -> None:
+        self._key = key
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._closed = False
+        self.count = 0
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        self._buffer += self._text.decode(chunk)
+        return self._advance()
+
+    def close(self) -> List[Any]:
+        self._buffer += self._text.decode(b"", final=True)
+        self._closed = True
+        items = self._advance()
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON stream")
+        return items
+
+    def _decode(self, start: int) -> Optional[tuple]:
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, start)
+        except json.JSONDecodeError:
+            return None
+        # Un número pegado al final del buffer puede seguir en el próximo chunk.
+        if isinstance(value, (int, float)) and not self._closed:
+            if end == len(self._buffer) or self._buffer[end] in _NUMBER_CHARS:
+                return None
+        return value, end
+
+    def _skip(self, start: int) -> int:
+        return _WHITESPACE.match(self._buffer, start).end()
+
+    def _advance(self) -> List[Any]:
+        items: List[Any] = []
+        buffer = self._buffer
+
+        while self._state != _DONE:
+            self._pos = self._skip(self._pos)
+            if self._pos >= len(buffer):
+                break
+            char = buffer[self._pos]
+
+            if self._state == _START:
+                expected = "{" if self._key is not None else "["
+                if char != expected:
+                    raise ValueError(f"Expected '{expected}' at start of JSON stream")
+                self._pos += 1
+                self._state = _OBJECT if self._key is not None else _ARRAY
+
+            elif self._state == _OBJECT:
+                if char == ",":
+                    self._pos += 1
+                    continue
+                if char == "}":
+                    self._state = _DONE
+                    break
+                decoded = self._decode(self._pos)
+                if decoded is None:
+                    break
+                key, end = decoded
+                colon = self._skip(end)
+                if colon >= len(buffer):
+                    break
+                if buffer[colon] != ":":
+                    raise ValueError("Malformed JSON object in stream")
+                value_start = self._skip(colon + 1)
+                if value_start >= len(buffer):
+                    break
+                if key == self._key and buffer[value_start] == "[":
+                    self._pos = value_start + 1
+                    self._state = _ARRAY
+                    continue
+                # Otra clave del objeto raíz: se decodifica y se descarta.
+                decoded = self._decode(value_start)
+                if decoded is None:
+                    break
+                self._pos = decoded[1]
+
+            else:
+                if char == ",":
+                    self._pos += 1
+                    continue
+                if char == "]":
+                    self._state = _DONE
+                    break
+                decoded = self._decode(self._pos)
+                if decoded is None:
+                    break
+                item, self._pos = decoded
+                items.append(item)
+
+        self._buffer = buffer[self._pos:]
+        self._pos = 0
+        self.count += len(items)
+        return items
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 @dataclass(frozen=True)
@@ -18,6 +18,9 @@ class AccessToken:
     def is_expired(self) -> bool:
         return datetime.now() >= self.caducity
 
+    def seconds_left(self) -> float:
+        return (self.caducity - datetime.now()).total_seconds()
+
     def as_header(self) -> Dict[str, str]:
         return {"Authorization": f"Bearer {self.value}"}
 
@@ -26,6 +29,9 @@ class AccessToken:
 class APIResponse:
     status_code: int
     content: Dict[str, Any]
+    retry_after: Optional[float] = None
+    # Bytes del body tal como llegó (None si la respuesta no vino de la red).
+    size: Optional[int] = None
 
     @property
     def sucess(self) -> bool:
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from src.seedwork.streaming import JSONArrayStream
+
+
+def _stream(chunks, key=None):
+    stream = JSONArrayStream(key=key)
+    items = []
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    items.extend(stream.close())
+    return stream, items
+
+
+def _split(data, size):
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+
+DOCUMENT = {
+    "meta": {"titulos": [0], "total": 3},
+    "count": 12345,
+    "titulos": [
+        {"simbolo": "GFGC1000", "precio": 1.5e3, "puntas": [{"precioCompra": -0.25}]},
+        {"simbolo": "ÑANDÚ", "descripcion": "opción 🚀", "nested": {"titulos": [9, 9]}},
+        987654321,
+        -0.5e-7,
+        None,
+    ],
+    "after": "ignored",
+}
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+def test_keyed_array_at_every_chunk_size(size):
+    data = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+    stream, items = _stream(_split(data, size), key="titulos")
+    assert items == DOCUMENT["titulos"]
+    assert stream.count == len(DOCUMENT["titulos"])
+    assert stream.done
+
+
+def test_keyed_array_skips_same_key_inside_nested_objects():
+    data = b'{"meta": {"titulos": [0]}, "titulos": [{"x": {"titulos": [9]}}, 2]}'
+    _, items = _stream([data], key="titulos")
+    assert items == [{"x": {"titulos": [9]}}, 2]
+
+
+def test_split_utf8_sequences():
+    data = json.dumps(["ñ", "€", "🚀", "año"], ensure_ascii=False).encode()
+    # Cada chunk de un byte parte las secuencias multibyte.
+    _, items = _stream(_split(data, 1))
+    assert items == ["ñ", "€", "🚀", "año"]
+
+
+def test_numbers_split_at_chunk_boundaries():
+    _, items = _stream([b"[12", b"34, 5", b".5e1", b"0, -", b"7]"])
+    assert items == [1234, 5.5e10, -7]
+
+
+def test_number_at_end_of_buffer_waits_for_more_input():
+    stream = JSONArrayStream()
+    assert stream.feed(b"[1, 22") == [1]
+    assert stream.feed(b"3]") == [223]
+    assert stream.close() == []
+
+
+def test_number_in_root_object_split_at_chunk_boundary():
+    _, items = _stream([b'{"count": 1', b'23, "titulos": [4', b"56]}"], key="titulos")
+    assert items == [456]
+
+
+@pytest.mark.parametrize(
+    "data, key",
+    [
+        (b"[1, 2", None),
+        (b'[{"a": 1', None),
+        (b'{"titulos": [1, 2', "titulos"),
+        (b'{"otro": [1]', "titulos"),
+        (b'["\xc3', None),
+        (b"", None),
+    ],
+)
+def test_truncated_input_raises_on_close(data, key):
+    stream = JSONArrayStream(key=key)
+    stream.feed(data)
+    with pytest.raises(ValueError):
+        stream.close()
+
+
+def test_unexpected_document_start_raises():
+    with pytest.raises(ValueError):
+        JSONArrayStream(key="titulos").feed(b"[1]")
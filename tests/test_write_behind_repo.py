@@ -0,0 +1,119 @@
+from datetime import datetime
+import time
+
+import pytest
+
+from src.seedwork.entities import Attempt, Extraction, Request
+from src.seedwork.enums import ExtractionStatus
+from src.seedwork.repositories import WriteBehindSQLiteExtractionRepo
+from src.seedwork.sqlite_db import connect
+from src.seedwork.value_objects import APIResponse
+
+
+URL = "https://api.invertironline.com/api/v2/estadocuenta"
+
+
+def _extraction(sequence: int) -> Extraction:
+    return Extraction(
+        request=Request.create(URL).with_identifier("TEST"),
+        status=ExtractionStatus.SUCCESS,
+        attempts=[
+            Attempt(
+                fetched_at=datetime.now(),
+                response=APIResponse(status_code=200, content={"seq": sequence}),
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = WriteBehindSQLiteExtractionRepo(connection=connect(tmp_path / "db.sqlite"), batch_size=1)
+    yield repo
+    repo.close()
+
+
+def _fail_on(repo, sequences):
+    to_row = repo._to_row
+
+    def failing(extraction, *args):
+        sequence = extraction.attempts[0].response.content["seq"]
+        if sequence in sequences:
+            raise ValueError(f"bad row {sequence}")
+        return to_row(extraction, *args)
+
+    repo._to_row = failing
+
+
+def test_save_flush_count(repo):
+    for sequence in range(5):
+        repo.save(_extraction(sequence))
+    repo.flush()
+    assert repo.count() == 5
+
+
+def test_query_and_count_see_queued_rows(tmp_path):
+    repo = WriteBehindSQLiteExtractionRepo(
+        connection=connect(tmp_path / "db.sqlite"), batch_size=100, flush_interval=60
+    )
+    for sequence in range(3):
+        repo.save(_extraction(sequence))
+    assert repo.count() == 3
+    assert len(list(repo.query())) == 3
+    repo.close()
+
+
+def test_close_is_idempotent(repo):
+    repo.save(_extraction(0))
+    repo.close()
+    repo.close()
+    repo.flush()
+    assert repo.count() == 1
+    with pytest.raises(RuntimeError):
+        repo.save(_extraction(1))
+
+
+def test_failed_batch_is_raised_once_on_flush(repo):
+    _fail_on(repo, {1})
+    for sequence in range(3):
+        repo.save(_extraction(sequence))
+    with pytest.raises(ValueError, match="bad row 1"):
+        repo.flush()
+    repo.flush()
+    assert repo.dropped_rows == 1
+    assert repo.count() == 2
+
+
+def test_first_error_is_kept(repo):
+    _fail_on(repo, {1, 2})
+    for sequence in range(3):
+        repo.save(_extraction(sequence))
+    with pytest.raises(ValueError, match="bad row 1"):
+        repo.flush()
+    assert repo.dropped_rows == 2
+
+
+def test_failed_batch_is_raised_on_next_save(repo):
+    _fail_on(repo, {0})
+    repo.save(_extraction(0))
+    deadline = time.monotonic() + 5
+    while repo.dropped_rows == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    with pytest.raises(ValueError, match="bad row 0"):
+        repo.save(_extraction(1))
+
+
+def test_failed_batch_is_raised_on_close(repo):
+    _fail_on(repo, {0})
+    repo.save(_extraction(0))
+    with pytest.raises(ValueError, match="bad row 0"):
+        repo.close()
+
+
+def test_in_memory_connection_writes_synchronously():
+    repo = WriteBehindSQLiteExtractionRepo(connection=connect(":memory:"))
+    repo.save(_extraction(0))
+    assert repo._writer is None
+    assert repo.count() == 1
+    repo.close()
+    repo.close()